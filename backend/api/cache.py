@@ -0,0 +1,204 @@
+"""
+스레드 안전한 LRU + TTL 캐시
+항목 수/바이트 상한을 넘으면 가장 오래 쓰지 않은 항목부터 O(1)로 제거하고,
+같은 키에 대한 동시 미스는 한 번의 로드로 합칩니다(single-flight).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class _CacheEntry:
+    """캐시 항목 (값, 저장 시각, 만료 시각, 추정 크기)"""
+
+    __slots__ = ('value', 'stored_at', 'expires_at', 'size')
+
+    def __init__(self, value, ttl, size):
+        self.value = value
+        self.stored_at = time.monotonic()
+        self.expires_at = self.stored_at + ttl
+        self.size = size
+
+
+class _Flight:
+    """진행 중인 로드 (대기하는 스레드들이 결과를 공유)"""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class BoundedTTLCache:
+    """항목 수/바이트 상한이 있는 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries=512, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            max_entries (int): 최대 항목 수
+            max_bytes (int): 최대 추정 바이트 수
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_load(self, key, loader, ttl, size_of=None, accept=None):
+        """
+        캐시에서 값을 찾고, 없거나 만료됐으면 loader로 가져옵니다.
+        같은 키를 동시에 요청한 스레드들은 한 번의 loader 호출 결과를 함께 받습니다.
+
+        Args:
+            key: 캐시 키
+            loader (callable): loader(stale) 형태의 함수
+                               stale은 만료됐거나 accept를 통과하지 못한 기존 값 (없으면 None)
+            ttl (float): 유지 시간 (초)
+            size_of (callable): 값의 추정 바이트 수를 반환하는 함수 (선택)
+            accept (callable): 캐시된 값을 이번 요청에 쓸 수 있는지 판단하는 함수 (선택)
+
+        Returns:
+            tuple: (값, 캐시 나이(초), 캐시 적중 여부)
+        """
+        stale = None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                now = time.monotonic()
+                usable = accept is None or accept(entry.value)
+                if usable and now < entry.expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return entry.value, now - entry.stored_at, True
+                if usable:
+                    self.expirations += 1
+                # 새 값으로 교체될 때까지 기존 값은 남겨 두고 loader에 넘김
+                stale = entry.value
+
+            flight = self._inflight.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = _Flight()
+                self._inflight[key] = flight
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, 0, False
+
+        value = None
+        try:
+            value = loader(stale)
+            flight.value = value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                # 빈 결과(요청 실패)는 캐시하지 않음
+                if flight.error is None and value:
+                    size = size_of(value) if size_of else 0
+                    self._store(key, _CacheEntry(value, ttl, size))
+            flight.event.set()
+
+        return value, 0, False
+
+    def peek(self, key, accept=None, include_expired=False):
+        """
+        로드 없이 유효한 값만 조회합니다. (없으면 None, 미스로 세지 않음)
+
+        Args:
+            include_expired (bool): True면 만료된 값도 반환 (새로 가져올 수 없을 때의 대체용, 적중으로 세지 않음)
+
+        Returns:
+            tuple: (값, 캐시 나이(초)) 또는 None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            if accept is not None and not accept(entry.value):
+                return None
+            if now >= entry.expires_at:
+                if not include_expired:
+                    return None
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+            return entry.value, now - entry.stored_at
+
+    def touch(self, key, ttl, accept=None):
+        """
+        캐시된 값의 유지 시간을 지금부터 ttl초로 다시 정합니다. (만료된 값도 포함, 통계에 세지 않음)
+        값을 바깥에서 최신으로 갱신했을 때(스트림 등) 사용합니다.
+
+        Args:
+            key: 캐시 키
+            ttl (float): 새 유지 시간 (초)
+            accept (callable): 연장해도 되는 값인지 판단하는 함수 (선택)
+
+        Returns:
+            연장한 값 (없거나 accept를 통과하지 못하면 None)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (accept is not None and not accept(entry.value)):
+                return None
+            entry.stored_at = time.monotonic()
+            entry.expires_at = entry.stored_at + ttl
+            return entry.value
+
+    def _store(self, key, entry):
+        """항목을 저장하고 상한을 넘으면 LRU 순서로 제거 (락을 잡은 상태에서 호출)"""
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = entry
+        self._bytes += entry.size
+
+        while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+            _, evicted = self._data.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """캐시 통계를 딕셔너리로 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
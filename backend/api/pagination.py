@@ -0,0 +1,66 @@
+"""
+키셋(keyset) 페이지네이션 커서
+(정렬 값, id) 쌍을 URL에 안전한 문자열로 바꿔서 주고받습니다.
+OFFSET 없이 "이 커서보다 이전/이후"만 조회하므로 깊은 페이지도 인덱스 범위 스캔으로 끝납니다.
+"""
+import base64
+from datetime import datetime, timedelta, timezone
+
+KST = timezone(timedelta(hours=9))
+
+
+def encode_cursor(value, row_id):
+    """
+    커서 문자열을 만듭니다.
+
+    Args:
+        value: 정렬 기준 값 (datetime 또는 숫자)
+        row_id (int): 같은 값일 때 순서를 정하는 id
+
+    Returns:
+        str: URL-safe 커서
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=KST)
+        raw = f"t{value.isoformat()}|{row_id}"
+    else:
+        raw = f"n{value!r}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    커서 문자열을 (값, id)로 되돌립니다.
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        kind, rest = raw[0], raw[1:]
+        value, row_id = rest.rsplit('|', 1)
+        if kind == 't':
+            return datetime.fromisoformat(value).astimezone(KST), int(row_id)
+        return float(value), int(row_id)
+    except Exception:
+        raise ValueError(f"잘못된 커서: {cursor}")
+
+
+def parse_time(value):
+    """
+    쿼리 파라미터의 시각(ISO 8601 또는 epoch ms)을 KST datetime으로 변환합니다.
+    시간대가 없으면 KST로 간주합니다.
+
+    Raises:
+        ValueError: 형식 오류
+    """
+    if value is None or value == '':
+        return None
+    if value.isdigit():
+        return datetime.fromtimestamp(int(value) / 1000, tz=KST)
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=KST)
+    return dt.astimezone(KST)
@@ -0,0 +1,190 @@
+"""
+실시간 시세 푸시 (Server-Sent Events)
+티커 스냅샷이 갱신될 때마다 이전 스냅샷과 비교해서 바뀐 심볼만 한 번 JSON으로 만들고,
+구독 중인 클라이언트에게 그 조각만 나눠 줍니다.
+서버 비용은 클라이언트 수 × 폴링 주기가 아니라 시세 변경량에 비례합니다.
+
+- 구독 필터: 클라이언트마다 받을 심볼 집합 (없으면 전체)
+- 백프레셔: 클라이언트별 대기 중인 변경분은 심볼당 최신 값 하나만 남김(덮어쓰기)
+  → 느린 클라이언트도 메모리는 심볼 수만큼만 쓰고, 다음에 보낼 때 최신 값만 받음
+  → max_lag초 동안 한 번도 가져가지 못한 클라이언트는 구독을 끊음
+
+이벤트 형식:
+    event: snapshot  data: {"version": n, "data": [구독한 심볼 전체]}   (연결 직후 한 번)
+    event: prices    data: {"version": n, "data": [바뀐 심볼만]}
+"""
+import json
+import threading
+import time
+
+
+class Subscriber:
+    """SSE 클라이언트 하나의 구독 상태"""
+
+    def __init__(self, symbols):
+        self.symbols = symbols      # 받을 심볼 frozenset (None이면 전체)
+        self.pending = {}           # {심볼: 직렬화된 티커} - 같은 심볼은 최신 값으로 덮어씀
+        self.version = 0
+        self.closed = False
+        self.coalesced = 0          # 보내기 전에 덮어쓴 변경분 수
+        self.pending_since = None   # 대기열이 비어 있지 않게 된 시각 (monotonic)
+        self.event = threading.Event()
+        self._lock = threading.Lock()
+
+    def offer(self, changed, version):
+        """바뀐 심볼 중 구독한 것만 대기열에 넣습니다."""
+        if self.symbols is None:
+            items = changed
+        else:
+            items = {s: changed[s] for s in self.symbols if s in changed}
+        if not items:
+            return
+        with self._lock:
+            if not self.pending:
+                self.pending_since = time.monotonic()
+            self.coalesced += len(self.pending.keys() & items.keys())
+            self.pending.update(items)
+            self.version = version
+        self.event.set()
+
+    def drain(self):
+        """대기 중인 변경분을 모두 꺼냅니다. (버전, 직렬화된 티커 리스트)"""
+        with self._lock:
+            self.event.clear()
+            items, self.pending = list(self.pending.values()), {}
+            self.pending_since = None
+            return self.version, items
+
+
+class PriceBroadcaster:
+    """티커 스냅샷 변경분을 SSE 구독자에게 나눠 주는 클래스"""
+
+    def __init__(self, max_clients=16, heartbeat=15.0, max_lag=60.0):
+        """
+        Args:
+            max_clients (int): 동시에 연결할 수 있는 클라이언트 수 (연결마다 서버 스레드 하나를 씀)
+            heartbeat (float): 변경분이 없을 때 연결 유지용 주석을 보내는 간격 (초)
+            max_lag (float): 이 시간(초) 동안 변경분을 가져가지 못한 클라이언트는 구독 해제
+        """
+        self.max_clients = max_clients
+        self.heartbeat = heartbeat
+        self.max_lag = max_lag
+
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._values = {}       # {심볼: 비교용 값} - 마지막으로 보낸 스냅샷 기준
+        self._latest = None     # 마지막 스냅샷
+
+        # 통계
+        self.published = 0
+        self.changed_symbols = 0
+        self.rejected = 0
+        self.kicked = 0
+
+    def publish(self, snapshot):
+        """
+        스냅샷 리스너 - 바뀐 심볼만 직렬화해서 구독자에게 전달합니다.
+
+        Args:
+            snapshot (TickerSnapshot): 새 스냅샷
+        """
+        with self._lock:
+            if self._latest is not None and snapshot.version <= self._latest.version:
+                return
+            values, changed = {}, {}
+            previous = self._values
+            for ticker in snapshot.data:
+                symbol = ticker["symbol"]
+                value = (ticker["current_price"], ticker["volume"], ticker["price_change_percent"])
+                values[symbol] = value
+                if previous.get(symbol) != value:
+                    changed[symbol] = json.dumps(ticker, ensure_ascii=False)
+            self._values = values
+            self._latest = snapshot
+            self.published += 1
+            self.changed_symbols += len(changed)
+
+            now = time.monotonic()
+            for subscriber in list(self._subscribers):
+                since = subscriber.pending_since
+                if since is not None and now - since > self.max_lag:
+                    self._kick(subscriber)
+                elif changed:
+                    subscriber.offer(changed, snapshot.version)
+
+    def subscribe(self, symbols=None):
+        """
+        구독을 등록합니다.
+
+        Args:
+            symbols (iterable): 받을 심볼 (None이면 전체)
+
+        Returns:
+            Subscriber: 구독 (클라이언트 수 상한에 걸리면 None)
+        """
+        subscriber = Subscriber(frozenset(symbols) if symbols else None)
+        with self._lock:
+            if len(self._subscribers) >= self.max_clients:
+                self.rejected += 1
+                return None
+            self._subscribers.add(subscriber)
+
+            # 등록과 같은 락 안에서 현재 스냅샷을 첫 이벤트로 넣어 두므로 사이의 변경분을 놓치지 않음
+            latest = self._latest
+            if latest is not None:
+                subscriber.offer(
+                    {t["symbol"]: json.dumps(t, ensure_ascii=False) for t in latest.data},
+                    latest.version
+                )
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+        subscriber.closed = True
+        subscriber.event.set()
+
+    def _kick(self, subscriber):
+        """너무 느린 구독자 정리 (락을 잡은 상태에서 호출)"""
+        self._subscribers.discard(subscriber)
+        subscriber.closed = True
+        subscriber.event.set()
+        self.kicked += 1
+        print(f"⚠️ 느린 시세 구독자 연결 해제 (대기 {len(subscriber.pending)}개)")
+
+    def stream(self, subscriber):
+        """
+        SSE 응답 본문 제너레이터 (클라이언트가 끊으면 finally에서 구독 해제)
+
+        Args:
+            subscriber (Subscriber): subscribe()로 받은 구독
+        """
+        try:
+            yield "retry: 3000\n\n"
+            event = "snapshot"
+            while not subscriber.closed:
+                if not subscriber.event.wait(self.heartbeat):
+                    yield ": ping\n\n"
+                    continue
+                version, items = subscriber.drain()
+                if not items:
+                    continue
+                yield f'id: {version}\nevent: {event}\ndata: {{"version": {version}, "data": [{", ".join(items)}]}}\n\n'
+                event = "prices"
+        finally:
+            self.unsubscribe(subscriber)
+
+    def stats(self):
+        """구독/전송 통계 (모니터링용)"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            return {
+                'clients': len(subscribers),
+                'max_clients': self.max_clients,
+                'published': self.published,
+                'changed_symbols': self.changed_symbols,
+                'coalesced': sum(s.coalesced for s in subscribers),
+                'rejected': self.rejected,
+                'kicked': self.kicked,
+                'version': self._latest.version if self._latest is not None else 0
+            }
@@ -0,0 +1,167 @@
+"""
+티커 검색/정렬 인덱스
+티커 스냅샷마다 정렬 키별로 미리 정렬된 배열과 심볼 접두사 트라이를 만들어 두고,
+정렬·검색·등락률 범위 필터를 O(log n + k)로 처리합니다.
+"""
+import threading
+from bisect import bisect_left, bisect_right
+
+# 쿼리 파라미터 sort 값 → 티커 필드
+SORT_KEYS = {
+    'volume': 'volume',
+    'change': 'price_change_percent',
+    'price': 'current_price'
+}
+
+
+class SymbolTrie:
+    """심볼 접두사 검색용 트라이 (각 노드가 하위 심볼의 위치 목록을 보관)"""
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, symbol, position):
+        node = self.root
+        for ch in symbol:
+            node = node.setdefault(ch, {})
+            node.setdefault('$', []).append(position)
+
+    def search(self, prefix):
+        """
+        접두사로 시작하는 심볼의 위치 목록을 반환합니다.
+
+        Args:
+            prefix (str): 대문자 심볼 접두사
+
+        Returns:
+            list: 티커 위치(인덱스) 리스트
+        """
+        node = self.root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node.get('$', [])
+
+
+class TickerIndex:
+    """한 스냅샷에 대한 정렬 배열 + 트라이 인덱스"""
+
+    def __init__(self, snapshot):
+        self.version = snapshot.version
+        self.tickers = snapshot.data
+
+        # 정렬 키별 오름차순 위치 배열
+        self.sorted_positions = {}
+        for key, field in SORT_KEYS.items():
+            self.sorted_positions[key] = sorted(
+                range(len(self.tickers)), key=lambda i, f=field: self.tickers[i][f]
+            )
+
+        # 등락률 범위 검색을 위한 정렬된 값 배열
+        self.change_values = [
+            self.tickers[i]['price_change_percent'] for i in self.sorted_positions['change']
+        ]
+
+        self.trie = SymbolTrie()
+        for position, ticker in enumerate(self.tickers):
+            self.trie.insert(ticker['symbol'], position)
+
+    def _change_range(self, min_change, max_change):
+        """등락률 범위에 드는 위치 목록 (등락률 오름차순)"""
+        lo = 0 if min_change is None else bisect_left(self.change_values, min_change)
+        hi = len(self.change_values) if max_change is None else bisect_right(self.change_values, max_change)
+        return self.sorted_positions['change'][lo:hi]
+
+    def query(self, sort=None, order='desc', q=None, min_change=None, max_change=None, offset=0, limit=50):
+        """
+        조건에 맞는 티커를 정렬해서 요청한 구간만 반환합니다.
+
+        Args:
+            sort (str): 정렬 키 (volume, change, price) - None이면 스냅샷 순서
+            order (str): asc 또는 desc
+            q (str): 심볼 접두사 검색어
+            min_change (float): 최소 등락률 (%)
+            max_change (float): 최대 등락률 (%)
+            offset (int): 건너뛸 개수
+            limit (int): 반환할 개수
+
+        Returns:
+            tuple: (티커 딕셔너리 리스트, 조건에 맞는 전체 개수)
+        """
+        has_range = min_change is not None or max_change is not None
+        reverse = order == 'desc'
+
+        if q:
+            positions = self.trie.search(q.upper())
+            if has_range:
+                low = float('-inf') if min_change is None else min_change
+                high = float('inf') if max_change is None else max_change
+                positions = [
+                    i for i in positions
+                    if low <= self.tickers[i]['price_change_percent'] <= high
+                ]
+            ordered_by = None
+        elif has_range:
+            positions = self._change_range(min_change, max_change)
+            ordered_by = 'change'
+        elif sort:
+            # 필터가 없으면 미리 정렬된 배열을 그대로 사용
+            positions = self.sorted_positions[sort]
+            ordered_by = sort
+        else:
+            total = len(self.tickers)
+            return list(self.tickers[offset:offset + limit]), total
+
+        if not sort:
+            # 정렬 키가 없으면 스냅샷 순서 유지 (트라이 결과는 이미 위치 순서)
+            if ordered_by:
+                positions = sorted(positions)
+            reverse = False
+        elif sort != ordered_by:
+            field = SORT_KEYS[sort]
+            positions = sorted(positions, key=lambda i: self.tickers[i][field])
+
+        return self._page(positions, offset, limit, reverse), len(positions)
+
+    def _page(self, positions, offset, limit, reverse):
+        """오름차순 위치 배열에서 페이지 구간만 꺼냄 (내림차순이면 뒤에서부터)"""
+        total = len(positions)
+        if reverse:
+            end = max(total - offset, 0)
+            start = max(end - limit, 0)
+            page = positions[start:end][::-1]
+        else:
+            page = positions[offset:offset + limit]
+        return [self.tickers[i] for i in page]
+
+
+class TickerIndexer:
+    """스냅샷이 갱신될 때마다 인덱스를 다시 만드는 클래스"""
+
+    def __init__(self):
+        self._index = None
+        self._lock = threading.Lock()
+
+    def build(self, snapshot):
+        """스냅샷 리스너로 등록해서 사용 (이미 같거나 더 새 버전의 인덱스가 있으면 무시)"""
+        self._ensure(snapshot)
+
+    def get(self, snapshot):
+        """
+        스냅샷에 맞는 인덱스를 반환합니다.
+        저장된 인덱스가 같거나 더 새 버전이면 그대로 쓰고,
+        리스너가 아직 돌지 않았다면 한 요청만 만들어서 저장합니다. (나머지 요청은 락에서 기다렸다가 재사용)
+        """
+        return self._ensure(snapshot)
+
+    def _ensure(self, snapshot):
+        index = self._index
+        if index is not None and index.version >= snapshot.version:
+            return index
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 먼저 만들었을 수 있음
+            index = self._index
+            if index is None or index.version < snapshot.version:
+                index = self._index = TickerIndex(snapshot)
+            return index
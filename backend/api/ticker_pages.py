@@ -0,0 +1,140 @@
+"""
+사전 직렬화된 티커 페이지 캐시
+티커 스냅샷이 갱신될 때 자주 쓰이는 페이지를 한 번만 JSON으로 만들어 두고
+(gzip/brotli 압축본과 ETag 포함), 요청은 딕셔너리 조회 + 바이트 전송만 하도록 합니다.
+"""
+import gzip
+import hashlib
+import json
+import threading
+from datetime import datetime
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def build_price_page(snapshot, page, limit, data=None, total=None):
+    """
+    /api/current-prices 응답 본문을 만듭니다.
+    (사전 계산 경로와 일반 경로가 같은 형식을 쓰도록 공유)
+
+    Args:
+        snapshot (TickerSnapshot): 티커 스냅샷
+        page (int): 페이지 번호 (1부터 시작)
+        limit (int): 페이지당 개수
+        data (list): 이미 잘라 둔 페이지 데이터 (검색/정렬 결과, 선택)
+        total (int): data를 줄 때 조건에 맞는 전체 개수
+
+    Returns:
+        dict: 응답 본문
+    """
+    if data is None:
+        all_coins = snapshot.data
+        total = len(all_coins)
+
+        # 페이지 슬라이싱
+        start = (page - 1) * limit
+        end = start + limit
+        data = all_coins[start:end]
+
+    return {
+        'success': True,
+        'data': data,
+        'page': page,
+        'limit': limit,
+        'total': total,
+        'total_pages': (total + limit - 1) // limit,
+        'version': snapshot.version,
+        'timestamp': (snapshot.fetched_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+class PreparedPage:
+    """
+    직렬화가 끝난 한 페이지 (원본/압축본 바이트와 ETag)
+    인코딩마다 바이트가 다르므로 강한 ETag도 인코딩별로 다르게 붙입니다. (etag_for)
+    """
+
+    def __init__(self, raw, etag):
+        self.raw = raw
+        self.etag = etag
+        self.gzip = gzip.compress(raw, compresslevel=6)
+        self.br = brotli.compress(raw, quality=5) if brotli else None
+
+    def encoded(self, accept_encodings):
+        """
+        클라이언트의 Accept-Encoding에 맞는 본문을 고릅니다.
+
+        Args:
+            accept_encodings: werkzeug의 request.accept_encodings
+
+        Returns:
+            tuple: (본문 바이트, Content-Encoding 또는 None)
+        """
+        if self.br is not None and accept_encodings['br']:
+            return self.br, 'br'
+        if accept_encodings['gzip']:
+            return self.gzip, 'gzip'
+        return self.raw, None
+
+    def etag_for(self, encoding):
+        """
+        인코딩별 ETag (같은 내용이라도 gzip/br/원본은 서로 다른 값)
+
+        Args:
+            encoding (str): 'br', 'gzip' 또는 None(원본)
+        """
+        return f"{self.etag}-{encoding}" if encoding else self.etag
+
+
+class TickerPageCache:
+    """스냅샷마다 페이지를 미리 직렬화해 두는 캐시"""
+
+    def __init__(self, page_sizes=(20, 50, 1000)):
+        """
+        Args:
+            page_sizes (iterable): 미리 만들어 둘 페이지 크기(limit) 목록
+        """
+        self.page_sizes = tuple(page_sizes)
+        self._pages = {}
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def build(self, snapshot):
+        """
+        스냅샷의 모든 페이지를 직렬화합니다. (스냅샷 리스너로 등록해서 사용)
+
+        Args:
+            snapshot (TickerSnapshot): 새 티커 스냅샷
+        """
+        # 이미 더 새 버전을 들고 있으면 무시 (늦게 도착한 이전 스냅샷이 덮어쓰지 않게)
+        if snapshot.version <= self.version:
+            return
+        pages = {}
+        total = len(snapshot.data)
+
+        for limit in self.page_sizes:
+            total_pages = max((total + limit - 1) // limit, 1)
+            for page in range(1, total_pages + 1):
+                body = build_price_page(snapshot, page, limit)
+                raw = json.dumps(body, separators=(',', ':')).encode('utf-8')
+                etag = hashlib.blake2b(raw, digest_size=8).hexdigest()
+                pages[(page, limit)] = PreparedPage(raw, etag)
+
+        # 딕셔너리 참조 교체는 원자적이므로 읽는 쪽은 락이 필요 없음
+        with self._lock:
+            if snapshot.version <= self.version:
+                return
+            self._pages = pages
+            self.version = snapshot.version
+
+    def get(self, page, limit):
+        """
+        미리 만들어 둔 페이지를 조회합니다.
+
+        Returns:
+            PreparedPage: 없으면 None (일반 경로로 처리)
+        """
+        return self._pages.get((page, limit))
@@ -1,11 +1,22 @@
 """
 Flask REST API 서버 (React Frontend용)
 """
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
-from collectors.binance_api import BinanceCollector
+from collectors.binance_api import BinanceCollector, INTERVAL_SECONDS
+from collectors.binance_async import HedgedTickerSource
 from collectors.news_scraper import NewsScraper
-from database.models import Database
+from collectors.ticker_snapshot import TickerSnapshotService
+from collectors.candle_store import CandleStore
+from collectors.binance_stream import BinanceStream
+from collectors.rate_limit import RateLimited
+from api.ticker_pages import TickerPageCache, build_price_page
+from api.ticker_index import TickerIndexer, SORT_KEYS
+from api.cache import BoundedTTLCache
+from api.pagination import encode_cursor, decode_cursor, parse_time
+from api.price_stream import PriceBroadcaster
+from database.models import Database, RESOLUTIONS
+from database.stats import StatsEngine
 from datetime import datetime, timedelta , timezone
 from config import Config
 import requests
@@ -17,17 +28,71 @@ CORS(app)  # React와 통신을 위한 CORS 설정
 
 # 전역 변수
 db = Database(Config.DATABASE_URL)
-collector = BinanceCollector()
-news_scraper = NewsScraper()
+stats_engine = StatsEngine(db)
+collector = BinanceCollector(weight_limit=Config.BINANCE_WEIGHT_LIMIT)
+news_scraper = NewsScraper(
+    timeout=Config.NEWS_FETCH_TIMEOUT,
+    host_interval=Config.NEWS_HOST_INTERVAL,
+    state_store=db  # 피드별 ETag/Last-Modified를 DB에 보관
+)
 KST = timezone(timedelta(hours=9))
 
-# 캔들스틱 데이터 캐시 (메모리)
-# 구조: {f"{symbol}_{interval}": {"data": [...], "timestamp": datetime}}
-klines_cache = {}
-CACHE_DURATION = timedelta(minutes=1)  # 1분 동안 캐시 유지
+# 캔들스틱 데이터 캐시 (메모리, LRU + 간격별 TTL + 동시 미스 합치기)
+klines_cache = BoundedTTLCache(
+    max_entries=Config.KLINES_CACHE_MAX_ENTRIES,
+    max_bytes=Config.KLINES_CACHE_MAX_BYTES
+)
+
+# (심볼, 간격)별 캔들 링 버퍼 - 가장 긴 구간만 보관하고 짧은 limit은 잘라서 응답
+# 1m/1h 버퍼는 1000개를 받아 두고 5m/15m/4h/1d 등은 가능하면 집계로 응답
+candle_store = CandleStore(collector, klines_cache)
 
 # 모니터링할 코인 리스트
 COIN_SYMBOLS = collector.get_all_symbols()
+
+# 티커 스냅샷 (백그라운드에서 갱신, 모든 요청이 공유)
+# ASYNC_TICKER_REFRESH면 헤지 요청을 하는 비동기 클라이언트로 가져옴 (요청 가중치 예산은 collector와 같이 씀)
+ticker_source = None
+if Config.ASYNC_TICKER_REFRESH:
+    try:
+        ticker_source = HedgedTickerSource(governor=collector.governor)
+        atexit.register(ticker_source.close)
+    except ImportError as e:
+        print(f"⚠️ 비동기 티커 갱신을 쓸 수 없어 동기 수집기로 갱신: {e}")
+ticker_service = TickerSnapshotService(ticker_source or collector, COIN_SYMBOLS)
+
+# DB에 저장할 스냅샷의 최대 나이 (초) - 갱신 주기의 두 배보다 오래되면 갱신이 실패한 것으로 봄
+PRICE_SAVE_MAX_AGE = Config.TICKER_REFRESH_SECONDS * 2
+
+# 사전 직렬화 페이지 캐시 (스냅샷이 갱신될 때마다 다시 만듦)
+page_cache = TickerPageCache(Config.PRECOMPUTED_PAGE_SIZES)
+if Config.PRECOMPUTED_PAGES:
+    ticker_service.add_listener(page_cache.build)
+
+# 정렬/검색/필터용 인덱스 (스냅샷마다 다시 만듦)
+ticker_indexer = TickerIndexer()
+ticker_service.add_listener(ticker_indexer.build)
+
+# 실시간 시세 스트림 (티커 스냅샷 + 자주 보는 코인의 캔들 버퍼를 변경분으로 갱신)
+price_stream = BinanceStream(
+    ticker_service, candle_store,
+    kline_symbols=Config.STREAM_KLINE_SYMBOLS,
+    kline_intervals=Config.STREAM_KLINE_INTERVALS
+)
+
+# 클라이언트 푸시 (SSE) - 스냅샷마다 바뀐 심볼만 구독자에게 전달
+price_broadcaster = PriceBroadcaster(
+    max_clients=Config.SSE_MAX_CLIENTS,
+    heartbeat=Config.SSE_HEARTBEAT_SECONDS
+)
+ticker_service.add_listener(price_broadcaster.publish)
+
+@app.teardown_appcontext
+def remove_db_session(exception=None):
+    """요청이 끝나면 해당 스레드의 DB 세션을 정리"""
+    db.remove_session()
+
+
 @app.route('/api/health')
 def health_check():
     """API 서버 상태 확인"""
@@ -52,49 +117,167 @@ def get_fear_greed():
 def get_current_prices():
     """
     현재 코인 시세를 반환하는 API
+
+    Query params:
+        page (int): 페이지 번호 - 기본값: 1
+        limit (int): 페이지당 개수 - 기본값: 50
+        sort (str): 정렬 키 (volume, change, price) - 선택
+        order (str): 정렬 방향 (asc, desc) - 기본값: desc
+        q (str): 심볼 접두사 검색어 (예: ETH) - 선택
+        min_change, max_change (float): 24시간 등락률(%) 범위 - 선택
+
     Returns:
         JSON: 코인 시세 리스트
         /api/current-prices?page=1&limit=50
+        /api/current-prices?sort=change&order=desc&q=ETH&min_change=-5
     """
     try:
         page = int(request.args.get('page', 1))
         limit = int(request.args.get('limit', 50))
+        sort = request.args.get('sort')
+        order = request.args.get('order', 'desc')
+        q = request.args.get('q', '').strip()
+        min_change = request.args.get('min_change', type=float)
+        max_change = request.args.get('max_change', type=float)
+
+        if sort and sort not in SORT_KEYS:
+            return jsonify({'success': False, 'error': f'지원하지 않는 정렬 키: {sort}'}), 400
+
+        snapshot = ticker_service.get()
+
+        # 정렬/검색/필터가 있으면 인덱스에서 필요한 구간만 꺼냄
+        if sort or q or min_change is not None or max_change is not None:
+            index = ticker_indexer.get(snapshot)
+            data, total = index.query(
+                sort=sort, order=order, q=q,
+                min_change=min_change, max_change=max_change,
+                offset=(page - 1) * limit, limit=limit
+            )
+            return jsonify(build_price_page(snapshot, page, limit, data=data, total=total))
+
+        # 미리 직렬화된 페이지가 있으면 바이트를 그대로 전송
+        if Config.PRECOMPUTED_PAGES and page_cache.version == snapshot.version:
+            prepared = page_cache.get(page, limit)
+            if prepared:
+                return _send_prepared_page(prepared)
+
+        return jsonify(build_price_page(snapshot, page, limit))
 
-        all_coins = collector.get_multiple_tickers(COIN_SYMBOLS)
-        total = len(all_coins)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-        # 페이지 슬라이싱
-        start = (page - 1) * limit
-        end = start + limit
-        sliced = all_coins[start:end]
 
-        return jsonify({
-            'success': True,
-            'data': sliced,
-            'page': page,
-            'limit': limit,
-            'total': total,
-            'total_pages': (total + limit - 1) // limit,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
+def _send_prepared_page(prepared):
+    """사전 직렬화된 페이지를 조건부 요청(If-None-Match)과 압축을 고려해 전송"""
+    body, encoding = prepared.encoded(request.accept_encodings)
+    # 인코딩마다 바이트가 다르므로 ETag도 인코딩별로 구분 (캐시가 다른 인코딩 본문을 재사용하지 않도록)
+    etag = prepared.etag_for(encoding)
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
 
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+@app.route('/api/stream/prices')
+def stream_prices():
+    """
+    실시간 시세 푸시 API (Server-Sent Events)
+    연결 직후 구독한 심볼 전체(snapshot 이벤트)를 보내고, 이후에는 바뀐 심볼만(prices 이벤트) 보냄
+
+    Query params:
+        symbols (str): 받을 심볼 (쉼표 구분, 예: BTC,ETHUSDT) - 없으면 전체
+
+    Returns:
+        text/event-stream (동시 연결 수 상한을 넘으면 503 → 클라이언트는 폴링으로 대체)
+    """
+    symbols = []
+    for symbol in request.args.get('symbols', '').split(','):
+        symbol = symbol.strip().upper()
+        if symbol:
+            symbols.append(symbol if symbol.endswith('USDT') else f"{symbol}USDT")
+
+    # 아직 스냅샷이 없으면 먼저 한 번 가져옴 (리스너로 broadcaster에도 전달됨)
+    ticker_service.get()
+
+    subscriber = price_broadcaster.subscribe(symbols)
+    if subscriber is None:
+        return jsonify({'success': False, 'error': '동시 연결 수 초과 - 폴링을 사용하세요'}), 503
+
+    response = Response(price_broadcaster.stream(subscriber), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 끄기
+    return response
+
+
+@app.route('/api/stream/stats')
+def get_stream_stats():
+    """실시간 시세 푸시 구독/전송 통계를 반환하는 API"""
+    return jsonify({
+        'success': True,
+        'data': price_broadcaster.stats()
+    })
 
 
 @app.route('/api/history/<symbol>')
 def get_price_history(symbol):
     """
     특정 코인의 과거 시세 데이터를 반환하는 API
+    키셋 페이지네이션을 지원합니다.
 
     Args:
         symbol (str): 코인 심볼
 
+    Query Parameters:
+        limit (int): 조회할 개수 (기본값: 100, 최대 1000)
+        before (str): 이 커서보다 오래된 데이터 (응답의 prev_cursor)
+        after (str): 이 커서보다 새로운 데이터 (응답의 next_cursor)
+        start (str): 시작 시각 (ISO 8601 또는 epoch ms, 포함)
+        end (str): 끝 시각 (ISO 8601 또는 epoch ms, 미포함)
+        resolution (str): 구간 크기 (1h, 1d) - 지정하면 구간별 OHLC/평균을 반환
+                          (이전 구간은 end=첫 구간 timestamp로 조회)
+                          지정하지 않아도 start/end가 원본 보존 기간보다 오래되면
+                          롤업 구간으로 대신 반환 (응답의 resolution으로 구분)
+
     Returns:
-        JSON: 시세 히스토리
+        JSON: 시세 히스토리 (오래된 것부터)
     """
     try:
-        prices = db.get_recent_prices(symbol.upper(), limit=100)
+        limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+        resolution = request.args.get('resolution')
+        if resolution and resolution not in RESOLUTIONS:
+            return jsonify({'success': False, 'error': f'지원하지 않는 resolution: {resolution}'}), 400
+        try:
+            before = decode_cursor(request.args['before']) if request.args.get('before') else None
+            after = decode_cursor(request.args['after']) if request.args.get('after') else None
+            start = parse_time(request.args.get('start'))
+            end = parse_time(request.args.get('end'))
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        if not resolution:
+            # 원본 보존 기간이 지난 구간은 원본이 없으므로 롤업으로 대신
+            resolution = db.pick_resolution(start, end)
+
+        if resolution:
+            buckets = db.get_price_buckets(symbol.upper(), resolution, limit=limit, start=start, end=end)
+            return jsonify({
+                'success': True,
+                'symbol': symbol.upper(),
+                'resolution': resolution,
+                'data': buckets,
+                'limit': limit,
+                'has_more': len(buckets) == limit
+            })
+
+        prices = db.get_recent_prices(
+            symbol.upper(), limit=limit, before=before, after=after, start=start, end=end
+        )
 
         # 시간순으로 정렬 (오래된 것부터)
         prices.reverse()
@@ -109,7 +292,13 @@ def get_price_history(symbol):
         return jsonify({
             'success': True,
             'symbol': symbol.upper(),
-            'data': history
+            'data': history,
+            'limit': limit,
+            # 더 오래된 페이지: ?before=prev_cursor / 이후 새 데이터: ?after=next_cursor
+            'prev_cursor': encode_cursor(prices[0].timestamp, prices[0].id) if prices else None,
+            # 새 데이터가 없으면 받은 after 커서를 그대로 돌려줘서 계속 폴링할 수 있게 함
+            'next_cursor': encode_cursor(prices[-1].timestamp, prices[-1].id) if prices else request.args.get('after'),
+            'has_more': len(prices) == limit
         })
     except Exception as e:
         return jsonify({
@@ -125,12 +314,14 @@ def save_current_data():
     (테스트 및 수동 저장용)
     """
     try:
-        coins = collector.get_multiple_tickers(COIN_SYMBOLS)
-        saved_count = 0
+        snapshot = ticker_service.fresh(PRICE_SAVE_MAX_AGE)
+        if snapshot is None:
+            return jsonify({
+                'success': False,
+                'error': '최신 시세를 가져오지 못해 저장하지 않았습니다'
+            }), 503
 
-        for coin in coins:
-            if db.add_coin_price(coin):
-                saved_count += 1
+        saved_count = db.add_coin_prices(snapshot.data)
 
         return jsonify({
             'success': True,
@@ -146,18 +337,11 @@ def save_current_data():
 
 @app.route('/api/stats')
 def get_stats():
-    """전체 통계 정보를 반환하는 API"""
+    """전체 통계 정보를 반환하는 API (GROUP BY 집계 + 저장 시 증분 갱신)"""
     try:
-        symbols = db.get_all_symbols()
-        total_records = sum([len(db.get_recent_prices(s, limit=1000)) for s in symbols])
-
         return jsonify({
             'success': True,
-            'data': {
-                'total_symbols': len(symbols),
-                'symbols': symbols,
-                'total_records': total_records
-            }
+            'data': stats_engine.get()
         })
     except Exception as e:
         return jsonify({
@@ -178,6 +362,11 @@ def get_klines(symbol):
     Query params:
         interval (str): 시간 간격 (1m, 5m, 15m, 1h, 4h, 1d) - 기본값: 1h
         limit (int): 캔들 개수 - 기본값: 24
+        format (str): 응답 형식 - 기본값: json
+                      json     - 캔들 객체 배열 [{"time", "open", ...}, ...]
+                      columnar - 필드별 병렬 배열 {"time": [...], "open": [...], ...}
+                      binary   - application/octet-stream (리틀 엔디언)
+                                 [uint32 개수][int64 time × n][float64 open, high, low, close, volume 각 × n]
 
     Returns:
         JSON: 캔들스틱 데이터
@@ -185,6 +374,10 @@ def get_klines(symbol):
     try:
         interval = request.args.get('interval', '1h')
         limit = int(request.args.get('limit', 24))
+        fmt = request.args.get('format', 'json')
+
+        if fmt not in ('json', 'columnar', 'binary'):
+            return jsonify({'success': False, 'error': f'지원하지 않는 형식: {fmt}'}), 400
 
         # 심볼이 USDT로 끝나지 않으면 자동으로 추가
         if not symbol.upper().endswith('USDT'):
@@ -192,47 +385,38 @@ def get_klines(symbol):
         else:
             symbol = symbol.upper()
 
-        # 캐시 키 생성
-        cache_key = f"{symbol}_{interval}_{limit}"
-        current_time = datetime.now()
-
-        # 캐시 확인
-        if cache_key in klines_cache:
-            cached_item = klines_cache[cache_key]
-            cache_age = current_time - cached_item['timestamp']
-
-            # 캐시가 유효한 경우
-            if cache_age < CACHE_DURATION:
-                print(f"✅ 캐시 사용: {cache_key} (나이: {cache_age.seconds}초)")
-                return jsonify({
-                    'success': True,
-                    'symbol': symbol,
-                    'interval': interval,
-                    'data': cached_item['data'],
-                    'cached': True,
-                    'cache_age_seconds': cache_age.seconds
-                })
-
-        # 캐시 미스 또는 만료 - Binance API 호출
-        print(f"🔄 Binance API 호출: {cache_key}")
-        klines = collector.get_klines(symbol, interval, limit)
-
-        # 캐시에 저장
-        klines_cache[cache_key] = {
-            'data': klines,
-            'timestamp': current_time
-        }
+        # (심볼, 간격)별 버퍼에서 잘라서 응답 (만료 시 마지막 캔들 이후만 가져옴)
+        klines, cache_age, cached, stale = candle_store.get(symbol, interval, limit, ttl=_klines_ttl(interval))
 
-        # 오래된 캐시 정리 (메모리 절약)
-        _cleanup_old_cache()
+        if fmt == 'binary':
+            response = Response(klines.to_bytes(), mimetype='application/octet-stream')
+            response.headers['X-Symbol'] = symbol
+            response.headers['X-Interval'] = interval
+            response.headers['X-Cached'] = 'true' if cached else 'false'
+            if stale:
+                response.headers['X-Stale'] = 'true'
+            return response
 
-        return jsonify({
+        response = {
             'success': True,
             'symbol': symbol,
             'interval': interval,
-            'data': klines,
-            'cached': False
-        })
+            'format': fmt,
+            'data': klines.to_columns() if fmt == 'columnar' else klines.to_dicts(),
+            'cached': cached
+        }
+        if cached:
+            response['cache_age_seconds'] = int(cache_age)
+        if stale:
+            # 요청 가중치 부족으로 만료된 캔들을 대신 보냄
+            response['stale'] = True
+        return jsonify(response)
+    except RateLimited as e:
+        # 요청 가중치 예산 부족 + 캐시된 캔들도 없음 → 잠시 후 다시 요청하도록 안내
+        retry_after = int(e.retry_after or 1) + 1
+        response = jsonify({'success': False, 'error': str(e), 'retry_after': retry_after})
+        response.headers['Retry-After'] = str(retry_after)
+        return response, 503
     except Exception as e:
         return jsonify({
             'success': False,
@@ -240,20 +424,45 @@ def get_klines(symbol):
         }), 500
 
 
-def _cleanup_old_cache():
-    """오래된 캐시 항목 삭제 (메모리 관리)"""
-    current_time = datetime.now()
-    keys_to_delete = []
+def _klines_ttl(interval):
+    """
+    캔들 간격에 맞춘 캐시 유지 시간 (초)
+    마지막 캔들은 계속 바뀌므로 캔들 길이의 1/60로 두고 10초~5분 범위로 제한
+    """
+    candle_seconds = INTERVAL_SECONDS.get(interval, 3600)
+    return min(max(candle_seconds / 60, 10), 300)
+
+
+@app.route('/api/cache-stats')
+def get_cache_stats():
+    """캔들스틱 캐시 통계 (적중/미스/제거 횟수 등)를 반환하는 API"""
+    return jsonify({
+        'success': True,
+        'data': {
+            'klines': klines_cache.stats(),
+            'klines_aggregated': candle_store.aggregated
+        }
+    })
 
-    for key, value in klines_cache.items():
-        if current_time - value['timestamp'] > CACHE_DURATION * 2:
-            keys_to_delete.append(key)
 
-    for key in keys_to_delete:
-        del klines_cache[key]
+@app.route('/api/upstream-stats')
+def get_upstream_stats():
+    """Binance 미러별 상태 (응답 시간, 오류율, 서킷 브레이커)와 요청 가중치 예산을 반환하는 API"""
+    return jsonify({
+        'success': True,
+        'data': {
+            'current_mirror': collector.health.best(),
+            'mirrors': collector.health.snapshot(),
+            'request_weight': collector.governor.snapshot(),
+            'stream': price_stream.stats(),
+            'hedged_tickers': ticker_source.stats() if ticker_source else None,
+            'snapshot_listeners': {
+                'notified': ticker_service.notified,
+                'coalesced': ticker_service.coalesced
+            }
+        }
+    })
 
-    if keys_to_delete:
-        print(f"🗑️ 오래된 캐시 {len(keys_to_delete)}개 삭제")
 
 @app.route('/api/refresh_price/<symbol>')
 def refresh_price(symbol):
@@ -272,6 +481,19 @@ def refresh_price(symbol):
         "data": data
     })
 
+def _news_to_dict(news):
+    """News 객체를 API 응답용 딕셔너리로 변환"""
+    return {
+        'id': news.id,
+        'title': news.title,
+        'url': news.url,
+        'source': news.source,
+        'published_at': news.published_at.isoformat() if news.published_at else None,
+        'related_coins': news.related_coins.split(',') if news.related_coins else [],
+        'timestamp': news.timestamp.isoformat()
+    }
+
+
 @app.route('/api/news')
 def get_news():
     """
@@ -292,20 +514,63 @@ def get_news():
         news_list = db.get_recent_news(limit=limit, source=source)
 
         # 딕셔너리로 변환
-        news_data = [{
-            'id': news.id,
-            'title': news.title,
-            'url': news.url,
-            'source': news.source,
-            'published_at': news.published_at.isoformat() if news.published_at else None,
-            'related_coins': news.related_coins.split(',') if news.related_coins else [],
-            'timestamp': news.timestamp.isoformat()
-        } for news in news_list]
+        news_data = [_news_to_dict(news) for news in news_list]
+
+        return jsonify({
+            'success': True,
+            'data': news_data,
+            'count': len(news_data),
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/news/search')
+def search_news():
+    """
+    뉴스 제목 전문 검색 API
+
+    Query params:
+        q (str): 검색어 (필수, 여러 단어는 모두 포함하는 뉴스만)
+        limit (int): 조회할 뉴스 개수 - 기본값: 20, 최대 100
+        cursor (str): 이전 응답의 next_cursor (다음 페이지)
+
+    Returns:
+        JSON: 관련도 순 뉴스 리스트
+    """
+    try:
+        q = request.args.get('q', '').strip()
+        if not q:
+            return jsonify({'success': False, 'error': '검색어(q)가 필요합니다'}), 400
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+        try:
+            cursor = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        results = db.search_news(q, limit=limit, cursor=cursor)
+
+        news_data = []
+        for news, score in results:
+            item = _news_to_dict(news)
+            item['score'] = score
+            news_data.append(item)
+
+        next_cursor = None
+        if len(results) == limit:
+            last_news, last_score = results[-1]
+            next_cursor = encode_cursor(last_score, last_news.id)
 
         return jsonify({
             'success': True,
+            'query': q,
             'data': news_data,
             'count': len(news_data),
+            'next_cursor': next_cursor,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
     except Exception as e:
@@ -336,15 +601,7 @@ def get_news_by_coin(coin_symbol):
         news_list = db.get_news_by_coin(coin_symbol.upper(), limit=limit)
 
         # 딕셔너리로 변환
-        news_data = [{
-            'id': news.id,
-            'title': news.title,
-            'url': news.url,
-            'source': news.source,
-            'published_at': news.published_at.isoformat() if news.published_at else None,
-            'related_coins': news.related_coins.split(',') if news.related_coins else [],
-            'timestamp': news.timestamp.isoformat()
-        } for news in news_list]
+        news_data = [_news_to_dict(news) for news in news_list]
 
         return jsonify({
             'success': True,
@@ -376,64 +633,69 @@ def scrape_news():
         limit_per_source = int(request.args.get('limit', 10))
 
         # 뉴스 크롤링
-        news_list = news_scraper.scrape_all_sources(limit_per_source=limit_per_source)
-
-        saved_count = 0
-        skipped_count = 0
+        news_list, feed_states = news_scraper.scrape_all_sources(
+            limit_per_source=limit_per_source, concurrent=Config.NEWS_CONCURRENT_FETCH
+        )
 
-        # 데이터베이스에 저장
-        for news in news_list:
-            # 관련 코인 추출
-            related_coins = news_scraper.extract_coin_mentions(news['title'])
-            news['related_coins'] = ','.join(related_coins) if related_coins else None
-
-            # 🔥 published_at이 None이면 현재시간으로 채움
-            published_at = news.get('published_at')
-            if not published_at:
-                published_at = datetime.now(KST)
-            news['published_at'] = published_at
-
-            if db.add_news(news):
-                saved_count += 1
-            else:
-                skipped_count += 1  # 이미 존재하는 뉴스
+        # 데이터베이스에 일괄 저장 (중복 URL은 제외)
+        saved_count, skipped_count = _save_news_list(news_list, feed_states)
 
         return jsonify({
             'success': True,
             'message': f'{saved_count}개 뉴스 저장 완료 ({skipped_count}개 중복 제외)',
             'saved_count': saved_count,
             'skipped_count': skipped_count,
-            'total_scraped': len(news_list)
+            'total_scraped': len(news_list),
+            'timings': news_scraper.last_timings
         })
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
-        
+
+
+def _save_news_list(news_list, feed_states):
+    """
+    크롤링한 뉴스에 관련 코인/발행 시간을 채우고 한 번에 저장합니다.
+    저장에 성공했을 때만 피드 검증자(ETag/Last-Modified)를 반영합니다.
+    (실패했는데 반영하면 다음 수집이 304를 받아 그 뉴스를 다시 가져오지 못함)
+
+    Args:
+        news_list (list): scrape_all_sources가 돌려준 뉴스
+        feed_states (dict): scrape_all_sources가 함께 돌려준 피드 상태
+
+    Returns:
+        tuple: (저장된 개수, 중복으로 건너뛴 개수)
+
+    Raises:
+        RuntimeError: 저장 실패 (피드 검증자는 반영하지 않음)
+    """
+    for news in news_list:
+        # 관련 코인 추출
+        related_coins = news_scraper.extract_coin_mentions(news['title'])
+        news['related_coins'] = ','.join(related_coins) if related_coins else None
+
+        # published_at이 없으면 현재시간으로 채움
+        if not news.get('published_at'):
+            news['published_at'] = datetime.now(KST)
+
+    result = db.add_news_many(news_list)
+    if result is None:
+        raise RuntimeError("뉴스 저장 실패 - 피드 검증자를 반영하지 않고 다음 수집에서 다시 받음")
+
+    news_scraper.save_feed_states(feed_states)
+    return result
+
+
 @app.route('/api/refresh_news')
 def refresh_news():
     try:
         # 1) 뉴스 전체 크롤링
-        news_list = news_scraper.scrape_all_sources(limit_per_source=10)
-
-        saved = 0
-        skipped = 0
+        news_list, feed_states = news_scraper.scrape_all_sources(limit_per_source=10, concurrent=Config.NEWS_CONCURRENT_FETCH)
 
-        # 2) Supabase에 저장
-        for news in news_list:
-            # 관련 코인 추출
-            related_coins = news_scraper.extract_coin_mentions(news['title'])
-            news['related_coins'] = ','.join(related_coins) if related_coins else None
-
-            # published_at이 없으면 현재시간 넣기
-            if not news.get('published_at'):
-                news['published_at'] = datetime.now()
-
-            if db.add_news(news):
-                saved += 1
-            else:
-                skipped += 1  # 이미 존재하는 뉴스
+        # 2) Supabase에 일괄 저장
+        saved, skipped = _save_news_list(news_list, feed_states)
 
         return jsonify({
             "success": True,
@@ -459,24 +721,16 @@ def auto_collect_news():
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 뉴스 수집 시작")
         print("=" * 60)
 
-        news_list = news_scraper.scrape_all_sources(limit_per_source=10)
-        saved_count = 0
-        skipped_count = 0
-
-        for news in news_list:
-            related_coins = news_scraper.extract_coin_mentions(news['title'])
-            news['related_coins'] = ','.join(related_coins) if related_coins else None
-
-            if db.add_news(news):
-                saved_count += 1
-            else:
-                skipped_count += 1
+        news_list, feed_states = news_scraper.scrape_all_sources(limit_per_source=10, concurrent=Config.NEWS_CONCURRENT_FETCH)
+        saved_count, skipped_count = _save_news_list(news_list, feed_states)
 
         print(f"✅ 뉴스 수집 완료: {saved_count}개 저장, {skipped_count}개 중복 제외")
         print("=" * 60 + "\n")
 
     except Exception as e:
         print(f"❌ 자동 뉴스 수집 오류: {e}")
+    finally:
+        db.remove_session()
 
 
 def auto_save_prices():
@@ -486,22 +740,79 @@ def auto_save_prices():
     try:
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 가격 저장 시작")
 
-        coins = collector.get_multiple_tickers(COIN_SYMBOLS)
-        saved_count = 0
+        # 갱신이 실패해 남아 있는 이전 스냅샷을 지금 시각으로 저장하면 히스토리/롤업이 오염되므로 건너뜀
+        snapshot = ticker_service.fresh(PRICE_SAVE_MAX_AGE)
+        if snapshot is None:
+            print("⚠️ 최신 시세가 없어 가격 저장을 건너뜀")
+            return
 
-        for coin in coins:
-            if db.add_coin_price(coin):
-                saved_count += 1
+        saved_count = db.add_coin_prices(snapshot.data)
 
         print(f"✅ 가격 데이터 저장 완료: {saved_count}개 코인")
 
     except Exception as e:
         print(f"❌ 자동 가격 저장 오류: {e}")
+    finally:
+        db.remove_session()
+
+
+def compact_prices():
+    """
+    백그라운드에서 시세를 시간별/일별 롤업으로 압축하고 오래된 원본을 정리하는 함수
+    """
+    try:
+        result = db.compact_prices(
+            raw_retention_days=Config.RAW_RETENTION_DAYS,
+            hourly_retention_days=Config.HOURLY_RETENTION_DAYS
+        )
+        if result is None:
+            return
+        if result['pruned_raw_rows'] or result['pruned_hourly_rows']:
+            stats_engine.invalidate()
+        print(f"🗜️ 시세 압축 완료: 시간별 {result['hourly_buckets']}개, 일별 {result['daily_buckets']}개 구간, "
+              f"원본 {result['pruned_raw_rows']}행 정리")
+    except Exception as e:
+        print(f"❌ 시세 압축 오류: {e}")
+    finally:
+        db.remove_session()
+
+
+def maintain_price_partitions():
+    """
+    백그라운드에서 다음 달 이후의 coin_prices 파티션을 미리 만드는 함수 (PostgreSQL 파티션 모드)
+    """
+    try:
+        db.ensure_price_partitions(Config.PG_PARTITION_MONTHS_AHEAD)
+    except Exception as e:
+        print(f"❌ 파티션 생성 오류: {e}")
+
+
+def refresh_ticker_snapshot():
+    """
+    백그라운드에서 티커 스냅샷을 갱신하는 함수
+    실시간 스트림이 메시지를 받고 있으면 건너뜀 (스트림이 멈추면 다시 REST로 갱신)
+    """
+    if price_stream.is_fresh():
+        return
+    try:
+        ticker_service.refresh()
+    except Exception as e:
+        print(f"❌ 티커 스냅샷 갱신 오류: {e}")
 
 
 # 스케줄러 설정
 scheduler = BackgroundScheduler()
 
+# 티커 스냅샷 갱신: TICKER_REFRESH_SECONDS마다 실행
+scheduler.add_job(
+    func=refresh_ticker_snapshot,
+    trigger="interval",
+    seconds=Config.TICKER_REFRESH_SECONDS,
+    id='ticker_refresher',
+    name='티커 스냅샷 갱신',
+    replace_existing=True
+)
+
 # 뉴스 수집: 30분마다 실행
 scheduler.add_job(
     func=auto_collect_news,
@@ -522,12 +833,37 @@ scheduler.add_job(
     replace_existing=True
 )
 
+# 시세 압축/보존 정리: PRICE_COMPACTION_MINUTES마다 실행
+scheduler.add_job(
+    func=compact_prices,
+    trigger="interval",
+    minutes=Config.PRICE_COMPACTION_MINUTES,
+    id='price_compactor',
+    name='시세 압축',
+    replace_existing=True
+)
+
+# 월별 파티션 미리 생성: 하루마다 실행 (파티션 모드일 때만)
+if db.partitioned:
+    scheduler.add_job(
+        func=maintain_price_partitions,
+        trigger="interval",
+        days=1,
+        id='partition_maintainer',
+        name='시세 파티션 생성',
+        replace_existing=True
+    )
+
 # 서버 시작 시 스케줄러 시작
 scheduler.start()
 
 # 서버 종료 시 스케줄러 정리
 atexit.register(lambda: scheduler.shutdown())
 
+# 실시간 시세 스트림 시작
+if Config.BINANCE_STREAM_ENABLED and price_stream.start():
+    atexit.register(price_stream.stop)
+
 
 if __name__ == '__main__':
     print("=" * 60)
@@ -537,8 +873,12 @@ if __name__ == '__main__':
     print("API 주소: http://localhost:5000")
     print("CORS: 활성화 (React 통신 가능)")
     print("\n백그라운드 작업:")
+    print(f"  ✓ 티커 스냅샷 갱신: {Config.TICKER_REFRESH_SECONDS}초마다")
+    if Config.BINANCE_STREAM_ENABLED:
+        print(f"  ✓ 실시간 스트림: 전체 티커 + 캔들 {', '.join(Config.STREAM_KLINE_SYMBOLS)} ({', '.join(Config.STREAM_KLINE_INTERVALS)})")
     print("  ✓ 뉴스 자동 수집: 30분마다")
     print("  ✓ 가격 자동 저장: 10분마다")
+    print(f"  ✓ 시세 압축: {Config.PRICE_COMPACTION_MINUTES}분마다 (원본 {Config.RAW_RETENTION_DAYS}일 보존)")
     print("=" * 60)
 
     # Flask 서버 실행 (개발용)
@@ -0,0 +1,127 @@
+"""
+Binance 실시간 스트림 대역(stand-in) 서버 (로컬 개발용)
+
+Binance combined stream(/stream?streams=...)과 같은 형식으로 가짜 시세를 보냅니다.
+- !miniTicker@arr       : 1초마다 일부 심볼의 24시간 시세 (랜덤 워크)
+- <symbol>@kline_<간격> : 1초마다 진행 중인 캔들 (간격이 바뀌면 다음 캔들로 넘어감)
+
+사용법:
+    pip install websockets
+    python binance_stream_standin.py
+    BINANCE_STREAM_URLS=ws://localhost:9443 python app.py
+
+환경 변수:
+    STANDIN_PORT         - 포트 (기본 9443)
+    STANDIN_DROP_AFTER   - 이 시간(초)마다 연결을 끊어서 재연결/resync 동작을 확인 (기본 0 = 끊지 않음)
+    STANDIN_SILENT_AFTER - 이 시간(초)이 지나면 연결은 유지한 채 메시지만 멈춤 (유휴 감지 확인용, 기본 0)
+
+주의: 스트림만 대신합니다. 연결 직후의 티커 resync와 캔들 첫 로드는 BINANCE_BASE_URLS(REST)로 갑니다.
+"""
+import asyncio
+import json
+import os
+import random
+import time
+from urllib.parse import urlparse, parse_qs
+
+from websockets.asyncio.server import serve
+
+PORT = int(os.getenv('STANDIN_PORT', 9443))
+DROP_AFTER = float(os.getenv('STANDIN_DROP_AFTER', 0))
+SILENT_AFTER = float(os.getenv('STANDIN_SILENT_AFTER', 0))
+
+INTERVAL_MS = {
+    "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "2h": 7_200_000, "4h": 14_400_000, "1d": 86_400_000
+}
+
+# 심볼별 (24시간 전 시가, 현재가, 거래량) - 모든 연결이 공유
+MARKET = {
+    symbol: [price, price, random.uniform(1e3, 1e6)]
+    for symbol, price in [
+        ("BTCUSDT", 65000.0), ("ETHUSDT", 3200.0), ("BNBUSDT", 580.0), ("SOLUSDT", 150.0),
+        ("XRPUSDT", 0.52), ("DOGEUSDT", 0.12), ("ADAUSDT", 0.45), ("ETHFIUSDT", 3.1)
+    ]
+}
+
+
+def step_market():
+    """현재가를 조금씩 움직이고 이번 초에 바뀐 심볼 목록을 반환"""
+    changed = random.sample(sorted(MARKET), k=random.randint(1, len(MARKET)))
+    for symbol in changed:
+        state = MARKET[symbol]
+        state[1] *= 1 + random.gauss(0, 0.001)
+        state[2] += random.uniform(0, 100)
+    return changed
+
+
+def mini_ticker(symbol, now_ms):
+    open_price, price, volume = MARKET[symbol]
+    return {
+        "e": "24hrMiniTicker", "E": now_ms, "s": symbol,
+        "c": f"{price:.8f}", "o": f"{open_price:.8f}",
+        "h": f"{max(open_price, price):.8f}", "l": f"{min(open_price, price):.8f}",
+        "v": f"{volume:.4f}", "q": f"{volume * price:.4f}"
+    }
+
+
+def kline(symbol, interval, now_ms, candles):
+    """진행 중인 캔들 (candles: {(symbol, interval): [시작 시각, 시가, 고가, 저가, 거래량]})"""
+    price = MARKET[symbol][1]
+    start = now_ms - now_ms % INTERVAL_MS[interval]
+    candle = candles.get((symbol, interval))
+    if candle is None or candle[0] != start:
+        candle = candles[(symbol, interval)] = [start, price, price, price, 0.0]
+    candle[2] = max(candle[2], price)
+    candle[3] = min(candle[3], price)
+    candle[4] += random.uniform(0, 10)
+    return {
+        "e": "kline", "E": now_ms, "s": symbol,
+        "k": {
+            "t": start, "T": start + INTERVAL_MS[interval] - 1, "s": symbol, "i": interval,
+            "o": f"{candle[1]:.8f}", "c": f"{price:.8f}", "h": f"{candle[2]:.8f}", "l": f"{candle[3]:.8f}",
+            "v": f"{candle[4]:.4f}", "x": False
+        }
+    }
+
+
+async def handler(connection):
+    query = parse_qs(urlparse(connection.request.path).query)
+    streams = query.get("streams", [""])[0].split("/")
+    print(f"🔌 연결: {connection.remote_address} ({len(streams)}개 스트림)")
+
+    opened = time.monotonic()
+    candles = {}
+    while True:
+        await asyncio.sleep(1)
+        elapsed = time.monotonic() - opened
+        if DROP_AFTER and elapsed >= DROP_AFTER:
+            print("✂️ 연결 끊기 (STANDIN_DROP_AFTER)")
+            await connection.close()
+            return
+        if SILENT_AFTER and elapsed >= SILENT_AFTER:
+            continue
+
+        now_ms = int(time.time() * 1000)
+        changed = step_market()
+        for stream in streams:
+            if stream == "!miniTicker@arr":
+                data = [mini_ticker(symbol, now_ms) for symbol in changed]
+            elif "@kline_" in stream:
+                symbol, interval = stream.split("@kline_")
+                if symbol.upper() not in MARKET or interval not in INTERVAL_MS:
+                    continue
+                data = kline(symbol.upper(), interval, now_ms, candles)
+            else:
+                continue
+            await connection.send(json.dumps({"stream": stream, "data": data}))
+
+
+async def main():
+    async with serve(handler, "localhost", PORT) as server:
+        print(f"📡 Binance 스트림 대역 서버: ws://localhost:{PORT}")
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,57 +2,173 @@
 Binance API를 통해 코인 시세 데이터를 수집하는 모듈
 """
 import os
+import sys
 import requests
 import time
 from datetime import datetime
 
+# 스크립트로 직접 실행할 때 collectors 패키지 임포트를 위해 부모 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.candle_columns import CandleColumns
+from collectors.mirror_health import MirrorHealthTracker
+from collectors.rate_limit import HIGH, LOW, RateLimited, WeightGovernor, request_weight
+
+# 캔들 간격별 길이 (초)
+INTERVAL_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "2h": 7200, "4h": 14400, "6h": 21600, "8h": 28800, "12h": 43200,
+    "1d": 86400, "3d": 259200, "1w": 604800
+}
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def load_base_urls():
+    """BINANCE_BASE_URLS 환경 변수(쉼표 구분) 또는 기본 미러 목록"""
+    env_urls = os.getenv("BINANCE_BASE_URLS")
+    if env_urls:
+        return [u.strip().rstrip("/") for u in env_urls.split(",") if u.strip()]
+    return [
+        "https://api.binance.com/api/v3",
+        "https://data-api.binance.vision/api/v3",
+        "https://api1.binance.com/api/v3"
+    ]
+
+
+# ----------------------------
+# 응답 변환 (동기/비동기 수집기 공용)
+# ----------------------------
+def format_symbols(data, quote="USDT"):
+    """/exchangeInfo 응답 → 거래 가능한 심볼 리스트"""
+    return [
+        s["symbol"] for s in data["symbols"]
+        if s["status"] == "TRADING" and s["quoteAsset"] == quote
+    ]
+
+
+def format_price(data):
+    """/ticker/price 응답 → 가격 딕셔너리"""
+    return {
+        "symbol": data["symbol"],
+        "price": float(data["price"]),
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def format_24h_ticker(data):
+    """/ticker/24hr (단일 심볼) 응답 → 시세 딕셔너리"""
+    return {
+        "symbol": data["symbol"],
+        "current_price": float(data["lastPrice"]),
+        "high_price": float(data["highPrice"]),
+        "low_price": float(data["lowPrice"]),
+        "volume": float(data["volume"]),
+        "price_change": float(data["priceChange"]),
+        "price_change_percent": float(data["priceChangePercent"]),
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def format_multiple_tickers(data, symbols=None):
+    """/ticker/24hr (전체) 응답 → 시세 딕셔너리 리스트 (symbols가 없으면 USDT 코인 전체)"""
+    if symbols is None:
+        # USDT 코인 전체 자동 필터링
+        filtered = [d for d in data if d["symbol"].endswith("USDT")]
+    else:
+        filtered = [d for d in data if d["symbol"] in symbols]
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return [{
+        "symbol": d["symbol"],
+        "current_price": float(d["lastPrice"]),
+        "volume": float(d["volume"]),
+        "price_change_percent": float(d["priceChangePercent"]),
+        "timestamp": timestamp
+    } for d in filtered]
+
+
+def klines_params(symbol, interval, limit, start_time=None):
+    """/klines 요청 파라미터"""
+    params = {
+        "symbol": symbol,
+        "interval": interval,
+        "limit": limit
+    }
+    if start_time is not None:
+        params["startTime"] = start_time
+    return params
+
 
 class BinanceCollector:
     """Binance API에서 코인 데이터를 수집하는 클래스"""
 
-    def __init__(self):
-        env_urls = os.getenv("BINANCE_BASE_URLS")
-        default_urls = [
-            "https://api.binance.com/api/v3",
-            "https://data-api.binance.vision/api/v3",
-            "https://api1.binance.com/api/v3"
-        ]
-        if env_urls:
-            base_urls = [u.strip().rstrip("/") for u in env_urls.split(",") if u.strip()]
-        else:
-            base_urls = default_urls
-
-        self.base_urls = base_urls
+    def __init__(self, timeout=10, weight_limit=5000):
+        self.base_urls = load_base_urls()
         self.base_url = self.base_urls[0]
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS)
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
-    def _request(self, path, params=None):
-        """Binance API request with base URL fallback."""
+        # 미러별 응답 시간/오류율을 추적해서 좋은 미러부터 시도
+        self.health = MirrorHealthTracker(self.base_urls)
+
+        # 1분당 요청 가중치 예산 (429/418 차단 방지)
+        self.governor = WeightGovernor(limit=weight_limit)
+
+    def _request(self, path, params=None, priority=HIGH):
+        """Binance API request with health-ordered mirror fallback."""
+        weight = request_weight(path, params)
         last_exc = None
-        for base_url in self.base_urls:
+        for base_url, timeout in self.health.plan(self.timeout):
+            # 다른 미러로 다시 보내는 요청도 같은 IP의 가중치를 쓰므로 시도마다 예산에서 뺌
+            # 예산이 없으면 RateLimited (LOW는 바로, HIGH는 잠깐 기다린 뒤)
+            self.governor.acquire(weight, priority)
+
             url = f"{base_url}{path}"
+            started = time.perf_counter()
             try:
-                res = self.session.get(url, params=params, timeout=10)
-                if res.status_code == 451:
-                    raise requests.exceptions.HTTPError(
+                res = self.session.get(url, params=params, timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                # 연결 오류/시간 초과
+                self.health.record_failure(base_url)
+                last_exc = e
+                continue
+
+            self.governor.update_from_headers(res.headers)
+            status = res.status_code
+            retry_after = res.headers.get("Retry-After")
+            retry_after = float(retry_after) if retry_after and retry_after.isdigit() else None
+            if status in (418, 429):
+                # 요청 제한은 IP 단위라 다른 미러로 넘겨도 같은 제한을 받음 → 차단이 풀릴 때까지 모든 요청 중단
+                self.governor.ban(status, retry_after=retry_after)
+                raise RateLimited(f"{status} Error for url: {url}", retry_after=retry_after)
+
+            if status in (403, 451) or status >= 500:
+                self.health.record_failure(base_url, status=status)
+                if status == 451:
+                    last_exc = requests.exceptions.HTTPError(
                         "451 Client Error: Unavailable For Legal Reasons",
                         response=res
                     )
-                res.raise_for_status()
-                self.base_url = base_url
-                return res
-            except requests.exceptions.RequestException as e:
-                last_exc = e
+                else:
+                    last_exc = requests.exceptions.HTTPError(f"{status} Error for url: {url}", response=res)
                 continue
 
+            # 그 외 4xx(잘못된 심볼 등)는 미러 문제가 아니므로 다른 미러로 넘기지 않음
+            self.health.record_success(base_url, time.perf_counter() - started)
+            res.raise_for_status()
+            self.base_url = base_url
+            return res
+
         if last_exc:
             raise last_exc
 
-        raise requests.exceptions.RequestException("Binance API ?? ??")
+        raise requests.exceptions.RequestException("Binance API 요청 실패")
 
     # ----------------------------
     # ✅ 모든 거래 가능 코인 목록 가져오기
@@ -69,13 +185,7 @@ class BinanceCollector:
         """
         try:
             res = self._request("/exchangeInfo")
-            data = res.json()
-
-            symbols = [
-                s["symbol"] for s in data["symbols"]
-                if s["status"] == "TRADING" and s["quoteAsset"] == quote
-            ]
-            return symbols
+            return format_symbols(res.json(), quote)
         except Exception as e:
             print(f"⚠️ 심볼 목록 가져오기 오류: {e}")
             return []
@@ -87,12 +197,7 @@ class BinanceCollector:
         try:
             params = {"symbol": symbol}
             res = self._request("/ticker/price", params=params)
-            data = res.json()
-            return {
-                "symbol": data["symbol"],
-                "price": float(data["price"]),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
+            return format_price(res.json())
         except requests.exceptions.RequestException as e:
             print(f"API 요청 오류: {e}")
             return None
@@ -104,17 +209,7 @@ class BinanceCollector:
         try:
             params = {"symbol": symbol}
             res = self._request("/ticker/24hr", params=params)
-            data = res.json()
-            return {
-                "symbol": data["symbol"],
-                "current_price": float(data["lastPrice"]),
-                "high_price": float(data["highPrice"]),
-                "low_price": float(data["lowPrice"]),
-                "volume": float(data["volume"]),
-                "price_change": float(data["priceChange"]),
-                "price_change_percent": float(data["priceChangePercent"]),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
+            return format_24h_ticker(res.json())
         except requests.exceptions.RequestException as e:
             print(f"API 요청 오류: {e}")
             return None
@@ -122,7 +217,7 @@ class BinanceCollector:
     # ----------------------------
     # ✅ 캔들스틱 데이터 가져오기 (차트용)
     # ----------------------------
-    def get_klines(self, symbol="BTCUSDT", interval="1h", limit=24):
+    def get_klines(self, symbol="BTCUSDT", interval="1h", limit=24, start_time=None):
         """
         캔들스틱 데이터를 가져옴 (차트 그리기용).
 
@@ -130,35 +225,41 @@ class BinanceCollector:
             symbol (str): 코인 심볼 (예: "BTCUSDT")
             interval (str): 시간 간격 (1m, 5m, 15m, 1h, 4h, 1d 등)
             limit (int): 가져올 캔들 개수 (기본 24개 = 24시간)
+            start_time (int): 이 시각(ms) 이후에 시작한 캔들만 가져옴 (선택)
 
         Returns:
             list: 캔들스틱 데이터 리스트
+                  [{"time", "open", "high", "low", "close", "volume"}, ...]
+        """
+        return self.get_klines_columnar(symbol, interval, limit, start_time).to_dicts()
+
+    def get_klines_columnar(self, symbol="BTCUSDT", interval="1h", limit=24, start_time=None, priority=HIGH):
+        """
+        캔들스틱 데이터를 필드별 배열로 가져옴.
+        인자는 get_klines와 같습니다.
+
+        Args:
+            priority (str): 요청 우선순위 (LOW면 예산 부족 시 RateLimited를 그대로 올려서
+                            호출한 쪽이 캐시된 데이터로 대신할 수 있게 함)
+
+        Returns:
+            CandleColumns: 캔들 묶음 (실패 시 빈 묶음)
         """
         try:
-            params = {
-                "symbol": symbol,
-                "interval": interval,
-                "limit": limit
-            }
-            res = self._request("/klines", params=params)
-            data = res.json()
-
-            # 캔들스틱 데이터 포맷팅
-            klines = []
-            for k in data:
-                klines.append({
-                    "time": k[0],  # 타임스탬프
-                    "open": float(k[1]), # 시가
-                    "high": float(k[2]), # 고가
-                    "low": float(k[3]), # 저가
-                    "close": float(k[4]), # 종가
-                    "volume": float(k[5]) # 거래량
-                })
-
-            return klines
+            res = self._request(
+                "/klines", params=klines_params(symbol, interval, limit, start_time), priority=priority
+            )
+
+            # [시작 시각, 시가, 고가, 저가, 종가, 거래량, ...] → 필드별 배열
+            return CandleColumns.from_raw(res.json())
+        except RateLimited:
+            if priority == LOW:
+                raise
+            print("캔들스틱 API 요청 생략: 요청 가중치 제한")
+            return CandleColumns.empty()
         except requests.exceptions.RequestException as e:
             print(f"캔들스틱 API 요청 오류: {e}")
-            return []
+            return CandleColumns.empty()
 
     # ----------------------------
     # ✅ 여러 코인 일괄 조회 (빠름)
@@ -170,23 +271,7 @@ class BinanceCollector:
         """
         try:
             res = self._request("/ticker/24hr")
-            data = res.json()
-
-            if symbols is None:
-                # USDT 코인 전체 자동 필터링
-                filtered = [d for d in data if d["symbol"].endswith("USDT")]
-            else:
-                filtered = [d for d in data if d["symbol"] in symbols]
-
-            result = [{
-                "symbol": d["symbol"],
-                "current_price": float(d["lastPrice"]),
-                "volume": float(d["volume"]),
-                "price_change_percent": float(d["priceChangePercent"]),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            } for d in filtered]
-
-            return result
+            return format_multiple_tickers(res.json(), symbols)
         except requests.exceptions.RequestException as e:
             print(f"API 요청 오류: {e}")
             return []
@@ -0,0 +1,302 @@
+"""
+Binance API 비동기 수집기 (asyncio + httpx)
+
+BinanceCollector와 같은 공개 메서드를 async로 제공합니다.
+- 연결 풀을 가진 keep-alive 클라이언트 하나를 재사용 (h2 패키지가 있으면 HTTP/2)
+- 여러 요청을 동시에 보내는 일괄 조회 (get_klines_many, get_24h_tickers)
+- 헤지(hedged) 요청: 첫 미러가 hedge_after초 안에 응답하지 않으면 다음 미러에도 같은 요청을 보내
+  먼저 성공한 응답을 사용하고 나머지는 취소 → 죽은 미러 하나 때문에 timeout만큼 기다리지 않음
+
+사용 예:
+    async with AsyncBinanceCollector() as collector:
+        tickers = await collector.get_multiple_tickers()
+        charts = await collector.get_klines_many([("BTCUSDT", "1h", 24), ("ETHUSDT", "1h", 24)])
+
+동기 코드(스케줄러/스트림 스레드)에서는 HedgedTickerSource로 티커 갱신에만 사용합니다.
+(app.py에서 ASYNC_TICKER_REFRESH=True일 때 TickerSnapshotService의 수집기로 사용)
+
+httpx가 없으면 생성 시 ImportError가 발생합니다. (pip install "httpx[http2]")
+"""
+import asyncio
+import os
+import sys
+import threading
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원 여부 확인용)
+except ImportError:
+    h2 = None
+
+# 스크립트로 직접 실행할 때 collectors 패키지 임포트를 위해 부모 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.binance_api import (
+    DEFAULT_HEADERS, load_base_urls, format_symbols, format_price,
+    format_24h_ticker, format_multiple_tickers, klines_params
+)
+from collectors.candle_columns import CandleColumns
+from collectors.rate_limit import HIGH, RateLimited, request_weight
+
+
+class AsyncBinanceCollector:
+    """Binance API에서 코인 데이터를 비동기로 수집하는 클래스"""
+
+    def __init__(self, base_urls=None, timeout=10, hedge_after=0.5, max_connections=20, http2=True,
+                 governor=None):
+        """
+        Args:
+            base_urls (list): API 미러 목록 (None이면 BinanceCollector와 같은 목록)
+            timeout (float): 요청 하나의 제한 시간 (초)
+            hedge_after (float): 이 시간(초) 안에 응답이 없으면 다음 미러에도 요청 (None이면 헤지 안 함)
+            max_connections (int): 연결 풀 크기
+            http2 (bool): HTTP/2 사용 (h2 패키지가 없으면 HTTP/1.1)
+            governor (WeightGovernor): 요청 가중치 예산 (BinanceCollector.governor를 넘기면 같은 예산을 나눠 씀)
+        """
+        if httpx is None:
+            raise ImportError('AsyncBinanceCollector에는 httpx가 필요합니다: pip install "httpx[http2]"')
+
+        self.base_urls = base_urls or load_base_urls()
+        self.base_url = self.base_urls[0]
+        self.hedge_after = hedge_after
+        self.governor = governor
+        self.client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=timeout,
+            http2=http2 and h2 is not None,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+
+        # 헤지 요청 통계
+        self.hedged = 0      # 두 번째 미러에 요청을 보낸 횟수
+        self.hedge_wins = 0  # 첫 미러가 아닌 미러의 응답을 사용한 횟수
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """연결 풀을 닫습니다."""
+        await self.client.aclose()
+
+    async def _get(self, base_url, path, params):
+        if self.governor is not None:
+            # 헤지로 보내는 요청도 같은 IP의 가중치를 씀 (예산을 기다리는 동안 이벤트 루프를 막지 않게 스레드에서)
+            await asyncio.to_thread(self.governor.acquire, request_weight(path, params), HIGH)
+
+        res = await self.client.get(f"{base_url}{path}", params=params)
+        if self.governor is not None:
+            self.governor.update_from_headers(res.headers)
+            if res.status_code in (418, 429):
+                retry_after = res.headers.get("Retry-After")
+                retry_after = float(retry_after) if retry_after and retry_after.isdigit() else None
+                self.governor.ban(res.status_code, retry_after=retry_after)
+                raise RateLimited(f"{res.status_code} Error for url: {res.request.url}", retry_after=retry_after)
+        if res.status_code == 451:
+            raise httpx.HTTPStatusError(
+                "451 Client Error: Unavailable For Legal Reasons", request=res.request, response=res
+            )
+        res.raise_for_status()
+        return res
+
+    async def _request(self, path, params=None):
+        """
+        Binance API 요청 (헤지 + 미러 대체)
+        마지막으로 성공한 미러부터 시도하고, 느리거나 실패하면 다음 미러로 경쟁시킵니다.
+        """
+        mirrors = [self.base_url] + [u for u in self.base_urls if u != self.base_url]
+        tasks = {}  # {task: base_url}
+        next_index = 0
+        last_exc = None
+
+        def launch():
+            nonlocal next_index
+            base_url = mirrors[next_index]
+            next_index += 1
+            tasks[asyncio.ensure_future(self._get(base_url, path, params))] = base_url
+
+        launch()
+        try:
+            while tasks:
+                can_hedge = self.hedge_after is not None and next_index < len(mirrors)
+                done, _ = await asyncio.wait(
+                    tasks, timeout=self.hedge_after if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # 응답이 늦음 → 다음 미러에도 같은 요청
+                    self.hedged += 1
+                    launch()
+                    continue
+
+                for task in done:
+                    base_url = tasks.pop(task)
+                    if task.exception() is None:
+                        if base_url != mirrors[0]:
+                            self.hedge_wins += 1
+                        self.base_url = base_url
+                        return task.result()
+                    last_exc = task.exception()
+                    if isinstance(last_exc, RateLimited):
+                        # 요청 제한은 IP 단위라 다른 미러로 넘겨도 같은 제한을 받음
+                        raise last_exc
+                    # 실패 → 기다리지 않고 바로 다음 미러
+                    if next_index < len(mirrors):
+                        launch()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if last_exc:
+            raise last_exc
+        raise httpx.HTTPError("Binance API 요청 실패")
+
+    # ----------------------------
+    # BinanceCollector와 같은 공개 메서드 (async)
+    # ----------------------------
+    async def get_all_symbols(self, quote="USDT"):
+        try:
+            res = await self._request("/exchangeInfo")
+            return format_symbols(res.json(), quote)
+        except Exception as e:
+            print(f"⚠️ 심볼 목록 가져오기 오류: {e}")
+            return []
+
+    async def get_current_price(self, symbol="BTCUSDT"):
+        try:
+            res = await self._request("/ticker/price", params={"symbol": symbol})
+            return format_price(res.json())
+        except (httpx.HTTPError, RateLimited) as e:
+            print(f"API 요청 오류: {e}")
+            return None
+
+    async def get_24h_ticker(self, symbol="BTCUSDT"):
+        try:
+            res = await self._request("/ticker/24hr", params={"symbol": symbol})
+            return format_24h_ticker(res.json())
+        except (httpx.HTTPError, RateLimited) as e:
+            print(f"API 요청 오류: {e}")
+            return None
+
+    async def get_klines(self, symbol="BTCUSDT", interval="1h", limit=24, start_time=None):
+        """캔들스틱 데이터 (BinanceCollector.get_klines와 같은 형식)"""
+        return (await self.get_klines_columnar(symbol, interval, limit, start_time)).to_dicts()
+
+    async def get_klines_columnar(self, symbol="BTCUSDT", interval="1h", limit=24, start_time=None):
+        """캔들스틱 데이터를 CandleColumns로 (실패 시 빈 묶음)"""
+        try:
+            res = await self._request("/klines", params=klines_params(symbol, interval, limit, start_time))
+            return CandleColumns.from_raw(res.json())
+        except (httpx.HTTPError, RateLimited) as e:
+            print(f"캔들스틱 API 요청 오류: {e}")
+            return CandleColumns.empty()
+
+    async def get_multiple_tickers(self, symbols=None):
+        try:
+            res = await self._request("/ticker/24hr")
+            return format_multiple_tickers(res.json(), symbols)
+        except (httpx.HTTPError, RateLimited) as e:
+            print(f"API 요청 오류: {e}")
+            return []
+
+    # ----------------------------
+    # 일괄 조회 (동시 요청)
+    # ----------------------------
+    async def get_klines_many(self, requests, columnar=False):
+        """
+        여러 캔들스틱 요청을 동시에 보냅니다.
+
+        Args:
+            requests (list): (symbol, interval, limit) 튜플 리스트
+            columnar (bool): True면 CandleColumns, False면 딕셔너리 리스트로 반환
+
+        Returns:
+            list: requests와 같은 순서의 결과 리스트
+        """
+        fetch = self.get_klines_columnar if columnar else self.get_klines
+        return await asyncio.gather(*(fetch(symbol, interval, limit) for symbol, interval, limit in requests))
+
+    async def get_24h_tickers(self, symbols):
+        """
+        여러 심볼의 24시간 데이터를 동시에 조회합니다.
+
+        Returns:
+            list: symbols와 같은 순서의 결과 리스트 (실패한 심볼은 None)
+        """
+        return await asyncio.gather(*(self.get_24h_ticker(symbol) for symbol in symbols))
+
+
+class HedgedTickerSource:
+    """
+    AsyncBinanceCollector를 동기 코드에서 쓰기 위한 어댑터 (TickerSnapshotService의 수집기 자리에 사용)
+    전용 이벤트 루프 스레드 하나에서 클라이언트를 계속 재사용해서 연결 풀을 유지합니다.
+    """
+
+    def __init__(self, wait_timeout=30, **kwargs):
+        """
+        Args:
+            wait_timeout (float): 호출한 스레드가 결과를 기다리는 최대 시간 (초)
+            **kwargs: AsyncBinanceCollector 생성 인자 (governor 등)
+        """
+        if httpx is None:
+            raise ImportError('HedgedTickerSource에는 httpx가 필요합니다: pip install "httpx[http2]"')
+
+        self.wait_timeout = wait_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="binance-async", daemon=True)
+        self._thread.start()
+        self.collector = self._run(self._create(kwargs))
+
+    @staticmethod
+    async def _create(kwargs):
+        # 클라이언트는 요청을 보낼 이벤트 루프 안에서 만듦
+        return AsyncBinanceCollector(**kwargs)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(self.wait_timeout)
+
+    def get_multiple_tickers(self, symbols=None):
+        """BinanceCollector.get_multiple_tickers와 같은 형식 (실패 시 빈 리스트)"""
+        try:
+            return self._run(self.collector.get_multiple_tickers(symbols))
+        except Exception as e:
+            print(f"API 요청 오류: {e}")
+            return []
+
+    def stats(self):
+        """헤지 요청 통계 (모니터링용)"""
+        return {
+            'current_mirror': self.collector.base_url,
+            'hedged': self.collector.hedged,
+            'hedge_wins': self.collector.hedge_wins
+        }
+
+    def close(self):
+        """연결 풀을 닫고 이벤트 루프 스레드를 멈춥니다."""
+        try:
+            self._run(self.collector.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    async def main():
+        async with AsyncBinanceCollector() as collector:
+            tickers = await collector.get_multiple_tickers()
+            print(f"총 {len(tickers)}개 시세 데이터 수집 완료")
+
+            chart_requests = [("BTCUSDT", "1h", 24), ("ETHUSDT", "1h", 24)]
+            charts = await collector.get_klines_many(chart_requests)
+            for (symbol, interval, _), candles in zip(chart_requests, charts):
+                print(f"  {symbol} {interval}: 캔들 {len(candles)}개")
+            print(f"  사용 미러: {collector.base_url}, 헤지 {collector.hedged}회")
+
+    asyncio.run(main())
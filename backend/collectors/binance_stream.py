@@ -0,0 +1,226 @@
+"""
+Binance 실시간 시세 스트림 (WebSocket)
+REST로 /ticker/24hr, /klines를 주기적으로 가져오는 대신 combined stream 하나로
+변경분을 받아 티커 스냅샷과 캔들 버퍼를 메모리에서 바로 갱신합니다.
+
+- !miniTicker@arr       : 1초마다 바뀐 심볼의 24시간 시세 → TickerSnapshotService.apply_updates
+- <symbol>@kline_<간격> : 진행 중인 캔들 → CandleStore.apply_stream
+
+연결이 끊기면 지수 백오프로 다시 연결하고, 연결될 때마다 REST로 티커 전체를 한 번 가져와서
+끊긴 동안 놓친 변경분을 메웁니다(resync). 캔들 버퍼는 이어지지 않는 캔들을 합치지 않으므로
+끊긴 동안의 빈틈은 버퍼가 만료된 뒤 REST 증분 갱신으로 메워집니다.
+
+websockets가 없으면 start()가 경고만 출력하고, 기존 REST 폴링이 그대로 동작합니다.
+로컬에서는 binance_stream_standin.py를 띄우고 BINANCE_STREAM_URLS=ws://localhost:9443 으로 시험할 수 있습니다.
+"""
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+
+try:
+    from websockets.sync.client import connect as ws_connect
+except ImportError:
+    ws_connect = None
+
+from collectors.candle_columns import CandleColumns
+
+TICKER_STREAM = "!miniTicker@arr"
+
+
+def load_stream_urls():
+    """BINANCE_STREAM_URLS 환경 변수(쉼표 구분) 또는 기본 스트림 주소 목록"""
+    env_urls = os.getenv("BINANCE_STREAM_URLS")
+    if env_urls:
+        return [u.strip().rstrip("/") for u in env_urls.split(",") if u.strip()]
+    return [
+        "wss://stream.binance.com:9443",
+        "wss://data-stream.binance.vision"
+    ]
+
+
+def format_mini_ticker(data):
+    """24hrMiniTicker 이벤트 → get_multiple_tickers와 같은 형식의 시세 딕셔너리"""
+    close_price = float(data["c"])
+    open_price = float(data["o"])
+    return {
+        "symbol": data["s"],
+        "current_price": close_price,
+        "volume": float(data["v"]),
+        "price_change_percent": round((close_price - open_price) / open_price * 100, 3) if open_price else 0.0,
+        "timestamp": datetime.fromtimestamp(data["E"] / 1000).strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def kline_to_columns(kline):
+    """kline 이벤트의 k 필드 → 캔들 1개짜리 CandleColumns"""
+    return CandleColumns.from_raw([[kline["t"], kline["o"], kline["h"], kline["l"], kline["c"], kline["v"]]])
+
+
+class BinanceStream:
+    """Binance combined stream을 백그라운드 스레드에서 받아 메모리 시세를 갱신하는 클래스"""
+
+    def __init__(self, ticker_service=None, candle_store=None, kline_symbols=(), kline_intervals=("1m",),
+                 urls=None, idle_timeout=10.0, candle_ttl=10.0, max_backoff=60.0):
+        """
+        Args:
+            ticker_service (TickerSnapshotService): 티커 스냅샷 (None이면 티커 스트림 구독 안 함)
+            candle_store (CandleStore): 캔들 저장소 (None이면 캔들 스트림 구독 안 함)
+            kline_symbols (iterable): 캔들 스트림을 구독할 심볼
+            kline_intervals (iterable): 구독할 캔들 간격 (다른 간격은 CandleStore가 집계로 만듦)
+            urls (list): 스트림 주소 목록 (None이면 load_stream_urls)
+            idle_timeout (float): 이 시간(초) 동안 메시지가 없으면 끊긴 것으로 보고 다시 연결
+            candle_ttl (float): 스트림으로 갱신한 캔들 버퍼의 유지 시간 (초, 스트림이 멈추면 REST로 돌아감)
+            max_backoff (float): 재연결 대기 시간 상한 (초)
+        """
+        self.ticker_service = ticker_service
+        self.candle_store = candle_store
+        self.kline_symbols = tuple(kline_symbols) if candle_store is not None else ()
+        self.kline_intervals = tuple(kline_intervals)
+        self.urls = urls or load_stream_urls()
+        self.idle_timeout = idle_timeout
+        self.candle_ttl = candle_ttl
+        self.max_backoff = max_backoff
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._ws = None
+
+        # 상태/통계
+        self.url = None
+        self.connected = False
+        self.last_message_at = 0.0  # monotonic
+        self.messages = 0
+        self.reconnects = 0
+        self.resyncs = 0
+        self.ticker_updates = 0
+        self.kline_updates = 0
+        self.kline_skipped = 0      # 버퍼가 없거나 이어지지 않아 합치지 않은 캔들 수
+
+    def streams(self):
+        """구독할 스트림 이름 목록"""
+        names = [TICKER_STREAM] if self.ticker_service is not None else []
+        names += [
+            f"{symbol.lower()}@kline_{interval}"
+            for symbol in self.kline_symbols for interval in self.kline_intervals
+        ]
+        return names
+
+    def start(self):
+        """백그라운드 스레드에서 스트림을 받기 시작합니다."""
+        if ws_connect is None:
+            print("⚠️ websockets 패키지가 없어 실시간 스트림을 사용하지 않습니다 (REST 폴링 유지)")
+            return False
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="binance-stream", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout=5.0):
+        """스트림을 멈추고 연결을 닫습니다."""
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            ws.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_fresh(self, max_age=5.0):
+        """최근 max_age초 안에 메시지를 받았는지 (REST 폴링을 건너뛸지 판단)"""
+        return self.connected and time.monotonic() - self.last_message_at < max_age
+
+    def _run(self):
+        """연결 → 수신을 반복 (끊기면 지수 백오프 + 지터 후 다음 주소로 재연결)"""
+        backoff = 1.0
+        attempt = 0
+        while not self._stop.is_set():
+            url = self.urls[attempt % len(self.urls)]
+            received = self.messages
+            try:
+                self._session(url)
+            except Exception as e:
+                if not self._stop.is_set():
+                    print(f"⚠️ 스트림 연결 끊김 ({url}): {e}")
+            finally:
+                self.connected = False
+                self._ws = None
+
+            if self._stop.is_set():
+                break
+            if self.messages > received:
+                # 메시지를 받았던 연결이면 정상 연결이었으므로 같은 주소부터, 대기 시간 초기화
+                backoff = 1.0
+            else:
+                attempt += 1
+                backoff = min(backoff * 2, self.max_backoff)
+            self.reconnects += 1
+            self._stop.wait(backoff * random.uniform(0.5, 1.0))
+
+    def _session(self, url):
+        """연결 하나를 열고 끊길 때까지 메시지를 처리합니다."""
+        stream_url = f"{url}/stream?streams={'/'.join(self.streams())}"
+        with ws_connect(stream_url, open_timeout=self.idle_timeout, max_size=2 ** 22) as ws:
+            self._ws = ws
+            self.url = url
+            self.connected = True
+            self.last_message_at = time.monotonic()
+            print(f"📡 실시간 스트림 연결: {url} ({len(self.streams())}개 스트림)")
+            self._resync()
+
+            while not self._stop.is_set():
+                # idle_timeout 동안 아무것도 오지 않으면 TimeoutError → 재연결
+                raw = ws.recv(timeout=self.idle_timeout)
+                self.last_message_at = time.monotonic()
+                self.messages += 1
+                self.handle_message(raw)
+
+    def _resync(self):
+        """연결 직후 REST로 티커 전체를 다시 가져와 끊긴 동안의 변경분을 메웁니다."""
+        if self.ticker_service is None:
+            return
+        self.resyncs += 1
+        self.ticker_service.refresh()
+
+    def handle_message(self, raw):
+        """
+        combined stream 메시지 하나를 처리합니다.
+
+        Args:
+            raw (str): {"stream": "<이름>", "data": <이벤트>} 형식의 JSON
+        """
+        message = json.loads(raw)
+        stream, data = message.get("stream", ""), message.get("data")
+        if stream == TICKER_STREAM:
+            self.ticker_updates += 1
+            self.ticker_service.apply_updates([format_mini_ticker(d) for d in data])
+        elif "@kline_" in stream:
+            kline = data["k"]
+            merged = self.candle_store.apply_stream(
+                data["s"], kline["i"], kline_to_columns(kline), ttl=self.candle_ttl
+            )
+            if merged:
+                self.kline_updates += 1
+            else:
+                self.kline_skipped += 1
+
+    def stats(self):
+        """스트림 상태 (모니터링용)"""
+        return {
+            'enabled': self._thread is not None,
+            'connected': self.connected,
+            'url': self.url,
+            'streams': len(self.streams()),
+            'last_message_age_seconds': (
+                round(time.monotonic() - self.last_message_at, 1) if self.last_message_at else None
+            ),
+            'messages': self.messages,
+            'reconnects': self.reconnects,
+            'resyncs': self.resyncs,
+            'ticker_updates': self.ticker_updates,
+            'kline_updates': self.kline_updates,
+            'kline_skipped': self.kline_skipped
+        }
@@ -0,0 +1,75 @@
+"""
+캔들 집계 (NumPy)
+이미 가지고 있는 더 짧은 간격의 캔들(예: 1m)을 묶어서
+긴 간격의 캔들(5m/15m/1h/4h/1d)을 만듭니다.
+Binance 캔들은 UTC epoch 기준으로 정렬되어 있으므로 시작 시각을 간격으로 나눠 묶습니다.
+"""
+import numpy as np
+
+from collectors.binance_api import INTERVAL_SECONDS
+from collectors.candle_columns import CandleColumns
+
+# epoch 기준으로 경계가 맞는 간격만 집계 대상 (3d, 1w는 Binance 기준 시작일이 다름)
+AGGREGATABLE_INTERVALS = (
+    "1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d"
+)
+
+
+def base_intervals_for(interval):
+    """
+    주어진 간격을 만들 수 있는 더 짧은 간격 목록 (긴 것부터)
+
+    Args:
+        interval (str): 목표 간격
+
+    Returns:
+        list: 기준 간격 리스트
+    """
+    if interval not in AGGREGATABLE_INTERVALS:
+        return []
+    target = INTERVAL_SECONDS[interval]
+    bases = [
+        base for base in AGGREGATABLE_INTERVALS
+        if INTERVAL_SECONDS[base] < target and target % INTERVAL_SECONDS[base] == 0
+    ]
+    return sorted(bases, key=lambda base: INTERVAL_SECONDS[base], reverse=True)
+
+
+def aggregate_candles(candles, interval):
+    """
+    짧은 간격의 캔들을 목표 간격으로 묶습니다.
+    시작 부분이 잘린 첫 구간은 버리고, 마지막 구간은 진행 중인 캔들로 남깁니다.
+
+    Args:
+        candles (CandleColumns): 짧은 간격의 캔들 (오래된 것부터, 빈틈 없음)
+        interval (str): 목표 간격
+
+    Returns:
+        CandleColumns: 목표 간격의 캔들
+    """
+    n = len(candles)
+    if n == 0:
+        return CandleColumns.empty()
+
+    interval_ms = INTERVAL_SECONDS[interval] * 1000
+    times = candles.time
+
+    # 구간 시작 위치 찾기
+    buckets = times - times % interval_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], n]
+
+    # 첫 구간이 구간 경계에서 시작하지 않으면 불완전하므로 제외
+    if times[0] != buckets[0]:
+        starts, ends = starts[1:], ends[1:]
+    if len(starts) == 0:
+        return CandleColumns.empty()
+
+    return CandleColumns(
+        buckets[starts],
+        candles.open[starts],
+        np.maximum.reduceat(candles.high, starts),
+        np.minimum.reduceat(candles.low, starts),
+        candles.close[ends - 1],
+        np.add.reduceat(candles.volume, starts)
+    )
@@ -0,0 +1,223 @@
+"""
+캔들 저장소
+(심볼, 간격)마다 지금까지 요청된 가장 긴 구간의 캔들을 링 버퍼로 보관하고,
+더 짧은 limit 요청은 잘라서 응답합니다.
+갱신할 때는 마지막으로 저장된 캔들 이후(startTime)만 가져오므로
+Binance 응답이 보통 캔들 몇 개 수준으로 줄어듭니다.
+"""
+import time
+
+import numpy as np
+
+from collectors.binance_api import INTERVAL_SECONDS
+from collectors.candle_columns import CandleColumns, CANDLE_BYTES
+from collectors.candle_aggregation import aggregate_candles, base_intervals_for
+from collectors.rate_limit import LOW, RateLimited
+
+MAX_KLINES_LIMIT = 1000  # Binance /klines 한 번에 가져올 수 있는 최대 개수
+
+
+class CandleBuffer:
+    """한 (심볼, 간격)의 캔들 버퍼 (필드별 배열, 최대 window개 유지)"""
+
+    def __init__(self, symbol, interval, window, candles):
+        """
+        Args:
+            symbol (str): 코인 심볼
+            interval (str): 캔들 간격
+            window (int): 보관할 최대 캔들 수 (지금까지 요청된 가장 큰 limit)
+            candles (CandleColumns): 초기 캔들 (오래된 것부터)
+        """
+        self.symbol = symbol
+        self.interval = interval
+        self.window = window
+        # 갱신할 때마다 새 배열로 통째로 교체하므로 읽는 쪽은 락이 필요 없음
+        self.columns = candles.tail(window)
+
+    def __len__(self):
+        return len(self.columns)
+
+    @property
+    def last_open_time(self):
+        """마지막 캔들의 시작 시각 (ms), 비어 있으면 None"""
+        columns = self.columns
+        return int(columns.time[-1]) if len(columns) else None
+
+    def merge(self, newer):
+        """
+        새로 가져온 캔들을 합칩니다.
+        마지막 캔들(아직 진행 중일 수 있음)은 덮어쓰고, 이후 캔들은 뒤에 붙입니다.
+
+        Args:
+            newer (CandleColumns): startTime 이후 캔들 (오래된 것부터)
+        """
+        if len(newer) == 0:
+            return
+        columns = self.columns
+        keep = int(np.searchsorted(columns.time, newer.time[0]))
+        self.columns = columns.slice(0, keep).concat(newer).tail(self.window)
+
+    def tail(self, limit):
+        """최근 limit개 캔들을 반환합니다. (오래된 것부터)"""
+        return self.columns.tail(limit)
+
+
+class CandleStore:
+    """캔들 버퍼를 캐시에 보관하고 필요한 만큼만 갱신하는 클래스"""
+
+    def __init__(self, collector, cache, entry_bytes=CANDLE_BYTES, base_intervals=("1m", "1h"), base_window=MAX_KLINES_LIMIT):
+        """
+        Args:
+            collector (BinanceCollector): 캔들 수집기
+            cache (BoundedTTLCache): 버퍼를 보관할 캐시
+            entry_bytes (int): 캔들 1개의 대략적인 메모리 크기 (캐시 용량 계산용)
+            base_intervals (tuple): 집계의 기준으로 쓸 간격 (처음 가져올 때 base_window개를 받음)
+            base_window (int): 기준 간격 버퍼의 최소 크기
+        """
+        self.collector = collector
+        self.cache = cache
+        self.entry_bytes = entry_bytes
+        self.base_intervals = base_intervals
+        self.base_window = base_window
+        self.aggregated = 0  # Binance 호출 없이 집계로 응답한 횟수
+
+    def _load(self, symbol, interval, limit, stale):
+        """
+        캐시 미스/만료 시 호출 - 가능하면 증분 갱신, 아니면 전체 가져오기
+        차트 요청은 낮은 우선순위라 요청 가중치 예산이 부족하면 RateLimited를 올립니다.
+        (get에서 만료된 버퍼로 대신 응답 - 다시 캐시하지 않으므로 다음 요청은 새로 가져오기를 시도)
+        """
+        if stale is not None and stale.window >= limit and self._can_extend(stale):
+            newer = self.collector.get_klines_columnar(
+                symbol, interval,
+                limit=self._missing_count(stale),
+                start_time=stale.last_open_time,
+                priority=LOW
+            )
+            if len(newer):
+                stale.merge(newer)
+                return stale
+
+        window = max(limit, stale.window if stale is not None else 0)
+        if interval in self.base_intervals:
+            window = max(window, self.base_window)
+        window = min(window, MAX_KLINES_LIMIT)
+        print(f"🔄 Binance API 호출: {symbol}_{interval} (전체 {window}개)")
+        candles = self.collector.get_klines_columnar(symbol, interval, window, priority=LOW)
+        if len(candles) == 0:
+            return None
+        return CandleBuffer(symbol, interval, window, candles)
+
+    def apply_stream(self, symbol, interval, candles, ttl):
+        """
+        스트림으로 받은 캔들을 캐시된 버퍼에 합치고 유지 시간을 ttl초로 연장합니다.
+        버퍼가 없거나 마지막 캔들과 이어지지 않으면(연결이 끊긴 동안 빠진 캔들) 합치지 않습니다.
+        그런 버퍼는 그대로 만료되어 다음 요청 때 REST 증분 갱신으로 빈틈이 메워집니다.
+
+        Args:
+            symbol (str): 코인 심볼
+            interval (str): 캔들 간격
+            candles (CandleColumns): 진행 중인 캔들 (보통 1개)
+            ttl (float): 연장할 유지 시간 (초)
+
+        Returns:
+            bool: 합쳤으면 True
+        """
+        if len(candles) == 0 or interval not in INTERVAL_SECONDS:
+            return False
+        interval_ms = INTERVAL_SECONDS[interval] * 1000
+        first = int(candles.time[0])
+
+        def follows(buffer):
+            last = buffer.last_open_time
+            return last is not None and last <= first <= last + interval_ms
+
+        buffer = self.cache.touch((symbol, interval), ttl, accept=follows)
+        if buffer is None:
+            return False
+        buffer.merge(candles)
+        return True
+
+    def _missing_count(self, buffer):
+        """마지막 캔들부터 지금까지 필요한 캔들 수 (마지막 캔들 포함)"""
+        interval_ms = INTERVAL_SECONDS[buffer.interval] * 1000
+        now_ms = int(time.time() * 1000)
+        return (now_ms - buffer.last_open_time) // interval_ms + 1
+
+    def _can_extend(self, buffer):
+        """증분 갱신으로 빈틈 없이 이어 붙일 수 있는지 확인"""
+        if buffer.interval not in INTERVAL_SECONDS or buffer.last_open_time is None:
+            return False
+        return self._missing_count(buffer) <= min(buffer.window, MAX_KLINES_LIMIT)
+
+    def get(self, symbol, interval, limit, ttl):
+        """
+        캔들 데이터를 반환합니다.
+
+        Args:
+            symbol (str): 코인 심볼
+            interval (str): 캔들 간격
+            limit (int): 캔들 개수
+            ttl (float): 버퍼를 최신으로 간주할 시간 (초)
+
+        Returns:
+            tuple: (CandleColumns, 캐시 나이(초), 캐시 적중 여부, 만료된 버퍼로 대신 응답했는지)
+        """
+        limit = min(limit, MAX_KLINES_LIMIT)
+        key = (symbol, interval)
+
+        found = self.cache.peek(key, accept=lambda buf: buf.window >= limit)
+        if found is not None:
+            buffer, age = found
+            return buffer.tail(limit), age, True, False
+
+        # 더 짧은 간격의 최신 버퍼가 있으면 집계해서 응답 (Binance 호출 없음)
+        rolled = self._aggregate_from_finer(symbol, interval, limit)
+        if rolled is not None:
+            return rolled
+
+        buffer, age, cached = None, 0, False
+        try:
+            # 더 작은 limit의 로드에 합쳐져서 짧은 버퍼를 받은 경우 한 번 더 시도
+            for _ in range(2):
+                buffer, age, cached = self.cache.get_or_load(
+                    key,
+                    lambda stale: self._load(symbol, interval, limit, stale),
+                    ttl=ttl,
+                    size_of=lambda buf: buf.window * self.entry_bytes,
+                    accept=lambda buf: buf.window >= limit
+                )
+                if buffer is None or buffer.window >= limit:
+                    break
+        except RateLimited:
+            # 만료된 버퍼가 있으면 실제 나이와 함께 그대로 응답 (유지 시간은 연장하지 않음)
+            found = self.cache.peek(key, include_expired=True)
+            if found is None:
+                raise
+            print(f"⏳ 요청 가중치 부족: {symbol}_{interval} 이전 캔들로 응답")
+            buffer, age = found
+            return buffer.tail(limit), age, True, True
+
+        if buffer is None:
+            return CandleColumns.empty(), 0, False, False
+        return buffer.tail(limit), age, cached, False
+
+    def _aggregate_from_finer(self, symbol, interval, limit):
+        """
+        캐시에 있는 더 짧은 간격의 버퍼로 목표 간격 캔들을 만듭니다.
+        요청한 개수를 채울 만큼 버퍼가 길지 않으면 None을 반환합니다.
+        """
+        for base in base_intervals_for(interval):
+            ratio = INTERVAL_SECONDS[interval] // INTERVAL_SECONDS[base]
+            needed = limit * ratio
+            found = self.cache.peek((symbol, base))
+            if found is None or len(found[0]) < needed:
+                continue
+
+            buffer, age = found
+            # 첫 구간이 잘릴 수 있으므로 한 구간만큼 더 넉넉히 잘라서 집계
+            candles = aggregate_candles(buffer.tail(needed + ratio), interval)
+            if len(candles) >= limit:
+                self.aggregated += 1
+                return candles.tail(limit), age, True, False
+        return None
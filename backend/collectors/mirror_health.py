@@ -0,0 +1,182 @@
+"""
+API 미러 상태 추적
+미러별 응답 시간(EWMA), 오류율, 451 응답, 서킷 브레이커 상태를 기록하고
+요청마다 현재 가장 좋은 미러부터 시도하도록 순서를 정합니다.
+
+서킷 브레이커:
+    closed    - 정상. 점수(응답 시간 × 오류율 가중치) 순으로 사용
+    open      - 연속 실패/차단으로 쉬는 중. 다른 미러가 모두 실패할 때만 마지막으로 시도
+    half-open - 쉬는 시간이 끝난 미러. 요청 하나를 짧은 제한 시간으로 먼저 보내 보고(probe)
+                성공하면 closed, 실패하면 더 긴 시간 동안 다시 open
+"""
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class MirrorHealth:
+    """미러 하나의 상태"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.latency = None          # 응답 시간 EWMA (초)
+        self.error_rate = 0.0        # 실패 비율 EWMA (0~1)
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.open_until = 0.0        # open 상태가 끝나는 시각 (monotonic)
+        self.cooldown = 0.0          # 마지막으로 적용한 쉬는 시간 (초)
+        self.probe_started = 0.0     # half-open 확인 요청을 보낸 시각 (0이면 진행 중인 확인 없음)
+        self.last_status = None      # 마지막 실패의 HTTP 상태 코드
+        self.successes = 0
+        self.failures = 0
+
+    def score(self, failed_latency):
+        """
+        낮을수록 좋은 점수
+        아직 써 보지 않은 미러는 0점(한 번은 먼저 시도해서 측정), 실패만 한 미러는 failed_latency 기준
+        """
+        if self.latency is not None:
+            latency = self.latency
+        elif self.failures == 0:
+            return 0.0
+        else:
+            latency = failed_latency
+        return latency * (1 + 4 * self.error_rate)
+
+    def to_dict(self, now):
+        return {
+            'state': self.state,
+            'latency_ms': round(self.latency * 1000, 1) if self.latency is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'consecutive_failures': self.consecutive_failures,
+            'open_for_seconds': round(max(self.open_until - now, 0), 1) if self.state == OPEN else 0,
+            'last_status': self.last_status,
+            'successes': self.successes,
+            'failures': self.failures
+        }
+
+
+class MirrorHealthTracker:
+    """미러 목록의 상태를 추적하고 요청 순서를 정합니다. (스레드 안전)"""
+
+    def __init__(self, base_urls, alpha=0.3, failure_threshold=3, base_cooldown=30.0,
+                 max_cooldown=300.0, blocked_cooldown=3600.0, probe_timeout=2.0):
+        """
+        Args:
+            base_urls (list): 미러 URL 목록 (설정 순서 = 정보가 없을 때의 우선순위)
+            alpha (float): EWMA 가중치 (클수록 최근 값 반영이 빠름)
+            failure_threshold (int): 이 횟수만큼 연속 실패하면 open
+            base_cooldown (float): 처음 open될 때 쉬는 시간 (초), 다시 실패할 때마다 두 배
+            max_cooldown (float): 쉬는 시간 상한 (초)
+            blocked_cooldown (float): 451(지역 차단) 응답을 받은 미러를 쉬게 할 시간 (초)
+            probe_timeout (float): half-open 확인 요청의 제한 시간 (초)
+        """
+        self.mirrors = [MirrorHealth(url) for url in base_urls]
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.blocked_cooldown = blocked_cooldown
+        self.probe_timeout = probe_timeout
+        self._by_url = {m.base_url: m for m in self.mirrors}
+        self._lock = threading.Lock()
+
+    def plan(self, timeout):
+        """
+        이번 요청에서 시도할 (미러 URL, 제한 시간) 순서를 정합니다.
+
+        Args:
+            timeout (float): 일반 요청의 제한 시간 (초)
+
+        Returns:
+            list: [(base_url, timeout), ...]
+        """
+        now = time.monotonic()
+        with self._lock:
+            probe, healthy, resting = None, [], []
+            for mirror in self.mirrors:
+                if mirror.state == OPEN and now >= mirror.open_until:
+                    mirror.state = HALF_OPEN
+                # 확인 요청은 하나만 보냄 (결과가 기록되지 않은 채 오래 지나면 다시 보냄)
+                probe_pending = now - mirror.probe_started < self.probe_timeout * 2
+                if mirror.state == HALF_OPEN and probe is None and not probe_pending:
+                    mirror.probe_started = now
+                    probe = mirror
+                elif mirror.state == CLOSED:
+                    healthy.append(mirror)
+                else:
+                    resting.append(mirror)
+
+            healthy.sort(key=lambda m: m.score(timeout))
+            resting.sort(key=lambda m: m.open_until)
+
+            order = [(m.base_url, timeout) for m in healthy] + [(m.base_url, timeout) for m in resting]
+            if probe is not None:
+                order.insert(0, (probe.base_url, min(timeout, self.probe_timeout)))
+            return order
+
+    def record_success(self, base_url, latency):
+        """요청 성공 기록"""
+        with self._lock:
+            mirror = self._by_url[base_url]
+            mirror.latency = latency if mirror.latency is None else (
+                self.alpha * latency + (1 - self.alpha) * mirror.latency
+            )
+            mirror.error_rate *= (1 - self.alpha)
+            mirror.consecutive_failures = 0
+            mirror.successes += 1
+            if mirror.state != CLOSED:
+                print(f"✅ 미러 복구: {base_url}")
+            mirror.state = CLOSED
+            mirror.cooldown = 0.0
+            mirror.probe_started = 0.0
+
+    def record_failure(self, base_url, status=None):
+        """
+        요청 실패 기록
+        429/418(요청 제한)은 IP 단위라 미러 문제가 아니므로 여기로 오지 않고 WeightGovernor가 처리합니다.
+
+        Args:
+            base_url (str): 미러 URL
+            status (int): HTTP 상태 코드 (연결 오류/시간 초과면 None)
+        """
+        now = time.monotonic()
+        with self._lock:
+            mirror = self._by_url[base_url]
+            mirror.error_rate = self.alpha + (1 - self.alpha) * mirror.error_rate
+            mirror.consecutive_failures += 1
+            mirror.failures += 1
+            mirror.last_status = status
+            was_probing, mirror.probe_started = mirror.probe_started > 0, 0.0
+
+            if status == 451:
+                # 지역 차단은 금방 풀리지 않음
+                cooldown = self.blocked_cooldown
+            elif was_probing or mirror.state == HALF_OPEN:
+                cooldown = min(max(mirror.cooldown * 2, self.base_cooldown), self.max_cooldown)
+            elif mirror.consecutive_failures >= self.failure_threshold:
+                cooldown = self.base_cooldown
+            else:
+                return
+
+            mirror.state = OPEN
+            mirror.cooldown = cooldown
+            mirror.open_until = now + cooldown
+            print(f"⚠️ 미러 일시 제외 ({cooldown:.0f}초): {base_url} (상태 {status or '연결 오류'})")
+
+    def best(self):
+        """현재 응답이 가장 좋은 미러 URL (성공 기록이 없으면 첫 미러)"""
+        with self._lock:
+            measured = [m for m in self.mirrors if m.state == CLOSED and m.latency is not None]
+            if not measured:
+                return self.mirrors[0].base_url
+            return min(measured, key=lambda m: m.score(0.0)).base_url
+
+    def snapshot(self):
+        """미러별 상태 (모니터링용)"""
+        now = time.monotonic()
+        with self._lock:
+            return {m.base_url: m.to_dict(now) for m in self.mirrors}
@@ -5,7 +5,10 @@ RSS 피드와 API를 활용하여 안정적으로 뉴스를 수집합니다.
 """
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
+import threading
 import time
 import re
 import feedparser
@@ -13,18 +16,149 @@ import pytz
 
 KST = pytz.timezone("Asia/Seoul")
 
+
+class HostThrottle:
+    """
+    호스트별 요청 간격 제한
+    같은 호스트에는 min_interval초 간격으로만 요청하고, 다른 호스트끼리는 기다리지 않습니다.
+    """
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_allowed = {}  # {host: 다음 요청 가능 시각 (monotonic)}
+
+    def wait(self, url):
+        """url의 호스트에 요청해도 될 때까지 기다립니다."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, 0))
+            self._next_allowed[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class NewsScraper:
     """암호화폐 뉴스 크롤러"""
 
-    def __init__(self):
+    def __init__(self, timeout=10, host_interval=1.0, max_workers=5, state_store=None):
+        """
+        Args:
+            timeout (int): 피드 하나를 받아오는 제한 시간 (초)
+            host_interval (float): 같은 호스트에 대한 최소 요청 간격 (초)
+            max_workers (int): 동시에 받아올 피드 수
+            state_store: 피드별 ETag/Last-Modified를 보관할 저장소
+                         (get_feed_states() / save_feed_states(states)를 가진 객체, 예: Database)
+                         None이면 프로세스 메모리에만 보관
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
-        
-    
-    
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.throttle = HostThrottle(host_interval)
+
+        # 마지막 수집의 소스별 소요 시간 {source: {'count': int, 'seconds': float}}
+        self.last_timings = {}
+
+        # 조건부 요청 상태 {url: {'etag': str, 'last_modified': str, 'item_limit': int}}
+        # 새로 받은 검증자는 뉴스 저장이 끝난 뒤에야 반영 (_pending_states → save_feed_states)
+        self.state_store = state_store
+        self._feed_states = None
+        self._pending_states = {}
+        self._dirty_feeds = set()
+        self._state_lock = threading.Lock()
+        self._run_lock = threading.Lock()  # 수집 한 번의 대기 중 검증자가 다른 수집과 섞이지 않게
+        self.not_modified_count = 0  # 304로 파싱을 건너뛴 횟수
+
+    def _fetch_feed(self, rss_url, limit):
+        """
+        RSS 피드를 세션으로 받아와 파싱합니다. (연결 재사용 + 제한 시간 적용)
+        지난번 응답의 ETag/Last-Modified로 조건부 요청을 보내고,
+        304 Not Modified면 파싱 없이 빈 피드를 반환합니다.
+        지난번보다 많은 항목(limit)을 원하면 304로는 나머지를 받을 수 없으므로 조건 없이 요청합니다.
+
+        Args:
+            rss_url (str): RSS 피드 URL
+            limit (int): 이번에 사용할 항목 수
+
+        Returns:
+            FeedParserDict: 파싱된 피드
+
+        Raises:
+            requests.RequestException: 요청 실패 또는 시간 초과
+        """
+        state = self._feed_state(rss_url)
+        if not state.get('item_limit') or limit > state['item_limit']:
+            state = {}
+        headers = {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+        self.throttle.wait(rss_url)
+        res = self.session.get(rss_url, timeout=self.timeout, headers=headers)
+        if res.status_code == 304:
+            with self._state_lock:
+                self.not_modified_count += 1
+            return feedparser.FeedParserDict(entries=[], status=304)
+        res.raise_for_status()
+
+        feed = feedparser.parse(res.content)
+        self._remember_feed_state(rss_url, res.headers.get('ETag'), res.headers.get('Last-Modified'), limit)
+        return feed
+
+    def _load_feed_states(self):
+        """저장소에서 피드 상태를 처음 한 번만 불러옵니다."""
+        with self._state_lock:
+            if self._feed_states is not None:
+                return
+            self._feed_states = {}
+            if self.state_store is not None:
+                try:
+                    self._feed_states = self.state_store.get_feed_states()
+                except Exception as e:
+                    print(f"피드 상태 불러오기 오류: {e}")
+
+    def _feed_state(self, rss_url):
+        """피드의 조건부 요청 상태"""
+        self._load_feed_states()
+        with self._state_lock:
+            return dict(self._feed_states.get(rss_url, {}))
+
+    def _remember_feed_state(self, rss_url, etag, last_modified, limit):
+        """200 응답의 검증자(ETag/Last-Modified)를 대기 상태로 기억합니다. (save_feed_states 전까지는 쓰지 않음)"""
+        with self._state_lock:
+            self._pending_states[rss_url] = {'etag': etag, 'last_modified': last_modified, 'item_limit': limit}
+
+    def save_feed_states(self, states):
+        """
+        뉴스를 저장한 뒤 그 수집에서 받은 검증자를 반영하고 저장소에 저장합니다. (호출한 스레드의 DB 세션 사용)
+        뉴스 저장에 실패했다면 호출하지 않아야 다음 수집에서 같은 항목을 다시 받습니다.
+
+        Args:
+            states (dict): scrape_all_sources가 뉴스와 함께 돌려준 {url: 피드 상태}
+        """
+        self._load_feed_states()
+        with self._state_lock:
+            for url, state in states.items():
+                if self._feed_states.get(url) != state:
+                    self._feed_states[url] = state
+                    self._dirty_feeds.add(url)
+            if self.state_store is None:
+                self._dirty_feeds.clear()
+                return
+            changed = {url: self._feed_states[url] for url in self._dirty_feeds}
+            self._dirty_feeds.clear()
+        if changed and not self.state_store.save_feed_states(changed):
+            # 저장 실패 시 다음에 다시 시도
+            with self._state_lock:
+                self._dirty_feeds.update(changed)
+
     def to_kst(self, dt):
         if dt is None:
             return datetime.now(KST)
@@ -49,7 +183,7 @@ class NewsScraper:
             # CoinDesk RSS 피드 URL
             rss_url = "https://www.coindesk.com/arc/outboundfeeds/rss/"
 
-            feed = feedparser.parse(rss_url)
+            feed = self._fetch_feed(rss_url, limit)
 
             for entry in feed.entries[:limit]:
                 try:
@@ -97,7 +231,7 @@ class NewsScraper:
             # CryptoNews RSS 피드
             rss_url = "https://cryptonews.com/news/feed/"
 
-            feed = feedparser.parse(rss_url)
+            feed = self._fetch_feed(rss_url, limit)
 
             for entry in feed.entries[:limit]:
                 try:
@@ -143,7 +277,7 @@ class NewsScraper:
             # CoinTelegraph RSS 피드
             rss_url = "https://cointelegraph.com/rss"
 
-            feed = feedparser.parse(rss_url)
+            feed = self._fetch_feed(rss_url, limit)
 
             for entry in feed.entries[:limit]:
                 try:
@@ -189,7 +323,7 @@ class NewsScraper:
             # coinness RSS 피드 URL
             rss_url = "https://www.coinness.com/rss"
 
-            feed = feedparser.parse(rss_url)
+            feed = self._fetch_feed(rss_url, limit)
 
             for entry in feed.entries[:limit]:
                 try:
@@ -240,7 +374,7 @@ class NewsScraper:
             # tokenpost RSS 피드 URL
             rss_url = "https://www.tokenpost.kr/rss"
 
-            feed = feedparser.parse(rss_url)
+            feed = self._fetch_feed(rss_url, limit)
 
             for entry in feed.entries[:limit]:
                 try:
@@ -276,45 +410,60 @@ class NewsScraper:
         return news_list
     
 
-    def scrape_all_sources(self, limit_per_source=10):
+    def scrape_all_sources(self, limit_per_source=10, concurrent=True):
         """
         모든 소스에서 뉴스를 크롤링합니다.
+        기본적으로 소스들을 동시에 받아오므로 전체 소요 시간은 가장 느린 피드 정도입니다.
 
         Args:
             limit_per_source (int): 각 소스별 가져올 뉴스 개수
+            concurrent (bool): False면 소스를 하나씩 순서대로 수집
 
         Returns:
-            list: 모든 뉴스 딕셔너리 리스트
+            tuple: (뉴스 딕셔너리 리스트, 피드 상태)
+                   피드 상태는 뉴스를 저장한 뒤 save_feed_states로 넘겨야 다음 수집에 쓰입니다.
         """
-        all_news = []
+        with self._run_lock:
+            return self._scrape_all_sources(limit_per_source, concurrent)
+
+    def _scrape_all_sources(self, limit_per_source, concurrent):
+        sources = [
+            ('Coinness', self.scrape_coinness),
+            ('TokenPost', self.scrape_tokenpost),
+            ('CoinDesk', self.scrape_coindesk),
+            ('CryptoNews', self.scrape_cryptonews),
+            ('CoinTelegraph', self.scrape_cointelegraph),
+        ]
+
+        def run(scrape):
+            start = time.perf_counter()
+            news = scrape(limit=limit_per_source)
+            return news, time.perf_counter() - start
+
+        started = time.perf_counter()
+        print(f"📰 뉴스 크롤링 시작 ({len(sources)}개 소스, {'동시' if concurrent else '순차'} 수집)...")
+        self._load_feed_states()  # 작업 스레드로 넘어가기 전에 이 스레드의 DB 세션으로 불러옴
+        with self._state_lock:
+            self._pending_states.clear()
+        not_modified_before = self.not_modified_count
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='news') as executor:
+                futures = [executor.submit(run, scrape) for _, scrape in sources]
+                results = [future.result() for future in futures]
+        else:
+            results = [run(scrape) for _, scrape in sources]
 
-        print("📰 Coinness(한국) 크롤링 시작...")
-        Coinness_news = self.scrape_coinness(limit=limit_per_source)
-        all_news.extend(Coinness_news)
-        print(f"   ✓ Coinness: {len(Coinness_news)}개 수집")
-        
-        print("📰 TokenPost(한국) 크롤링 시작...")
-        TokenPost_news = self.scrape_tokenpost(limit=limit_per_source)
-        all_news.extend(TokenPost_news)
-        print(f"   ✓ TokenPost: {len(TokenPost_news)}개 수집")
-
-        print("📰 CoinDesk 크롤링 시작...")
-        coindesk_news = self.scrape_coindesk(limit=limit_per_source)
-        all_news.extend(coindesk_news)
-        print(f"   ✓ CoinDesk: {len(coindesk_news)}개 수집")
-        time.sleep(1)  # 요청 간격 조절
-
-        print("📰 CryptoNews 크롤링 시작...")
-        cryptonews_news = self.scrape_cryptonews(limit=limit_per_source)
-        all_news.extend(cryptonews_news)
-        print(f"   ✓ CryptoNews: {len(cryptonews_news)}개 수집")
-        time.sleep(1)
-
-        print("📰 CoinTelegraph 크롤링 시작...")
-        cointelegraph_news = self.scrape_cointelegraph(limit=limit_per_source)
-        all_news.extend(cointelegraph_news)
-        print(f"   ✓ CoinTelegraph: {len(cointelegraph_news)}개 수집")
-        
+        all_news = []
+        timings = {}
+        for (name, _), (news, seconds) in zip(sources, results):
+            all_news.extend(news)
+            timings[name] = {'count': len(news), 'seconds': round(seconds, 3)}
+            print(f"   ✓ {name}: {len(news)}개 수집 ({seconds:.2f}초)")
+        self.last_timings = timings
+        with self._state_lock:
+            feed_states, self._pending_states = self._pending_states, {}
+        print(f"   ⏱️ 전체 {time.perf_counter() - started:.2f}초 "
+              f"(변경 없음 304: {self.not_modified_count - not_modified_before}개 피드)")
 
         # 중복 제거 (URL 기준)
         seen_urls = set()
@@ -328,7 +477,7 @@ class NewsScraper:
         unique_news.sort(key=lambda x: x['published_at'], reverse=True)
 
         print(f"\n📊 총 {len(unique_news)}개의 고유 뉴스 수집 완료")
-        return unique_news
+        return unique_news, feed_states
 
     def extract_coin_mentions(self, title):
         """
@@ -375,7 +524,7 @@ if __name__ == "__main__":
     scraper = NewsScraper()
 
     # 모든 소스에서 뉴스 수집
-    news_list = scraper.scrape_all_sources(limit_per_source=5)
+    news_list, _ = scraper.scrape_all_sources(limit_per_source=5)
 
     print("\n" + "=" * 60)
     print("수집된 뉴스:")
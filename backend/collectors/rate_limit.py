@@ -0,0 +1,162 @@
+"""
+Binance 요청 가중치(weight) 제한 관리
+Binance는 IP별로 1분당 요청 가중치 합계를 제한하고, 넘으면 429 → 계속 보내면 418(IP 차단)을 돌려줍니다.
+토큰 버킷으로 가중치 예산을 관리하고 응답의 X-MBX-USED-WEIGHT-1M 헤더로 실제 사용량에 맞춥니다.
+
+- 중요한 요청(HIGH, 티커 갱신 등)은 예산이 찰 때까지 잠깐 기다렸다가 보냄
+- 덜 중요한 요청(LOW, 차트 캐시 미스 등)은 예산이 예비분 아래로 떨어지면 보내지 않고 바로 거절
+- 429/418을 받으면 Retry-After 동안 모든 요청을 보내지 않음
+"""
+import threading
+import time
+
+import requests
+
+HIGH = "high"
+LOW = "low"
+
+USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1M"
+
+
+class RateLimited(requests.exceptions.RequestException):
+    """가중치 예산이 부족하거나 차단 중이라 요청을 보내지 않음"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def request_weight(path, params=None):
+    """
+    엔드포인트별 요청 가중치 (Binance 현물 API 문서 기준)
+
+    Args:
+        path (str): API 경로 (예: "/klines")
+        params (dict): 요청 파라미터
+
+    Returns:
+        int: 가중치
+    """
+    params = params or {}
+    if path == "/ticker/24hr":
+        return 2 if "symbol" in params else 80
+    if path == "/ticker/price":
+        return 2 if "symbol" in params else 4
+    if path == "/exchangeInfo":
+        return 20
+    return 2  # /klines 등
+
+
+class WeightGovernor:
+    """요청 가중치 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, limit=5000, window=60.0, low_priority_reserve=0.2, max_wait=5.0):
+        """
+        Args:
+            limit (int): window초 동안 사용할 가중치 상한 (Binance 한도보다 약간 낮게)
+            window (float): 한도 기준 시간 (초)
+            low_priority_reserve (float): LOW 요청이 남겨 둬야 하는 예산 비율 (0~1)
+            max_wait (float): HIGH 요청이 예산을 기다리는 최대 시간 (초)
+        """
+        self.limit = limit
+        self.rate = limit / window
+        self.reserve = limit * low_priority_reserve
+        self.max_wait = max_wait
+
+        self._lock = threading.Lock()
+        self._tokens = float(limit)
+        self._updated = time.monotonic()
+        self._banned_until = 0.0
+
+        self.server_used_weight = None  # 마지막 응답의 X-MBX-USED-WEIGHT-1M
+        self.shed = 0                   # 거절한 LOW 요청 수
+        self.waited = 0                 # 예산을 기다린 HIGH 요청 수
+        self.bans = 0                   # 429/418 응답 수
+
+    def _refill(self, now):
+        self._tokens = min(self.limit, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, weight, priority=HIGH):
+        """
+        요청 하나의 가중치만큼 예산을 사용합니다.
+
+        Args:
+            weight (int): 요청 가중치
+            priority (str): HIGH 또는 LOW
+
+        Raises:
+            RateLimited: 차단 중이거나, LOW 요청인데 예산이 예비분 아래이거나, HIGH 요청이 max_wait 안에 예산을 못 얻음
+        """
+        deadline = time.monotonic() + self.max_wait
+        waited = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._banned_until:
+                    raise RateLimited("Binance 요청 제한으로 차단 중", retry_after=self._banned_until - now)
+
+                self._refill(now)
+                floor = self.reserve if priority == LOW else 0.0
+                if self._tokens - weight >= floor:
+                    self._tokens -= weight
+                    if waited:
+                        self.waited += 1
+                    return
+
+                if priority == LOW:
+                    self.shed += 1
+                    raise RateLimited(
+                        "요청 가중치 예산 부족 (낮은 우선순위 요청 생략)",
+                        retry_after=(floor + weight - self._tokens) / self.rate
+                    )
+                wait = (weight - self._tokens) / self.rate
+
+            if now + wait > deadline:
+                raise RateLimited("요청 가중치 예산 부족", retry_after=wait)
+            waited = True
+            time.sleep(wait)
+
+    def update_from_headers(self, headers):
+        """응답 헤더의 실제 사용량으로 예산을 맞춥니다. (서버가 더 많이 썼다고 하면 줄임)"""
+        used = headers.get(USED_WEIGHT_HEADER)
+        if used is None or not str(used).isdigit():
+            return
+        used = int(used)
+        with self._lock:
+            self.server_used_weight = used
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, self.limit - used)
+
+    def ban(self, status, retry_after=None):
+        """
+        429/418 응답을 받았을 때 Retry-After 동안 요청을 멈춥니다.
+
+        Args:
+            status (int): 429 또는 418
+            retry_after (float): 서버가 알려준 대기 시간 (초, 없으면 429는 60초, 418은 120초)
+        """
+        if retry_after is None:
+            retry_after = 60.0 if status == 429 else 120.0
+        with self._lock:
+            self.bans += 1
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+            self._banned_until = max(self._banned_until, self._updated + retry_after)
+        print(f"🚫 Binance 요청 제한 ({status}): {retry_after:.0f}초 동안 요청 중단")
+
+    def snapshot(self):
+        """현재 예산 상태 (모니터링용)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'limit_per_minute': self.limit,
+                'available': int(self._tokens),
+                'low_priority_reserve': int(self.reserve),
+                'server_used_weight_1m': self.server_used_weight,
+                'banned_for_seconds': round(max(self._banned_until - now, 0), 1),
+                'shed_low_priority': self.shed,
+                'waited_high_priority': self.waited,
+                'bans': self.bans
+            }
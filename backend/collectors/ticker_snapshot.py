@@ -0,0 +1,184 @@
+"""
+티커 스냅샷 서비스
+Binance /ticker/24hr 결과를 백그라운드에서 주기적으로 갱신하고,
+모든 요청이 메모리에 있는 동일한 스냅샷을 읽도록 합니다.
+실시간 스트림이 연결되어 있으면 바뀐 심볼만 apply_updates로 합쳐서 새 스냅샷을 만듭니다.
+접속 중인 클라이언트 수와 관계없이 Binance 호출 횟수가 일정하게 유지됩니다.
+
+리스너(페이지 캐시, 인덱스, SSE 전송)는 별도 스레드 하나에서 실행되며,
+리스너가 도는 동안 들어온 스냅샷은 가장 최신 것 하나만 남겨서 다음에 한 번만 알립니다.
+(스트림 스레드가 리스너 때문에 늦어지지 않고, 밀린 중간 버전은 건너뜀)
+"""
+import threading
+from datetime import datetime
+
+
+class TickerSnapshot:
+    """버전이 붙은 읽기 전용 티커 스냅샷"""
+
+    def __init__(self, version, data, fetched_at):
+        self.version = version        # 갱신될 때마다 1씩 증가
+        self.data = data              # 티커 딕셔너리 튜플 (수정 금지)
+        self.fetched_at = fetched_at  # Binance에서 가져온 시각 (없으면 None)
+
+    def __repr__(self):
+        return f"<TickerSnapshot(version={self.version}, count={len(self.data)}, time={self.fetched_at})>"
+
+
+class TickerSnapshotService:
+    """티커 스냅샷을 갱신하고 공유하는 클래스"""
+
+    def __init__(self, collector, symbols=None):
+        """
+        Args:
+            collector (BinanceCollector): 티커 수집기
+            symbols (iterable): 모니터링할 심볼 목록 (None이면 전체 USDT 코인)
+        """
+        self.collector = collector
+        # 심볼 필터링은 티커마다 in 연산을 하므로 set으로 보관
+        self.symbols = frozenset(symbols) if symbols else None
+        self._snapshot = TickerSnapshot(0, (), None)
+        self._refresh_lock = threading.Lock()
+        self._listeners = []
+
+        # 리스너 알림 (최신 스냅샷 하나만 대기)
+        self._notify_cond = threading.Condition()
+        self._pending = None
+        self._notifier = None
+        self.notified = 0   # 리스너를 실행한 스냅샷 수
+        self.coalesced = 0  # 리스너가 도는 동안 더 새 버전에 밀려 건너뛴 스냅샷 수
+
+    def add_listener(self, callback):
+        """
+        스냅샷이 갱신될 때마다 호출될 콜백을 등록합니다.
+
+        Args:
+            callback (callable): callback(snapshot) 형태의 함수
+        """
+        self._listeners.append(callback)
+
+    def refresh(self, only_if_empty=False):
+        """
+        Binance에서 티커를 가져와 새 스냅샷으로 교체합니다.
+        가져오기에 실패하면 기존 스냅샷을 그대로 유지합니다.
+
+        Args:
+            only_if_empty (bool): True면 아직 스냅샷이 없을 때만 가져옴
+
+        Returns:
+            TickerSnapshot: 현재 스냅샷
+        """
+        with self._refresh_lock:
+            # 락을 기다리는 동안 다른 스레드가 먼저 가져왔을 수 있음
+            if only_if_empty and self._snapshot.version != 0:
+                return self._snapshot
+
+            tickers = self.collector.get_multiple_tickers(self.symbols)
+            if not tickers:
+                print("⚠️ 티커 스냅샷 갱신 실패 - 기존 스냅샷 유지")
+                return self._snapshot
+
+            snapshot = TickerSnapshot(
+                version=self._snapshot.version + 1,
+                data=tuple(tickers),
+                fetched_at=datetime.now()
+            )
+            # 참조 교체는 원자적이므로 읽는 쪽은 락이 필요 없음
+            self._snapshot = snapshot
+
+        self._notify(snapshot)
+        return snapshot
+
+    def apply_updates(self, tickers):
+        """
+        일부 심볼의 새 시세(스트림 변경분)를 현재 스냅샷에 합쳐 새 스냅샷으로 교체합니다.
+        아직 기준 스냅샷이 없으면 무시합니다. (refresh로 전체를 먼저 가져와야 함)
+
+        Args:
+            tickers (list): get_multiple_tickers와 같은 형식의 시세 딕셔너리 리스트
+
+        Returns:
+            TickerSnapshot: 현재 스냅샷
+        """
+        with self._refresh_lock:
+            current = self._snapshot
+            changed = {t["symbol"]: t for t in tickers if self._accepts(t["symbol"])}
+            if current.version == 0 or not changed:
+                return current
+
+            data = [changed.pop(t["symbol"], t) for t in current.data]
+            data.extend(changed.values())  # 스냅샷 이후 새로 상장된 심볼
+            snapshot = TickerSnapshot(
+                version=current.version + 1,
+                data=tuple(data),
+                fetched_at=datetime.now()
+            )
+            self._snapshot = snapshot
+
+        self._notify(snapshot)
+        return snapshot
+
+    def _accepts(self, symbol):
+        """모니터링 대상 심볼인지 확인 (get_multiple_tickers의 필터와 같은 기준)"""
+        if self.symbols is None:
+            return symbol.endswith("USDT")
+        return symbol in self.symbols
+
+    def _notify(self, snapshot):
+        """알림 스레드에 새 스냅샷을 넘깁니다. (아직 처리하지 않은 이전 스냅샷은 버림)"""
+        if not self._listeners:
+            return
+        with self._notify_cond:
+            if self._pending is not None and self._pending.version < snapshot.version:
+                self.coalesced += 1
+            if self._pending is None or self._pending.version < snapshot.version:
+                self._pending = snapshot
+            if self._notifier is None:
+                self._notifier = threading.Thread(target=self._notify_loop, name="ticker-listeners", daemon=True)
+                self._notifier.start()
+            self._notify_cond.notify()
+
+    def _notify_loop(self):
+        while True:
+            with self._notify_cond:
+                while self._pending is None:
+                    self._notify_cond.wait()
+                snapshot, self._pending = self._pending, None
+
+            for callback in self._listeners:
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    print(f"⚠️ 스냅샷 리스너 오류: {e}")
+            self.notified += 1
+
+    def fresh(self, max_age):
+        """
+        max_age초 안에 가져온 스냅샷을 반환합니다. (DB 저장용)
+        refresh가 실패하면 이전 스냅샷을 그대로 두므로, 오래된 시세를 현재 시각으로 저장하지 않도록 확인합니다.
+
+        Args:
+            max_age (float): 허용할 스냅샷 나이 (초)
+
+        Returns:
+            TickerSnapshot: 현재 스냅샷 (아직 없거나 max_age보다 오래됐으면 None)
+        """
+        snapshot = self.get()
+        if snapshot.version == 0 or snapshot.fetched_at is None:
+            return None
+        if (datetime.now() - snapshot.fetched_at).total_seconds() > max_age:
+            return None
+        return snapshot
+
+    def get(self):
+        """
+        현재 스냅샷을 반환합니다.
+        아직 한 번도 갱신되지 않았다면 즉시 한 번 가져옵니다.
+
+        Returns:
+            TickerSnapshot: 현재 스냅샷
+        """
+        snapshot = self._snapshot
+        if snapshot.version == 0:
+            snapshot = self.refresh(only_if_empty=True)
+        return snapshot
@@ -13,6 +13,12 @@ class Config:
 
     # 데이터베이스 설정
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///crypto_dashboard.db')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))        # 연결 풀 크기
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))  # 최대 추가 연결
+
+    # PostgreSQL에서 coin_prices를 월별 파티션 테이블로 생성 (새로 만드는 테이블에만 적용)
+    PG_PARTITION_COIN_PRICES = os.getenv('PG_PARTITION_COIN_PRICES', 'False').lower() == 'true'
+    PG_PARTITION_MONTHS_AHEAD = int(os.getenv('PG_PARTITION_MONTHS_AHEAD', 2))  # 미리 만들 미래 파티션 수
 
     # Flask 설정
     FLASK_ENV = os.getenv('FLASK_ENV', 'development')
@@ -22,6 +28,48 @@ class Config:
     BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
     BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET')
 
+    # Binance 1분당 요청 가중치 예산 (실제 한도 6000보다 낮게 두어 여유를 남김)
+    BINANCE_WEIGHT_LIMIT = int(os.getenv('BINANCE_WEIGHT_LIMIT', 5000))
+
+    # 티커 스냅샷 갱신 주기 (초)
+    TICKER_REFRESH_SECONDS = int(os.getenv('TICKER_REFRESH_SECONDS', 10))
+
+    # 티커 갱신을 헤지 요청을 하는 비동기 클라이언트로 (httpx 필요, 없으면 동기 수집기로 갱신)
+    ASYNC_TICKER_REFRESH = os.getenv('ASYNC_TICKER_REFRESH', 'False').lower() == 'true'
+
+    # 실시간 시세 스트림 (WebSocket) - 연결되어 있는 동안은 티커 REST 폴링을 건너뜀
+    BINANCE_STREAM_ENABLED = os.getenv('BINANCE_STREAM_ENABLED', 'True').lower() == 'true'
+    STREAM_KLINE_SYMBOLS = [
+        s.strip().upper() for s in os.getenv('STREAM_KLINE_SYMBOLS', 'BTCUSDT,ETHUSDT').split(',') if s.strip()
+    ]
+    STREAM_KLINE_INTERVALS = [
+        i.strip() for i in os.getenv('STREAM_KLINE_INTERVALS', '1m,1h').split(',') if i.strip()
+    ]
+
+    # 클라이언트 푸시 (SSE) - 연결마다 서버 스레드 하나를 쓰므로 gunicorn --threads보다 작게
+    SSE_MAX_CLIENTS = int(os.getenv('SSE_MAX_CLIENTS', 16))
+    SSE_HEARTBEAT_SECONDS = float(os.getenv('SSE_HEARTBEAT_SECONDS', 15))
+
+    # 캔들스틱 캐시 상한
+    KLINES_CACHE_MAX_ENTRIES = int(os.getenv('KLINES_CACHE_MAX_ENTRIES', 512))
+    KLINES_CACHE_MAX_BYTES = int(os.getenv('KLINES_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+    # 사전 직렬화 페이지 모드 (스냅샷 갱신 시 자주 쓰는 페이지를 미리 JSON으로 만들어 둠)
+    PRECOMPUTED_PAGES = os.getenv('PRECOMPUTED_PAGES', 'True').lower() == 'true'
+    PRECOMPUTED_PAGE_SIZES = [
+        int(size) for size in os.getenv('PRECOMPUTED_PAGE_SIZES', '20,50,1000').split(',') if size.strip()
+    ]
+
+    # 시세 압축(롤업) 및 보존 기간
+    PRICE_COMPACTION_MINUTES = int(os.getenv('PRICE_COMPACTION_MINUTES', 60))  # 압축 작업 주기 (분)
+    RAW_RETENTION_DAYS = int(os.getenv('RAW_RETENTION_DAYS', 30))              # 원본 시세 보존 (0이면 무기한)
+    HOURLY_RETENTION_DAYS = int(os.getenv('HOURLY_RETENTION_DAYS', 365))       # 시간별 롤업 보존 (0이면 무기한)
+
+    # 뉴스 수집
+    NEWS_FETCH_TIMEOUT = int(os.getenv('NEWS_FETCH_TIMEOUT', 10))                # 피드별 제한 시간 (초)
+    NEWS_HOST_INTERVAL = float(os.getenv('NEWS_HOST_INTERVAL', 1.0))             # 같은 호스트 요청 간격 (초)
+    NEWS_CONCURRENT_FETCH = os.getenv('NEWS_CONCURRENT_FETCH', 'True').lower() == 'true'
+
     @staticmethod
     def get_database_type():
         """현재 사용 중인 데이터베이스 타입 반환"""
@@ -3,12 +3,19 @@
 SQLAlchemy를 사용하여 코인 시세 데이터를 저장합니다.
 PostgreSQL과 SQLite 모두 지원합니다.
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
+from sqlalchemy import create_engine, event, func, select, text, literal, and_, or_, Column, ForeignKey, Index, Integer, String, Float, DateTime, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.types import TIMESTAMP
+from collections import Counter
+from itertools import groupby
 from datetime import datetime, timedelta, timezone
+import csv
+import io
 import os
+import re
 import sys
 
 # config.py 임포트를 위해 부모 디렉토리를 경로에 추가
@@ -22,6 +29,25 @@ except ImportError:
 
 Base = declarative_base()
 
+# 히스토리 다운샘플링 해상도: {이름: (PostgreSQL date_trunc 단위, SQLite strftime 형식)}
+# 구간 경계는 KST 기준 (SQLite는 KST 시각 그대로 저장됨)
+RESOLUTIONS = {
+    '1h': ('hour', '%Y-%m-%d %H:00:00'),
+    '1d': ('day', '%Y-%m-%d 00:00:00'),
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    SQLite 연결마다 WAL 모드 설정
+    WAL 모드에서는 쓰는 중에도 다른 연결이 동시에 읽을 수 있습니다.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
 
 class CoinPrice(Base):
     """코인 시세 데이터 모델"""
@@ -37,10 +63,109 @@ class CoinPrice(Base):
     price_change_percent = Column(Float)
     timestamp = Column(TIMESTAMP(timezone=True), default=lambda: datetime.now(KST), index=True)
 
+    # 심볼별 기간 조회/키셋 페이지네이션용 복합 인덱스
+    __table_args__ = (
+        Index('ix_coin_prices_symbol_timestamp', 'symbol', 'timestamp'),
+    )
+
     def __repr__(self):
         return f"<CoinPrice(symbol={self.symbol}, price={self.current_price}, time={self.timestamp})>"
 
 
+class CoinSymbol(Base):
+    """저장된 코인 심볼 목록 (시세 저장 시 함께 갱신되는 작은 테이블)"""
+    __tablename__ = 'symbols'
+
+    symbol = Column(String(20), primary_key=True)
+    row_count = Column(Integer, nullable=False, default=0)  # coin_prices에 있는 행 수
+    first_seen = Column(TIMESTAMP(timezone=True))  # coin_prices에 남아 있는 가장 오래된 시각 (보존 기간 정리 후 다시 맞춤)
+    last_seen = Column(TIMESTAMP(timezone=True))
+
+    def __repr__(self):
+        return f"<CoinSymbol(symbol={self.symbol}, rows={self.row_count}, last_seen={self.last_seen})>"
+
+
+class _PriceRollup:
+    """시세 롤업(구간 집계) 테이블 공통 컬럼"""
+    symbol = Column(String(20), primary_key=True)
+    bucket = Column(String(19), primary_key=True, index=True)  # 구간 시작 시각 'YYYY-MM-DD HH:MM:SS' (KST)
+    open_price = Column(Float)
+    high_price = Column(Float)
+    low_price = Column(Float)
+    close_price = Column(Float)
+    avg_price = Column(Float)
+    volume = Column(Float)          # 구간 내 24시간 거래량 평균
+    sample_count = Column(Integer)  # 집계된 원본 스냅샷 수
+
+    def to_dict(self):
+        return {
+            'timestamp': self.bucket,
+            'open': self.open_price,
+            'high': self.high_price,
+            'low': self.low_price,
+            'close': self.close_price,
+            'avg': self.avg_price,
+            'volume': self.volume,
+            'count': self.sample_count
+        }
+
+
+class CoinPriceHourly(_PriceRollup, Base):
+    """시간별 시세 롤업"""
+    __tablename__ = 'coin_prices_hourly'
+
+
+class CoinPriceDaily(_PriceRollup, Base):
+    """일별 시세 롤업"""
+    __tablename__ = 'coin_prices_daily'
+
+
+# 해상도별 롤업 테이블
+ROLLUP_MODELS = {
+    '1h': CoinPriceHourly,
+    '1d': CoinPriceDaily,
+}
+
+
+def _bucket_to_datetime(bucket):
+    """구간 문자열을 KST datetime으로 변환"""
+    return datetime.strptime(bucket, '%Y-%m-%d %H:%M:%S').replace(tzinfo=KST)
+
+
+def _datetime_to_bucket(dt):
+    """datetime을 구간 문자열 형식으로 변환 (KST 기준)"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(KST)
+    return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+
+# PostgreSQL 월별 파티션 (coin_prices_YYYYMM, 범위 경계는 KST 월초)
+PARTITION_NAME_PATTERN = re.compile(r'^coin_prices_(\d{4})(\d{2})$')
+PARTITION_SCAN_WINDOW = timedelta(days=31)  # 최근 시세 조회 시 먼저 훑어볼 기간
+
+PARTITIONED_PRICES_DDL = """
+CREATE TABLE IF NOT EXISTS coin_prices (
+    id BIGSERIAL,
+    symbol VARCHAR(20) NOT NULL,
+    current_price DOUBLE PRECISION NOT NULL,
+    high_price DOUBLE PRECISION,
+    low_price DOUBLE PRECISION,
+    volume DOUBLE PRECISION,
+    price_change DOUBLE PRECISION,
+    price_change_percent DOUBLE PRECISION,
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp)
+"""
+
+
+def _month_start(dt, months=0):
+    """dt가 속한 달(KST)의 1일 0시에서 months개월 이동한 시각"""
+    dt = dt.astimezone(KST)
+    month_index = dt.year * 12 + dt.month - 1 + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=KST)
+
+
 class News(Base):
     """뉴스 데이터 모델"""
     __tablename__ = 'news'
@@ -57,6 +182,68 @@ class News(Base):
         return f"<News(title={self.title[:30]}..., source={self.source})>"
 
 
+class NewsCoin(Base):
+    """뉴스-코인 연결 테이블 (뉴스 하나에 관련 코인마다 한 행)"""
+    __tablename__ = 'news_coins'
+
+    news_id = Column(Integer, ForeignKey('news.id', ondelete='CASCADE'), primary_key=True)
+    symbol = Column(String(20), primary_key=True)
+    published_at = Column(TIMESTAMP(timezone=True))  # 정렬용으로 news.published_at을 복사
+
+    # 코인별 최신 뉴스 조회용 인덱스
+    __table_args__ = (
+        Index('ix_news_coins_symbol_published_at', 'symbol', 'published_at', 'news_id'),
+    )
+
+    def __repr__(self):
+        return f"<NewsCoin(news_id={self.news_id}, symbol={self.symbol})>"
+
+
+class FeedState(Base):
+    """RSS 피드별 조건부 요청 상태 (ETag / Last-Modified)"""
+    __tablename__ = 'feed_states'
+
+    url = Column(String(1000), primary_key=True)
+    etag = Column(String(500))
+    last_modified = Column(String(100))
+    item_limit = Column(Integer)  # 이 검증자를 받을 때 사용한 항목 수 (더 많이 원하면 조건부 요청 안 함)
+    updated_at = Column(TIMESTAMP(timezone=True), default=lambda: datetime.now(KST))
+
+    def __repr__(self):
+        return f"<FeedState(url={self.url}, etag={self.etag}, last_modified={self.last_modified})>"
+
+
+def _split_coins(related_coins):
+    """related_coins 문자열('BTC,ETH')을 중복 없는 심볼 리스트로 변환"""
+    if not related_coins:
+        return []
+    symbols = []
+    for symbol in related_coins.split(','):
+        symbol = symbol.strip().upper()
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+# 뉴스 제목 전문 검색 (SQLite: FTS5 외부 콘텐츠 테이블 + 트리거, PostgreSQL: tsvector 식 GIN 인덱스)
+# 한국어 소스도 있으므로 언어별 형태소 처리 없이 단어 단위 + 접두어 검색
+SQLITE_NEWS_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5("
+    "title, content='news', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN "
+    "INSERT INTO news_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news BEGIN "
+    "INSERT INTO news_fts(news_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE OF title ON news BEGIN "
+    "INSERT INTO news_fts(news_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO news_fts(rowid, title) VALUES (new.id, new.title); END",
+]
+POSTGRES_NEWS_FTS_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_news_title_fts ON news USING GIN (to_tsvector('simple', title))",
+]
+SEARCH_TOKEN_PATTERN = re.compile(r'\w+')
+
+
 class Database:
     """데이터베이스 연결 및 관리 클래스 (PostgreSQL & SQLite 지원)"""
 
@@ -79,26 +266,241 @@ class Database:
         if not db_url.startswith(('sqlite:', 'postgresql:', 'mysql:')):
             db_url = f'sqlite:///{db_url}'
 
+        # COPY(copy_expert)가 psycopg2 전용이므로 드라이버를 명시 (SQLAlchemy 2.1부터 기본값이 psycopg 3)
+        if db_url.startswith('postgresql://'):
+            db_url = 'postgresql+psycopg2://' + db_url[len('postgresql://'):]
+
         self.db_url = db_url
 
+        pool_size = Config.DB_POOL_SIZE if Config else 10
+        max_overflow = Config.DB_MAX_OVERFLOW if Config else 20
+
         # PostgreSQL의 경우 pool 설정 추가
         if db_url.startswith('postgresql'):
             self.engine = create_engine(
                 db_url,
                 echo=False,
                 pool_pre_ping=True,  # 연결 상태 확인
-                pool_size=10,         # 연결 풀 크기
-                max_overflow=20       # 최대 추가 연결
+                pool_size=pool_size,         # 연결 풀 크기
+                max_overflow=max_overflow,   # 최대 추가 연결
+                pool_recycle=1800            # 30분 지난 연결은 재생성 (유휴 연결 끊김 방지)
             )
             print(f"[OK] PostgreSQL connected: {db_url.split('@')[1] if '@' in db_url else 'localhost'}")
         else:
-            self.engine = create_engine(db_url, echo=False)
+            # 여러 스레드가 각자 연결을 쓰도록 허용 (세션은 스레드마다 따로 생성됨)
+            self.engine = create_engine(
+                db_url,
+                echo=False,
+                connect_args={'check_same_thread': False}
+            )
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
             print(f"[OK] SQLite connected: {db_url}")
 
         # 테이블 생성
+        # (PostgreSQL 파티션 모드면 coin_prices를 먼저 파티션 테이블로 만들고, create_all은 나머지만 생성)
+        partition_prices = Config.PG_PARTITION_COIN_PRICES if Config else False
+        if db_url.startswith('postgresql') and partition_prices:
+            self._create_partitioned_prices_table()
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        self._ensure_indexes()
+        self._backfill_symbol_registry()
+        self._backfill_news_coins()
+        self.news_search = self._ensure_news_search_index()
+
+        self.partitioned = db_url.startswith('postgresql') and self._is_prices_partitioned()
+        if self.partitioned:
+            self.ensure_price_partitions(Config.PG_PARTITION_MONTHS_AHEAD if Config else 2)
+        elif partition_prices and db_url.startswith('postgresql'):
+            print("⚠️ coin_prices가 이미 일반 테이블로 존재해서 파티션 모드를 적용하지 않습니다.")
+
+        # 스레드(요청/백그라운드 작업)마다 별도의 세션을 사용
+        self.Session = scoped_session(sessionmaker(bind=self.engine))
+
+        # 시세가 저장된 뒤 호출될 콜백 (통계 갱신 등)
+        self._price_listeners = []
+
+    def _ensure_indexes(self):
+        """이미 있던 테이블에는 create_all이 새 인덱스를 만들지 않으므로 따로 생성합니다."""
+        for index in CoinPrice.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
+    def _create_partitioned_prices_table(self):
+        """coin_prices를 월별 범위 파티션 테이블로 생성합니다. (이미 있으면 그대로 둠)"""
+        with self.engine.begin() as conn:
+            conn.execute(text(PARTITIONED_PRICES_DDL))
+            # 범위를 벗어난 시각(마이그레이션한 과거 데이터 등)을 받아 줄 기본 파티션
+            conn.execute(text("CREATE TABLE IF NOT EXISTS coin_prices_default PARTITION OF coin_prices DEFAULT"))
+
+    def _is_prices_partitioned(self):
+        """coin_prices가 PostgreSQL 파티션 테이블인지 확인합니다."""
+        with self.engine.connect() as conn:
+            relkind = conn.execute(
+                text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+                {'table': CoinPrice.__tablename__}
+            ).scalar()
+        return relkind == 'p'
+
+    def ensure_price_partitions(self, months_ahead=2):
+        """
+        이번 달부터 months_ahead개월 뒤까지의 월별 파티션을 미리 만들어 둡니다.
+        파티션마다 별도 트랜잭션으로 만들어서 한 달이 실패해도 나머지 달은 만들어집니다.
+
+        Args:
+            months_ahead (int): 미리 만들 미래 파티션 개수
+
+        Returns:
+            list: 확인/생성한 파티션 이름 리스트 (실패한 달 제외)
+        """
+        now = datetime.now(KST)
+        names = []
+        for i in range(months_ahead + 1):
+            lower, upper = _month_start(now, i), _month_start(now, i + 1)
+            name = f"coin_prices_{lower:%Y%m}"
+            try:
+                with self.engine.begin() as conn:
+                    self._create_price_partition(conn, name, lower, upper)
+                names.append(name)
+            except Exception as e:
+                print(f"⚠️ 시세 파티션 생성 실패 ({name}): {e}")
+        return names
+
+    def _create_price_partition(self, conn, name, lower, upper):
+        """
+        월별 파티션 하나를 만듭니다.
+        그 달의 행이 이미 기본 파티션에 들어가 있으면 PostgreSQL이 생성을 거부하므로,
+        기본 파티션을 잠깐 떼어 낸 뒤 파티션을 만들고 그 달의 행을 옮겨 담고 다시 붙입니다.
+        """
+        if conn.execute(text("SELECT to_regclass(:name)"), {'name': name}).scalar() is not None:
+            return
+
+        # 파티션 경계는 바인드 변수를 쓸 수 없어 리터럴로 넣음 (직접 만든 값만 사용)
+        create = text(
+            f"CREATE TABLE {name} PARTITION OF coin_prices "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        bounds = {'lower': lower, 'upper': upper}
+        in_default = conn.execute(text(
+            "SELECT 1 FROM coin_prices_default WHERE timestamp >= :lower AND timestamp < :upper LIMIT 1"
+        ), bounds).first() is not None
+        if not in_default:
+            conn.execute(create)
+            return
+
+        print(f"🔧 기본 파티션의 행을 {name}로 옮기는 중...")
+        conn.execute(text("ALTER TABLE coin_prices DETACH PARTITION coin_prices_default"))
+        conn.execute(create)
+        conn.execute(text(
+            f"INSERT INTO {name} SELECT * FROM coin_prices_default "
+            "WHERE timestamp >= :lower AND timestamp < :upper"
+        ), bounds)
+        conn.execute(text(
+            "DELETE FROM coin_prices_default WHERE timestamp >= :lower AND timestamp < :upper"
+        ), bounds)
+        conn.execute(text("ALTER TABLE coin_prices ATTACH PARTITION coin_prices_default DEFAULT"))
+
+    def _price_partitions(self):
+        """
+        월별 파티션 목록 (기본 파티션 제외)
+
+        Returns:
+            list: (파티션 이름, 하한, 상한) 튜플 리스트 (오래된 것부터)
+        """
+        names = self.session.execute(text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ), {'table': CoinPrice.__tablename__}).scalars().all()
+
+        partitions = []
+        for name in names:
+            match = PARTITION_NAME_PATTERN.match(name)
+            if match:
+                lower = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=KST)
+                partitions.append((name, lower, _month_start(lower, 1)))
+        return sorted(partitions, key=lambda p: p[1])
+
+    def _backfill_symbol_registry(self):
+        """symbols 테이블이 비어 있으면 기존 coin_prices로 한 번만 채웁니다. (기존 DB 호환)"""
+        with self.engine.begin() as conn:
+            if conn.execute(select(CoinSymbol.symbol).limit(1)).first() is not None:
+                return
+            conn.execute(insert(CoinSymbol).from_select(
+                ['symbol', 'row_count', 'first_seen', 'last_seen'],
+                select(
+                    CoinPrice.symbol,
+                    func.count(CoinPrice.id),
+                    func.min(CoinPrice.timestamp),
+                    func.max(CoinPrice.timestamp)
+                ).group_by(CoinPrice.symbol)
+            ))
+
+    def _backfill_news_coins(self):
+        """news_coins가 비어 있으면 기존 뉴스의 related_coins로 한 번만 채웁니다. (기존 DB 호환)"""
+        with self.engine.begin() as conn:
+            if conn.execute(select(NewsCoin.news_id).limit(1)).first() is not None:
+                return
+            news_rows = conn.execute(
+                select(News.id, News.related_coins, News.published_at)
+                .where(News.related_coins.isnot(None), News.related_coins != '')
+            ).all()
+            links = [
+                {'news_id': news_id, 'symbol': symbol, 'published_at': published_at}
+                for news_id, related_coins, published_at in news_rows
+                for symbol in _split_coins(related_coins)
+            ]
+            if links:
+                conn.execute(insert(NewsCoin), links)
+
+    def _ensure_news_search_index(self):
+        """
+        뉴스 제목 전문 검색 인덱스를 준비합니다.
+
+        Returns:
+            bool: 전문 검색 사용 가능 여부 (False면 LIKE 검색으로 대체)
+        """
+        try:
+            with self.engine.begin() as conn:
+                if self.db_url.startswith('postgresql'):
+                    for ddl in POSTGRES_NEWS_FTS_DDL:
+                        conn.execute(text(ddl))
+                    return True
+
+                exists = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'"
+                )).first() is not None
+                for ddl in SQLITE_NEWS_FTS_DDL:
+                    conn.execute(text(ddl))
+                if not exists:
+                    # 기존 뉴스를 한 번에 색인
+                    conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
+            return True
+        except Exception as e:
+            print(f"⚠️ 뉴스 전문 검색 인덱스를 만들 수 없어 LIKE 검색을 사용합니다: {e}")
+            return False
+
+    @property
+    def session(self):
+        """현재 스레드의 세션"""
+        return self.Session()
+
+    def remove_session(self):
+        """현재 스레드의 세션을 정리합니다. (요청/작업이 끝날 때 호출)"""
+        self.Session.remove()
+
+    def add_price_listener(self, callback):
+        """
+        시세가 저장될 때마다 호출될 콜백을 등록합니다.
+
+        Args:
+            callback (callable): callback(symbols, timestamp) 형태의 함수
+        """
+        self._price_listeners.append(callback)
+
+    def _notify_prices_saved(self, symbols, timestamp):
+        for callback in self._price_listeners:
+            try:
+                callback(symbols, timestamp)
+            except Exception as e:
+                print(f"⚠️ 시세 저장 리스너 오류: {e}")
 
     def add_coin_price(self, coin_data):
         """
@@ -108,6 +510,7 @@ class Database:
             coin_data (dict): 코인 시세 정보 딕셔너리
         """
         try:
+            now = datetime.now(KST)
             price_record = CoinPrice(
                 symbol=coin_data['symbol'],
                 current_price=coin_data['current_price'],
@@ -115,43 +518,545 @@ class Database:
                 low_price=coin_data.get('low_price'),
                 volume=coin_data.get('volume'),
                 price_change=coin_data.get('price_change'),
-                price_change_percent=coin_data.get('price_change_percent')
+                price_change_percent=coin_data.get('price_change_percent'),
+                timestamp=now
             )
             self.session.add(price_record)
+            self._upsert_symbols([coin_data['symbol']], now)
             self.session.commit()
+            self._notify_prices_saved([coin_data['symbol']], now)
             return True
         except Exception as e:
             print(f"데이터 저장 오류: {e}")
             self.session.rollback()
             return False
 
-    def get_recent_prices(self, symbol, limit=100):
+    def add_coin_prices(self, coin_list):
+        """
+        여러 코인 시세를 한 트랜잭션으로 일괄 저장합니다.
+        SQLite는 executemany, PostgreSQL은 COPY를 사용합니다.
+        시세 행과 심볼 레지스트리(symbols)는 같은 commit으로 저장되고, 실패하면 둘 다 롤백됩니다.
+
+        Args:
+            coin_list (list): 코인 시세 정보 딕셔너리 리스트
+
+        Returns:
+            int: 저장된 행 수 (실패 시 0)
+        """
+        # 같은 수집 시점의 데이터이므로 timestamp를 하나로 통일
+        now = datetime.now(KST)
+        rows = [{
+            'symbol': coin['symbol'],
+            'current_price': coin['current_price'],
+            'high_price': coin.get('high_price'),
+            'low_price': coin.get('low_price'),
+            'volume': coin.get('volume'),
+            'price_change': coin.get('price_change'),
+            'price_change_percent': coin.get('price_change_percent'),
+            'timestamp': now
+        } for coin in coin_list]
+
+        if not rows:
+            return 0
+
+        symbols = [row['symbol'] for row in rows]
+        try:
+            if self.db_url.startswith('postgresql'):
+                self._copy_coin_prices(rows)
+            else:
+                self.session.execute(insert(CoinPrice), rows)
+            self._upsert_symbols(symbols, now)
+            self.session.commit()
+            self._notify_prices_saved(symbols, now)
+            return len(rows)
+        except Exception as e:
+            print(f"일괄 저장 오류: {e}")
+            self.session.rollback()
+            return 0
+
+    def _upsert_symbols(self, symbols, timestamp):
+        """
+        심볼 레지스트리를 갱신합니다. (새 심볼은 추가, 기존 심볼은 행 수/last_seen 갱신)
+        commit은 호출한 쪽에서 합니다.
+        """
+        stmt = self._dialect_insert(CoinSymbol)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['symbol'],
+            set_={
+                'row_count': CoinSymbol.row_count + stmt.excluded.row_count,
+                'last_seen': stmt.excluded.last_seen
+            }
+        )
+        self.session.execute(stmt, [{
+            'symbol': symbol,
+            'row_count': count,
+            'first_seen': timestamp,
+            'last_seen': timestamp
+        } for symbol, count in Counter(symbols).items()])
+
+    def _copy_coin_prices(self, rows):
+        """
+        PostgreSQL COPY로 코인 시세를 저장합니다. (psycopg2 전용)
+        세션과 같은 DB 연결에서 실행하므로 commit/rollback은 호출한 쪽의 세션 트랜잭션을 따릅니다.
+        """
+        columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(['' if row[c] is None else row[c] for c in columns])
+        buffer.seek(0)
+
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {CoinPrice.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+
+    def get_recent_prices(self, symbol, limit=100, before=None, after=None, start=None, end=None):
         """
         특정 코인의 최근 시세 데이터를 조회합니다.
+        (symbol, timestamp) 복합 인덱스를 타는 키셋 페이지네이션으로, 깊은 페이지도 OFFSET 없이 조회합니다.
 
         Args:
             symbol (str): 코인 심볼
             limit (int): 조회할 데이터 개수
+            before (tuple): (timestamp, id) 커서 - 이보다 오래된 데이터
+            after (tuple): (timestamp, id) 커서 - 이보다 새로운 데이터
+            start (datetime): 이 시각 이후 (포함)
+            end (datetime): 이 시각 이전 (미포함)
 
         Returns:
-            list: CoinPrice 객체 리스트
+            list: CoinPrice 객체 리스트 (최신순)
         """
-        return self.session.query(CoinPrice)\
-            .filter(CoinPrice.symbol == symbol)\
-            .order_by(CoinPrice.timestamp.desc())\
-            .limit(limit)\
+        if self.partitioned and start is None and after is None:
+            # 파티션 테이블: 최근 한 달 범위부터 조회해서 오래된 파티션은 건드리지 않음
+            # (부족할 때만 범위 없이 다시 조회)
+            anchor = before[0] if before is not None else datetime.now(KST)
+            rows = self.get_recent_prices(
+                symbol, limit, before=before, start=anchor - PARTITION_SCAN_WINDOW, end=end
+            )
+            if len(rows) == limit:
+                return rows
+
+        query = self.session.query(CoinPrice).filter(CoinPrice.symbol == symbol)
+
+        if start is not None:
+            query = query.filter(CoinPrice.timestamp >= start)
+        if end is not None:
+            query = query.filter(CoinPrice.timestamp < end)
+
+        if before is not None:
+            ts, row_id = before
+            query = query.filter(or_(
+                CoinPrice.timestamp < ts,
+                and_(CoinPrice.timestamp == ts, CoinPrice.id < row_id)
+            ))
+        if after is not None:
+            ts, row_id = after
+            query = query.filter(or_(
+                CoinPrice.timestamp > ts,
+                and_(CoinPrice.timestamp == ts, CoinPrice.id > row_id)
+            ))
+            # 커서 바로 다음 구간부터 limit개를 가져온 뒤 최신순으로 뒤집음
+            rows = query.order_by(CoinPrice.timestamp.asc(), CoinPrice.id.asc()).limit(limit).all()
+            return rows[::-1]
+
+        return query.order_by(CoinPrice.timestamp.desc(), CoinPrice.id.desc()).limit(limit).all()
+
+    def _bucket_expr(self, resolution):
+        """시각을 해상도 구간의 시작 시각 문자열('YYYY-MM-DD HH:MM:SS')로 바꾸는 SQL 식"""
+        unit, sqlite_format = RESOLUTIONS[resolution]
+        if self.db_url.startswith('postgresql'):
+            local = func.timezone('Asia/Seoul', CoinPrice.timestamp)
+            return func.to_char(func.date_trunc(unit, local), 'YYYY-MM-DD HH24:MI:SS')
+        return func.strftime(sqlite_format, CoinPrice.timestamp)
+
+    def pick_resolution(self, start=None, end=None):
+        """
+        조회 구간에 맞는 데이터 단위를 고릅니다.
+        원본 보존 기간(RAW_RETENTION_DAYS)보다 오래된 구간은 원본이 지워졌으므로 롤업으로 대신합니다.
+
+        Args:
+            start (datetime): 조회 시작 시각
+            end (datetime): 조회 끝 시각
+
+        Returns:
+            str: None(원본으로 충분), '1h'(시간별 롤업) 또는 '1d'(시간별 롤업 보존 기간도 지난 경우)
+        """
+        raw_days = Config.RAW_RETENTION_DAYS if Config else 30
+        hourly_days = Config.HOURLY_RETENTION_DAYS if Config else 365
+        oldest = start if start is not None else end
+        if not raw_days or oldest is None:
+            return None
+
+        now = datetime.now(KST)
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=KST)
+        if oldest >= now - timedelta(days=raw_days):
+            return None
+        if hourly_days and oldest < now - timedelta(days=hourly_days):
+            return '1d'
+        return '1h'
+
+    def get_price_buckets(self, symbol, resolution, limit=500, start=None, end=None):
+        """
+        시세를 시간 구간별로 묶은 OHLC/평균을 조회합니다.
+        이미 압축된 구간은 롤업 테이블에서, 그 이후 최근 구간은 원본에서 집계해 이어 붙입니다.
+
+        Args:
+            symbol (str): 코인 심볼
+            resolution (str): 구간 크기 (RESOLUTIONS의 키, None이면 조회 구간에 맞춰 pick_resolution으로 고름)
+            limit (int): 최근 몇 개 구간을 조회할지
+            start (datetime): 이 시각 이후 (포함)
+            end (datetime): 이 시각 이전 (미포함)
+
+        Returns:
+            list: 구간 딕셔너리 리스트 (오래된 것부터)
+                  open/close는 구간 첫/마지막 스냅샷 가격, volume은 구간 내 24시간 거래량 평균
+        """
+        resolution = resolution or self.pick_resolution(start, end) or '1h'
+        model = ROLLUP_MODELS[resolution]
+        watermark = self._rollup_watermark(model)
+
+        # 워터마크 구간부터는 원본에서 집계 (아직 압축 중이거나 진행 중인 구간)
+        raw_start = start
+        if watermark is not None:
+            watermark_dt = _bucket_to_datetime(watermark)
+            raw_start = max(start, watermark_dt) if start is not None else watermark_dt
+        if end is not None and raw_start is not None and raw_start >= end:
+            buckets = []
+        else:
+            buckets = self._aggregate_raw(resolution, symbol=symbol, start=raw_start, end=end, limit=limit)
+            for bucket in buckets:
+                del bucket['symbol']
+
+        # 나머지는 롤업 테이블에서
+        if watermark is not None and len(buckets) < limit:
+            query = self.session.query(model).filter(model.symbol == symbol, model.bucket < watermark)
+            if start is not None:
+                query = query.filter(model.bucket >= _datetime_to_bucket(start))
+            if end is not None:
+                query = query.filter(model.bucket < _datetime_to_bucket(end))
+            rollups = query.order_by(model.bucket.desc()).limit(limit - len(buckets)).all()
+            buckets = [row.to_dict() for row in reversed(rollups)] + buckets
+
+        return buckets
+
+    def _aggregate_raw(self, resolution, symbol=None, start=None, end=None, limit=None):
+        """
+        원본 coin_prices를 구간별로 집계합니다. (GROUP BY는 DB에서 수행)
+
+        Args:
+            resolution (str): 구간 크기
+            symbol (str): 코인 심볼 (None이면 모든 심볼, 결과에 symbol 포함)
+            start (datetime): 이 시각 이후 (포함)
+            end (datetime): 이 시각 이전 (미포함)
+            limit (int): 심볼을 지정했을 때 최근 몇 개 구간만 조회할지
+
+        Returns:
+            list: 구간 딕셔너리 리스트 (오래된 것부터)
+        """
+        bucket = self._bucket_expr(resolution).label('bucket')
+        query = self.session.query(
+            CoinPrice.symbol,
+            bucket,
+            func.min(CoinPrice.timestamp).label('first_ts'),
+            func.max(CoinPrice.timestamp).label('last_ts'),
+            func.max(CoinPrice.current_price).label('high'),
+            func.min(CoinPrice.current_price).label('low'),
+            func.avg(CoinPrice.current_price).label('avg'),
+            func.avg(CoinPrice.volume).label('volume'),
+            func.count(CoinPrice.id).label('count')
+        )
+        if symbol is not None:
+            query = query.filter(CoinPrice.symbol == symbol)
+        if start is not None:
+            query = query.filter(CoinPrice.timestamp >= start)
+        if end is not None:
+            query = query.filter(CoinPrice.timestamp < end)
+
+        query = query.group_by(CoinPrice.symbol, bucket).order_by(bucket.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        rows = query.all()
+        rows.reverse()
+        if not rows:
+            return []
+
+        # 시가/종가: 구간의 첫/마지막 시각에 저장된 가격을 인덱스로 한 번에 조회
+        # (일괄 저장은 모든 심볼이 같은 timestamp를 쓰므로 시각 집합이 작음)
+        edges = sorted({row.first_ts for row in rows} | {row.last_ts for row in rows})
+        edge_prices = {}
+        for i in range(0, len(edges), 500):  # SQLite 바인드 변수 개수 제한 대비
+            edge_query = self.session.query(CoinPrice.symbol, CoinPrice.timestamp, CoinPrice.current_price)\
+                .filter(CoinPrice.timestamp.in_(edges[i:i + 500]))
+            if symbol is not None:
+                edge_query = edge_query.filter(CoinPrice.symbol == symbol)
+            edge_prices.update(((sym, ts), price) for sym, ts, price in edge_query.all())
+
+        return [{
+            'symbol': row.symbol,
+            'timestamp': row.bucket,
+            'open': edge_prices.get((row.symbol, row.first_ts)),
+            'high': row.high,
+            'low': row.low,
+            'close': edge_prices.get((row.symbol, row.last_ts)),
+            'avg': row.avg,
+            'volume': row.volume,
+            'count': row.count
+        } for row in rows]
+
+    def _rollup_watermark(self, model):
+        """롤업 테이블에 있는 가장 최근 구간 (없으면 None)"""
+        return self.session.query(func.max(model.bucket)).scalar()
+
+    def compact_prices(self, raw_retention_days=30, hourly_retention_days=365):
+        """
+        원본 시세를 시간별/일별 롤업 테이블로 압축하고, 보존 기간이 지난 데이터를 정리합니다.
+        완료된 구간만 압축하며, 아직 롤업되지 않은 데이터는 삭제하지 않습니다.
+
+        Args:
+            raw_retention_days (int): 원본 시세 보존 일수 (0이면 삭제 안 함)
+            hourly_retention_days (int): 시간별 롤업 보존 일수 (0이면 삭제 안 함)
+
+        Returns:
+            dict: 작업 결과 (실패 시 None)
+        """
+        now = datetime.now(KST)
+        hour_end = now.replace(minute=0, second=0, microsecond=0)
+        day_end = hour_end.replace(hour=0)
+
+        try:
+            hourly = self._rollup_hourly(hour_end)
+            daily = self._rollup_daily(day_end)
+
+            pruned_raw = 0
+            if raw_retention_days:
+                pruned_raw = self._prune_raw_prices(now - timedelta(days=raw_retention_days))
+
+            pruned_hourly = 0
+            if hourly_retention_days:
+                cutoff = _datetime_to_bucket(now - timedelta(days=hourly_retention_days))
+                daily_watermark = self._rollup_watermark(CoinPriceDaily)
+                if daily_watermark is not None:
+                    pruned_hourly = self.session.query(CoinPriceHourly)\
+                        .filter(CoinPriceHourly.bucket < min(cutoff, daily_watermark))\
+                        .delete(synchronize_session=False)
+
+            self.session.commit()
+            return {
+                'hourly_buckets': hourly,
+                'daily_buckets': daily,
+                'pruned_raw_rows': pruned_raw,
+                'pruned_hourly_rows': pruned_hourly
+            }
+        except Exception as e:
+            print(f"시세 압축 오류: {e}")
+            self.session.rollback()
+            return None
+
+    def _rollup_hourly(self, end):
+        """원본 → 시간별 롤업 (마지막 구간부터 다시 계산하므로 반복 실행해도 안전)"""
+        watermark = self._rollup_watermark(CoinPriceHourly)
+        start = _bucket_to_datetime(watermark) if watermark is not None else None
+        rows = self._aggregate_raw('1h', start=start, end=end)
+        self._upsert_rollups(CoinPriceHourly, rows)
+        return len(rows)
+
+    def _rollup_daily(self, end):
+        """시간별 롤업 → 일별 롤업"""
+        watermark = self._rollup_watermark(CoinPriceDaily)
+        query = self.session.query(CoinPriceHourly)\
+            .filter(CoinPriceHourly.bucket < _datetime_to_bucket(end))
+        if watermark is not None:
+            query = query.filter(CoinPriceHourly.bucket >= watermark)
+        hours = query.order_by(CoinPriceHourly.symbol, CoinPriceHourly.bucket).yield_per(1000)
+
+        rows = []
+        for (symbol, day), group in groupby(hours, key=lambda h: (h.symbol, h.bucket[:10])):
+            group = list(group)
+            count = sum(h.sample_count for h in group)
+            volumes = [(h.volume, h.sample_count) for h in group if h.volume is not None]
+            volume_count = sum(n for _, n in volumes)
+            rows.append({
+                'symbol': symbol,
+                'timestamp': f"{day} 00:00:00",
+                'open': group[0].open_price,
+                'high': max(h.high_price for h in group),
+                'low': min(h.low_price for h in group),
+                'close': group[-1].close_price,
+                'avg': sum(h.avg_price * h.sample_count for h in group) / count,
+                'volume': sum(v * n for v, n in volumes) / volume_count if volume_count else None,
+                'count': count
+            })
+        self._upsert_rollups(CoinPriceDaily, rows)
+        return len(rows)
+
+    def _upsert_rollups(self, model, rows):
+        """구간 집계 결과를 롤업 테이블에 저장합니다. (같은 구간은 덮어씀, commit은 호출한 쪽에서)"""
+        if not rows:
+            return
+        stmt = self._dialect_insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['symbol', 'bucket'],
+            set_={column: stmt.excluded[column] for column in (
+                'open_price', 'high_price', 'low_price', 'close_price', 'avg_price', 'volume', 'sample_count'
+            )}
+        )
+        self.session.execute(stmt, [{
+            'symbol': row['symbol'],
+            'bucket': row['timestamp'],
+            'open_price': row['open'],
+            'high_price': row['high'],
+            'low_price': row['low'],
+            'close_price': row['close'],
+            'avg_price': row['avg'],
+            'volume': row['volume'],
+            'sample_count': row['count']
+        } for row in rows])
+
+    def _prune_raw_prices(self, cutoff):
+        """
+        cutoff 이전의 원본 시세를 삭제하고 심볼 레지스트리의 행 수를 맞춥니다.
+        시간별 롤업에 반영된 구간까지만 삭제합니다.
+        파티션 테이블이면 DELETE 대신 기간이 다 지난 월별 파티션을 통째로 DROP합니다.
+        """
+        watermark = self._rollup_watermark(CoinPriceHourly)
+        if watermark is None:
+            return 0
+        cutoff = min(cutoff, _bucket_to_datetime(watermark))
+
+        if self.partitioned:
+            return self._drop_price_partitions(cutoff)
+
+        counts = self.session.query(CoinPrice.symbol, func.count(CoinPrice.id))\
+            .filter(CoinPrice.timestamp < cutoff)\
+            .group_by(CoinPrice.symbol)\
             .all()
+        if not counts:
+            return 0
+
+        self.session.query(CoinPrice).filter(CoinPrice.timestamp < cutoff).delete(synchronize_session=False)
+        self._refresh_symbol_registry(counts)
+        return sum(count for _, count in counts)
+
+    def _drop_price_partitions(self, cutoff):
+        """상한이 cutoff 이전인 월별 파티션을 DROP하고, 기본 파티션의 오래된 행만 DELETE합니다."""
+        pruned = 0
+        for name, lower, upper in self._price_partitions():
+            if upper > cutoff:
+                break
+            counts = self.session.execute(text(f"SELECT symbol, count(*) FROM {name} GROUP BY symbol")).all()
+            self.session.execute(text(f"DROP TABLE {name}"))
+            self._refresh_symbol_registry(counts)
+            pruned += sum(count for _, count in counts)
+            print(f"🗑️ 파티션 삭제: {name} ({lower:%Y-%m})")
+
+        counts = self.session.execute(text(
+            "SELECT symbol, count(*) FROM coin_prices_default WHERE timestamp < :cutoff GROUP BY symbol"
+        ), {'cutoff': cutoff}).all()
+        if counts:
+            self.session.execute(text("DELETE FROM coin_prices_default WHERE timestamp < :cutoff"), {'cutoff': cutoff})
+            self._refresh_symbol_registry(counts)
+            pruned += sum(count for _, count in counts)
+        return pruned
+
+    def _refresh_symbol_registry(self, counts):
+        """
+        시세를 지운 심볼의 row_count/first_seen을 coin_prices에서 다시 계산합니다.
+        (증분 카운터가 어긋나 있어도 실제 행 기준으로 바로잡힘)
+        원본 시세가 하나도 남지 않은 심볼만 레지스트리에서 지웁니다. (commit은 호출한 쪽에서)
+
+        Args:
+            counts (list): 삭제한 (심볼, 행 수) 리스트
+        """
+        symbols = CoinSymbol.__table__
+        affected = [symbol for symbol, _ in counts]
+        # (symbol, timestamp) 인덱스로 심볼별로만 훑음
+        remaining = select(func.count()).select_from(CoinPrice.__table__)\
+            .where(CoinPrice.symbol == symbols.c.symbol)\
+            .scalar_subquery()
+        oldest = select(func.min(CoinPrice.timestamp))\
+            .where(CoinPrice.symbol == symbols.c.symbol)\
+            .scalar_subquery()
+        self.session.execute(
+            symbols.update().where(symbols.c.symbol.in_(affected)).values(row_count=remaining, first_seen=oldest)
+        )
+        self.session.execute(
+            symbols.delete().where(symbols.c.symbol.in_(affected), symbols.c.first_seen.is_(None))
+        )
 
     def get_all_symbols(self):
         """
         데이터베이스에 저장된 모든 코인 심볼을 조회합니다.
+        (coin_prices 전체를 훑지 않고 심볼 레지스트리에서 조회)
 
         Returns:
             list: 코인 심볼 리스트
         """
-        result = self.session.query(CoinPrice.symbol).distinct().all()
+        result = self.session.query(CoinSymbol.symbol).order_by(CoinSymbol.symbol).all()
         return [r[0] for r in result]
 
+    def get_symbol_stats(self):
+        """
+        심볼별 행 수와 처음/마지막 저장 시각을 심볼 레지스트리에서 조회합니다.
+
+        Returns:
+            list: (symbol, count, first_timestamp, last_timestamp) 튜플 리스트
+        """
+        return self.session.query(
+            CoinSymbol.symbol,
+            CoinSymbol.row_count,
+            CoinSymbol.first_seen,
+            CoinSymbol.last_seen
+        ).all()
+
+    def get_news_count(self):
+        """저장된 뉴스 개수를 조회합니다."""
+        return self.session.query(func.count(News.id)).scalar()
+
+    def get_table_sizes(self):
+        """
+        테이블별 디스크 사용량(바이트)을 조회합니다.
+        SQLite에서 dbstat을 쓸 수 없으면 전체 DB 크기만 반환합니다.
+
+        Returns:
+            dict: {테이블명: 바이트 수}
+        """
+        tables = [
+            CoinPrice.__tablename__, CoinPriceHourly.__tablename__, CoinPriceDaily.__tablename__, News.__tablename__
+        ]
+        sizes = {}
+        try:
+            if self.db_url.startswith('postgresql'):
+                for table in tables:
+                    # 파티션 테이블은 부모 크기가 0이므로 파티션 크기를 합산
+                    sizes[table] = self.session.execute(text(
+                        "SELECT pg_total_relation_size(to_regclass(:table)) + COALESCE(("
+                        "SELECT SUM(pg_total_relation_size(inhrelid)) FROM pg_inherits "
+                        "WHERE inhparent = to_regclass(:table)), 0)"
+                    ), {'table': table}).scalar()
+            else:
+                try:
+                    for table in tables:
+                        sizes[table] = self.session.execute(
+                            text("SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name = :table"),
+                            {'table': table}
+                        ).scalar()
+                except Exception:
+                    # dbstat이 없는 SQLite 빌드
+                    self.session.rollback()
+                    page_count = self.session.execute(text("PRAGMA page_count")).scalar()
+                    page_size = self.session.execute(text("PRAGMA page_size")).scalar()
+                    sizes = {'database': page_count * page_size}
+        except Exception as e:
+            print(f"테이블 크기 조회 오류: {e}")
+            self.session.rollback()
+        return sizes
+
     def add_news(self, news_data):
         """
         뉴스 데이터를 데이터베이스에 추가합니다.
@@ -182,6 +1087,11 @@ class Database:
                 related_coins=news_data.get('related_coins')
             )
             self.session.add(news_record)
+            self.session.flush()  # news_coins에 넣을 id 확보
+            self.session.add_all([
+                NewsCoin(news_id=news_record.id, symbol=symbol, published_at=pub)
+                for symbol in _split_coins(news_record.related_coins)
+            ])
             self.session.commit()
             return True
         except Exception as e:
@@ -189,6 +1099,97 @@ class Database:
             self.session.rollback()
             return False
 
+    def add_news_many(self, news_list):
+        """
+        여러 뉴스를 한 트랜잭션으로 일괄 저장합니다.
+        이미 있는 URL은 IN 쿼리 한 번으로 걸러내고, 나머지는 한 번에 INSERT 합니다.
+
+        Args:
+            news_list (list): 뉴스 정보 딕셔너리 리스트
+
+        Returns:
+            tuple: (저장된 개수, 중복으로 건너뛴 개수) - 저장에 실패하면 None
+        """
+        # 배치 안의 중복 URL 제거
+        unique = {}
+        for news_data in news_list:
+            url = news_data.get('url')
+            if url and url not in unique:
+                unique[url] = news_data
+
+        if not unique:
+            return 0, len(news_list)
+
+        try:
+            existing = {
+                row[0] for row in
+                self.session.query(News.url).filter(News.url.in_(list(unique))).all()
+            }
+
+            rows = []
+            for url, news_data in unique.items():
+                if url in existing:
+                    continue
+
+                pub = news_data.get('published_at')
+                if pub and pub.tzinfo is None:
+                    pub = pub.replace(tzinfo=KST)
+
+                rows.append({
+                    'title': news_data['title'],
+                    'url': url,
+                    'source': news_data.get('source'),
+                    'published_at': pub,
+                    'related_coins': news_data.get('related_coins'),
+                    'timestamp': datetime.now(KST)
+                })
+
+            inserted = []
+            if rows:
+                # 조회와 저장 사이에 다른 작업이 같은 URL을 넣었을 경우를 대비해 충돌은 무시
+                # RETURNING은 실제로 들어간 행만 돌려주므로 충돌로 건너뛴 행은 저장 개수에서 빠짐
+                inserted = self.session.execute(
+                    self._dialect_insert(News)
+                    .on_conflict_do_nothing(index_elements=['url'])
+                    .returning(News.url, News.id),
+                    rows
+                ).all()
+                self._link_news_coins(rows, inserted)
+            self.session.commit()
+
+            saved = len(inserted)
+            return saved, len(news_list) - saved
+        except Exception as e:
+            print(f"뉴스 일괄 저장 오류: {e}")
+            self.session.rollback()
+            return None
+
+    def _link_news_coins(self, rows, inserted):
+        """
+        저장한 뉴스들의 관련 코인을 news_coins에 기록합니다. (commit은 호출한 쪽에서)
+
+        Args:
+            rows (list): INSERT에 넘긴 뉴스 행 딕셔너리 리스트
+            inserted (list): INSERT ... RETURNING으로 받은 (url, id) - 실제로 저장된 행만
+        """
+        coins_by_url = {row['url']: row for row in rows if row.get('related_coins')}
+        links = [
+            {'news_id': news_id, 'symbol': symbol, 'published_at': coins_by_url[url]['published_at']}
+            for url, news_id in inserted if url in coins_by_url
+            for symbol in _split_coins(coins_by_url[url]['related_coins'])
+        ]
+        if links:
+            self.session.execute(
+                self._dialect_insert(NewsCoin).on_conflict_do_nothing(index_elements=['news_id', 'symbol']),
+                links
+            )
+
+    def _dialect_insert(self, model):
+        """데이터베이스 종류에 맞는 INSERT 구문 (ON CONFLICT DO NOTHING/UPDATE 지원)"""
+        if self.db_url.startswith('postgresql'):
+            return postgresql_insert(model)
+        return sqlite_insert(model)
+
     def get_recent_news(self, limit=20, source=None):
         """
         최근 뉴스를 조회합니다.
@@ -212,6 +1213,7 @@ class Database:
     def get_news_by_coin(self, coin_symbol, limit=20):
         """
         특정 코인과 관련된 뉴스를 조회합니다.
+        news_coins의 (symbol, published_at) 인덱스로 범위 조회합니다.
 
         Args:
             coin_symbol (str): 코인 심볼 (예: BTC, ETH)
@@ -221,14 +1223,117 @@ class Database:
             list: News 객체 리스트
         """
         return self.session.query(News)\
-            .filter(News.related_coins.like(f'%{coin_symbol}%'))\
-            .order_by(News.published_at.desc())\
+            .join(NewsCoin, NewsCoin.news_id == News.id)\
+            .filter(NewsCoin.symbol == coin_symbol.upper())\
+            .order_by(NewsCoin.published_at.desc(), NewsCoin.news_id.desc())\
             .limit(limit)\
             .all()
 
+    def get_feed_states(self):
+        """
+        저장된 RSS 피드 조건부 요청 상태를 조회합니다.
+
+        Returns:
+            dict: {url: {'etag': str, 'last_modified': str, 'item_limit': int}}
+        """
+        return {
+            state.url: {'etag': state.etag, 'last_modified': state.last_modified, 'item_limit': state.item_limit}
+            for state in self.session.query(FeedState).all()
+        }
+
+    def save_feed_states(self, states):
+        """
+        RSS 피드 조건부 요청 상태를 저장합니다. (같은 URL은 덮어씀)
+
+        Args:
+            states (dict): {url: {'etag': str, 'last_modified': str, 'item_limit': int}}
+
+        Returns:
+            bool: 성공 여부
+        """
+        if not states:
+            return True
+        try:
+            now = datetime.now(KST)
+            stmt = self._dialect_insert(FeedState)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['url'],
+                set_={
+                    'etag': stmt.excluded.etag,
+                    'last_modified': stmt.excluded.last_modified,
+                    'item_limit': stmt.excluded.item_limit,
+                    'updated_at': stmt.excluded.updated_at
+                }
+            )
+            self.session.execute(stmt, [{
+                'url': url,
+                'etag': state.get('etag'),
+                'last_modified': state.get('last_modified'),
+                'item_limit': state.get('item_limit'),
+                'updated_at': now
+            } for url, state in states.items()])
+            self.session.commit()
+            return True
+        except Exception as e:
+            print(f"피드 상태 저장 오류: {e}")
+            self.session.rollback()
+            return False
+
+    def search_news(self, query, limit=20, cursor=None):
+        """
+        뉴스 제목을 전문 검색합니다. 관련도 순으로 정렬하며 키셋 페이지네이션을 지원합니다.
+
+        Args:
+            query (str): 검색어 (공백으로 구분한 단어를 모두 포함, 각 단어는 접두어 일치)
+            limit (int): 조회할 뉴스 개수
+            cursor (tuple): (score, id) 커서 - 이 결과 다음부터 조회
+
+        Returns:
+            list: (News, score) 튜플 리스트 (관련도 높은 순)
+        """
+        tokens = SEARCH_TOKEN_PATTERN.findall(query)
+        if not tokens:
+            return []
+
+        if not self.news_search:
+            matched = select(News.id.label('id'), literal(0.0, Float).label('score'))
+            for token in tokens:
+                matched = matched.where(News.title.ilike(f'%{token}%'))
+            ranked = matched.subquery()
+        elif self.db_url.startswith('postgresql'):
+            tsquery = ' & '.join(f"{token}:*" for token in tokens)
+            ranked = text(
+                "SELECT id, ts_rank(to_tsvector('simple', title), q)::float8 AS score "
+                "FROM news, to_tsquery('simple', :q) AS q "
+                "WHERE to_tsvector('simple', title) @@ q"
+            ).bindparams(q=tsquery).columns(id=Integer, score=Float).subquery()
+        else:
+            # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 score로 사용
+            match = ' '.join('"{}"*'.format(token.replace('"', '')) for token in tokens)
+            ranked = text(
+                "SELECT rowid AS id, -bm25(news_fts) AS score FROM news_fts WHERE news_fts MATCH :q"
+            ).bindparams(q=match).columns(id=Integer, score=Float).subquery()
+
+        id_col, score_col = list(ranked.c)
+        page = select(id_col, score_col)
+        if cursor is not None:
+            score, news_id = cursor
+            page = page.where(or_(score_col < score, and_(score_col == score, id_col < news_id)))
+        page = page.order_by(score_col.desc(), id_col.desc()).limit(limit)
+
+        hits = self.session.execute(page).all()
+        if not hits:
+            return []
+        news_by_id = {
+            news.id: news for news in
+            self.session.query(News).filter(News.id.in_([news_id for news_id, _ in hits])).all()
+        }
+        return [(news_by_id[news_id], score) for news_id, score in hits if news_id in news_by_id]
+
     def close(self):
         """데이터베이스 연결을 종료합니다."""
-        self.session.close()
+        self.Session.remove()
+        self.engine.dispose()
 
 
 # 테스트 코드
@@ -0,0 +1,108 @@
+"""
+통계 엔진
+/api/stats에 필요한 심볼별 행 수, 처음/마지막 저장 시각, 테이블 크기를
+심볼 레지스트리(symbols 테이블)와 집계 쿼리 몇 번으로 계산하고 메모리에 보관합니다.
+시세가 저장될 때는 집계를 다시 하지 않고 메모리 값만 증분 갱신합니다.
+"""
+import threading
+import time
+from datetime import timedelta, timezone
+
+KST = timezone(timedelta(hours=9))
+
+
+def _aware(dt):
+    """SQLite는 시간대 없이 KST 시각을 돌려주므로 KST를 붙여 비교 가능하게 맞춤"""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=KST)
+    return dt
+
+
+class StatsEngine:
+    """집계 기반 통계 캐시"""
+
+    def __init__(self, db, ttl_seconds=600):
+        """
+        Args:
+            db (Database): 데이터베이스
+            ttl_seconds (int): 전체 재집계 주기 (증분 갱신이 어긋나는 것을 보정)
+        """
+        self.db = db
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._per_symbol = None    # {symbol: {'count', 'first', 'last'}}
+        self._news_count = 0
+        self._table_sizes = {}
+        self._loaded_at = 0
+
+        db.add_price_listener(self.record_prices)
+
+    def _reload(self):
+        """DB에서 전체 통계를 다시 집계합니다. (락을 잡은 상태에서 호출)"""
+        per_symbol = {}
+        for symbol, count, first, last in self.db.get_symbol_stats():
+            per_symbol[symbol] = {'count': count, 'first': _aware(first), 'last': _aware(last)}
+
+        self._per_symbol = per_symbol
+        self._news_count = self.db.get_news_count()
+        self._table_sizes = self.db.get_table_sizes()
+        self._loaded_at = time.monotonic()
+
+    def record_prices(self, symbols, timestamp):
+        """
+        시세 저장 리스너 - 메모리 통계를 증분 갱신합니다.
+
+        Args:
+            symbols (list): 저장된 심볼 리스트 (행마다 하나)
+            timestamp (datetime): 저장 시각
+        """
+        timestamp = _aware(timestamp)
+        with self._lock:
+            if self._per_symbol is None:
+                return  # 아직 집계 전이면 다음 조회 때 한 번에 집계
+            for symbol in symbols:
+                entry = self._per_symbol.get(symbol)
+                if entry is None:
+                    self._per_symbol[symbol] = {'count': 1, 'first': timestamp, 'last': timestamp}
+                else:
+                    entry['count'] += 1
+                    entry['last'] = timestamp
+
+    def invalidate(self):
+        """다음 조회 때 전체를 다시 집계하도록 합니다. (보존 정책으로 행이 삭제된 뒤 등)"""
+        with self._lock:
+            self._per_symbol = None
+
+    def get(self):
+        """
+        통계를 반환합니다.
+
+        Returns:
+            dict: 전체/심볼별 통계
+        """
+        with self._lock:
+            if self._per_symbol is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+                self._reload()
+
+            per_symbol = {
+                symbol: {
+                    'count': entry['count'],
+                    'first': entry['first'].isoformat() if entry['first'] else None,
+                    'last': entry['last'].isoformat() if entry['last'] else None
+                }
+                for symbol, entry in sorted(self._per_symbol.items())
+            }
+            firsts = [e['first'] for e in self._per_symbol.values() if e['first']]
+            lasts = [e['last'] for e in self._per_symbol.values() if e['last']]
+
+            return {
+                'total_symbols': len(per_symbol),
+                'symbols': list(per_symbol),
+                'total_records': sum(entry['count'] for entry in per_symbol.values()),
+                'first_timestamp': min(firsts).isoformat() if firsts else None,
+                'last_timestamp': max(lasts).isoformat() if lasts else None,
+                'per_symbol': per_symbol,
+                'news_count': self._news_count,
+                'table_sizes': self._table_sizes,
+                'aggregated_seconds_ago': int(time.monotonic() - self._loaded_at)
+            }
@@ -0,0 +1,152 @@
+"""
+실시간 스트림 재연결/resync 테스트
+
+binance_stream_standin.py를 STANDIN_DROP_AFTER로 띄워 몇 초마다 연결이 끊기게 하고,
+BinanceStream이 다시 연결할 때마다 REST resync를 하는지, 스트림 변경분이 스냅샷에 반영되는지 확인합니다.
+느린 리스너 때문에 밀린 스냅샷이 최신 것 하나로 합쳐지는지, 페이지 캐시/인덱스가 이전 버전을 무시하는지도 확인합니다.
+
+사용법:
+    python test_binance_stream.py
+    python -m pytest test_binance_stream.py
+(websockets가 없으면 스트림 테스트는 건너뜀)
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+# 현재 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api.ticker_index import TickerIndexer
+from api.ticker_pages import TickerPageCache
+from collectors.binance_stream import BinanceStream
+from collectors.ticker_snapshot import TickerSnapshot, TickerSnapshotService
+
+STANDIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "binance_stream_standin.py")
+
+
+class FakeCollector:
+    """resync(REST 전체 조회)를 세는 수집기 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_multiple_tickers(self, symbols=None):
+        self.calls += 1
+        return [_ticker("BTCUSDT", 65000.0)]
+
+
+def _ticker(symbol, price):
+    return {
+        "symbol": symbol, "current_price": price, "volume": 1.0,
+        "price_change_percent": 0.0, "timestamp": "2024-01-01 00:00:00"
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("localhost", port), timeout=0.5).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def _wait_until(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def test_reconnect_and_resync():
+    # websockets가 없으면 통과가 아니라 건너뜀(skip)으로 보고
+    pytest.importorskip("websockets")
+
+    port = _free_port()
+    env = dict(os.environ, STANDIN_PORT=str(port), STANDIN_DROP_AFTER="2")
+    server = subprocess.Popen(
+        [sys.executable, STANDIN], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    collector = FakeCollector()
+    service = TickerSnapshotService(collector)
+    stream = BinanceStream(service, urls=[f"ws://localhost:{port}"], idle_timeout=5.0, max_backoff=1.0)
+    try:
+        assert _wait_for_port(port), "대역 서버가 뜨지 않음"
+        assert stream.start()
+
+        # 2초마다 끊기므로 두 번 이상 다시 연결하고, 연결마다 resync
+        assert _wait_until(lambda: stream.reconnects >= 2 and stream.resyncs >= 3, timeout=20.0), stream.stats()
+        assert collector.calls == stream.resyncs
+        assert stream.ticker_updates > 0
+
+        # resync 말고도 스트림 변경분으로 새 스냅샷이 만들어짐
+        assert service.get().version > stream.resyncs
+    finally:
+        stream.stop()
+        server.terminate()
+        server.wait(5)
+
+    print(f"✅ 재연결 {stream.reconnects}회, resync {stream.resyncs}회, 스트림 갱신 {stream.ticker_updates}회")
+
+
+def test_listener_coalescing():
+    service = TickerSnapshotService(FakeCollector())
+    versions = []
+
+    def slow_listener(snapshot):
+        versions.append(snapshot.version)
+        time.sleep(0.2)
+
+    service.add_listener(slow_listener)
+    service.refresh()
+    for i in range(20):
+        service.apply_updates([_ticker("BTCUSDT", 65000.0 + i)])
+
+    # 호출한 쪽은 리스너를 기다리지 않고, 밀린 스냅샷은 최신 것 하나로 합쳐짐
+    latest = service.get().version
+    done = lambda: versions and versions[-1] == latest and service.notified == len(versions)
+    assert _wait_until(done, timeout=5.0), versions
+    assert versions == sorted(versions)
+    assert service.coalesced > 0
+    assert len(versions) < latest
+
+    print(f"✅ 스냅샷 {latest}개 중 리스너 {service.notified}회 실행 (건너뜀 {service.coalesced}회)")
+
+
+def test_listeners_ignore_older_versions():
+    new = TickerSnapshot(2, (_ticker("BTCUSDT", 2.0),), None)
+    old = TickerSnapshot(1, (_ticker("BTCUSDT", 1.0),), None)
+
+    page_cache = TickerPageCache(page_sizes=(20,))
+    page_cache.build(new)
+    page_cache.build(old)
+    assert page_cache.version == 2
+    assert b'"current_price":2.0' in page_cache.get(1, 20).raw
+
+    indexer = TickerIndexer()
+    indexer.build(new)
+    indexer.build(old)
+    assert indexer.get(new) is indexer._index
+
+    print("✅ 이전 버전 스냅샷 무시")
+
+
+if __name__ == "__main__":
+    test_reconnect_and_resync()
+    test_listener_coalescing()
+    test_listeners_ignore_older_versions()
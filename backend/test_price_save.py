@@ -0,0 +1,93 @@
+"""
+가격 저장 테스트
+
+Binance 티커 갱신이 실패해서 이전 스냅샷이 남아 있을 때 자동 저장(auto_save_prices)과
+/api/save-current-data가 오래된 시세를 지금 시각으로 저장하지 않는지 확인합니다.
+Binance 요청은 모두 연결 오류로 대신하고, DB는 임시 SQLite 파일을 씁니다.
+
+사용법:
+    python test_price_save.py
+    python -m pytest test_price_save.py
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# 현재 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test_price_save.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["BINANCE_STREAM_ENABLED"] = "False"
+
+import requests
+
+
+def _offline_get(self, url, *args, **kwargs):
+    raise requests.exceptions.ConnectionError(f"offline: {url}")
+
+
+requests.Session.get = _offline_get
+
+import app as server
+from collectors.ticker_snapshot import TickerSnapshot
+from database.models import CoinPrice
+
+server.scheduler.pause()  # 백그라운드 작업이 테스트 중에 끼어들지 않게
+
+TICKERS = (
+    {"symbol": "BTCUSDT", "current_price": 65000.0, "volume": 1.0,
+     "price_change_percent": 0.0, "timestamp": "2024-01-01 00:00:00"},
+)
+
+
+def _saved_rows():
+    count = server.db.session.query(CoinPrice).count()
+    server.db.remove_session()
+    return count
+
+
+def _set_snapshot(age_seconds):
+    """age_seconds초 전에 가져온 것처럼 스냅샷을 바꿔 둠"""
+    server.ticker_service._snapshot = TickerSnapshot(
+        1, TICKERS, datetime.now() - timedelta(seconds=age_seconds)
+    )
+
+
+def test_nothing_saved_before_first_snapshot():
+    server.ticker_service._snapshot = TickerSnapshot(0, (), None)
+    server.auto_save_prices()
+    assert _saved_rows() == 0
+
+    response = server.app.test_client().get('/api/save-current-data')
+    assert response.status_code == 503
+    assert _saved_rows() == 0
+
+
+def test_nothing_saved_after_failed_refresh():
+    # 한 시간 전 스냅샷만 남은 상태에서 갱신 실패 → 이전 스냅샷 유지
+    _set_snapshot(3600)
+    server.refresh_ticker_snapshot()
+    assert server.ticker_service.get().version == 1
+
+    server.auto_save_prices()
+    assert _saved_rows() == 0
+
+    response = server.app.test_client().get('/api/save-current-data')
+    assert response.status_code == 503
+    assert _saved_rows() == 0
+
+    print("✅ 갱신 실패 시 가격 저장 건너뜀")
+
+
+def test_fresh_snapshot_is_saved():
+    _set_snapshot(1)
+    server.auto_save_prices()
+    assert _saved_rows() == len(TICKERS)
+
+
+if __name__ == "__main__":
+    test_nothing_saved_before_first_snapshot()
+    test_nothing_saved_after_failed_refresh()
+    test_fresh_snapshot_is_saved()
@@ -2,6 +2,7 @@ import { useState, useEffect, useCallback } from 'react';
 import "bootstrap/dist/css/bootstrap.min.css";
 import './App.css';
 import { API_URL } from './config';
+import { subscribePrices, mergePrices } from './priceStream';
 
 // 컴포넌트 불러오기
 import Navbar from './Components/Navbar';
@@ -58,14 +59,30 @@ function App() {
   }, [loadPrices]);
 
   // -----------------------------
-  // 자동 새로고침
+  // 자동 새로고침 (실시간 푸시로 바뀐 코인만 반영, 안 되면 10초 폴링)
   // -----------------------------
+  const pageSymbols = tableCoins.map(c => c.symbol).join(',');
+
   useEffect(() => {
-    if (autoRefresh) {
-      const interval = setInterval(loadPrices, 10000);
-      return () => clearInterval(interval);
-    }
-  }, [autoRefresh, loadPrices]);
+    if (!autoRefresh) return;
+
+    let interval = null;
+    const unsubscribe = subscribePrices(
+      pageSymbols ? pageSymbols.split(',') : [],
+      (updates) => {
+        setTableCoins(prev => mergePrices(prev, updates));
+        setOverviewCoins(prev => mergePrices(prev, updates));
+        setLastUpdate(updates[updates.length - 1].timestamp);
+      },
+      () => {
+        if (!interval) interval = setInterval(() => loadPrices(page), 10000);
+      }
+    );
+    return () => {
+      unsubscribe();
+      if (interval) clearInterval(interval);
+    };
+  }, [autoRefresh, pageSymbols, page, loadPrices]);
 
   // -----------------------------
   // 공포·탐욕 지수 데이터
@@ -2,10 +2,15 @@ import React, { useEffect, useRef, useState } from 'react';
 import { createChart } from 'lightweight-charts';
 import '../styles/CoinChartModal.css';
 import { API_URL } from '../config';
+import { subscribePrices } from '../priceStream';
 
 // 차트 데이터 캐시
 const chartDataCache = {};
 
+// 캔들 간격별 길이 (초)
+const INTERVAL_SECONDS = { '15m': 900, '1h': 3600, '4h': 14400, '1d': 86400 };
+const KST_OFFSET = 9 * 60 * 60;
+
 // 이동평균선 계산 함수
 const calculateMA = (data, period) => {
   const result = [];
@@ -38,6 +43,8 @@ const CoinChartModal = ({ symbol, onClose, autoRefresh }) => {
   const [refreshTrigger, setRefreshTrigger] = useState(0);
   const [showMA, setShowMA] = useState({ ma7: true, ma25: true, ma99: true });
   const abortControllerRef = useRef(null);
+  const lastCandleRef = useRef(null);
+  const [streaming, setStreaming] = useState(false);
 
   useEffect(() => {
     if (!symbol) return;
@@ -126,7 +133,7 @@ const CoinChartModal = ({ symbol, onClose, autoRefresh }) => {
 
       // 데이터 변환 (UTC를 한국 시간으로 변환: UTC+9)
       const formattedData = klineData.map(c => ({
-        time: Math.floor(c.time / 1000) + (9 * 60 * 60), // UTC+9 (한국 시간)
+        time: Math.floor(c.time / 1000) + KST_OFFSET, // UTC+9 (한국 시간)
         open: c.open,
         high: c.high,
         low: c.low,
@@ -138,6 +145,7 @@ const CoinChartModal = ({ symbol, onClose, autoRefresh }) => {
       if (seriesRef.current) {
         seriesRef.current.setData(formattedData);
       }
+      lastCandleRef.current = formattedData.length ? formattedData[formattedData.length - 1] : null;
 
       // 거래량 데이터 설정
       if (volumeSeriesRef.current) {
@@ -201,8 +209,8 @@ const CoinChartModal = ({ symbol, onClose, autoRefresh }) => {
 
         if (!data.success) throw new Error(data.error || 'Failed to load chart data');
 
-        // 현재 코인 가격 정보도 요청
-        const priceRes = await fetch(`${API_URL}/api/current-prices?page=1&limit=1000`);
+        // 현재 코인 가격 정보도 요청 (서버에서 심볼로 검색)
+        const priceRes = await fetch(`${API_URL}/api/current-prices?q=${symbol}&limit=5`);
         const priceData = await priceRes.json();
         const coin = priceData.data.find(c => c.symbol === symbol);
         setCoinData(coin);
@@ -241,7 +249,43 @@ const CoinChartModal = ({ symbol, onClose, autoRefresh }) => {
     };
   }, [symbol, timeframe, refreshTrigger, showMA]);
 
-  // 자동 업데이트
+  // 실시간 시세 (푸시로 현재가와 마지막 캔들만 갱신)
+  useEffect(() => {
+    if (!autoRefresh || !symbol) return;
+    const unsubscribe = subscribePrices(
+      [symbol],
+      (updates) => {
+        const update = updates.find(u => u.symbol === symbol);
+        if (!update) return;
+        setStreaming(true);
+        setCoinData(prev => ({ ...prev, ...update }));
+
+        const last = lastCandleRef.current;
+        if (last && seriesRef.current) {
+          const price = update.current_price;
+          const interval = INTERVAL_SECONDS[timeframe];
+          const now = Math.floor(Date.now() / 1000) + KST_OFFSET;
+          let next;
+          if (interval && now >= last.time + interval) {
+            // 간격이 넘어갔으면 이전 캔들은 두고 새 캔들을 시작
+            const time = last.time + Math.floor((now - last.time) / interval) * interval;
+            next = { time, open: price, high: price, low: price, close: price, value: 0 };
+          } else {
+            next = { ...last, close: price, high: Math.max(last.high, price), low: Math.min(last.low, price) };
+          }
+          seriesRef.current.update(next);
+          lastCandleRef.current = next;
+        }
+      },
+      () => setStreaming(false)
+    );
+    return () => {
+      unsubscribe();
+      setStreaming(false);
+    };
+  }, [autoRefresh, symbol, timeframe]);
+
+  // 자동 업데이트 (푸시를 받는 중에는 새 캔들만 챙기면 되므로 1분마다)
   useEffect(() => {
     if (!autoRefresh || !symbol) return;
     const intervalId = window.setInterval(() => {
@@ -249,9 +293,9 @@ const CoinChartModal = ({ symbol, onClose, autoRefresh }) => {
       const cacheKey = `${symbol}_${timeframe}`;
       delete chartDataCache[cacheKey];
       setRefreshTrigger(prev => prev + 1);
-    }, 10000);
+    }, streaming ? 60000 : 10000);
     return () => window.clearInterval(intervalId);
-  }, [autoRefresh, symbol, timeframe]);
+  }, [autoRefresh, symbol, timeframe, streaming]);
 
   // ESC로 닫기
   useEffect(() => {
@@ -0,0 +1,91 @@
+import { API_URL } from './config';
+
+// 실시간 시세 구독 (/api/stream/prices, Server-Sent Events)
+// 탭 하나에서 EventSource는 하나만 열고(서버 동시 연결 수 상한 절약),
+// 구독자들이 원하는 심볼의 합집합으로 구독한 뒤 각 구독자에게 자기 심볼만 나눠 줌
+const listeners = new Set(); // { symbols: Set | null(전체), onPrices, onFallback }
+let source = null;
+let sourceQuery = null;      // 지금 열린 연결의 쿼리 (합집합이 바뀌면 다시 연결)
+let syncScheduled = false;
+
+// 구독자들의 심볼 합집합 쿼리 (한 명이라도 전체를 원하면 전체)
+function unionQuery() {
+  const union = new Set();
+  for (const listener of listeners) {
+    if (!listener.symbols) return '';
+    listener.symbols.forEach(s => union.add(s));
+  }
+  return `?symbols=${[...union].sort().join(',')}`;
+}
+
+function dispatch(isSnapshot) {
+  return (event) => {
+    const payload = JSON.parse(event.data);
+    for (const listener of listeners) {
+      const coins = listener.symbols
+        ? payload.data.filter(c => listener.symbols.has(c.symbol))
+        : payload.data;
+      if (coins.length) listener.onPrices(coins, isSnapshot);
+    }
+  };
+}
+
+function openSource(query) {
+  const opened = new EventSource(`${API_URL}/api/stream/prices${query}`);
+  opened.addEventListener('snapshot', dispatch(true));
+  opened.addEventListener('prices', dispatch(false));
+
+  // 일시적인 끊김은 EventSource가 알아서 다시 연결 (CONNECTING)
+  // CLOSED면 서버가 거절한 것이므로 모든 구독자를 폴링으로 전환 (구독이 바뀌면 다시 시도)
+  opened.onerror = () => {
+    if (opened.readyState !== EventSource.CLOSED || opened !== source) return;
+    source = null;
+    sourceQuery = null;
+    [...listeners].forEach(listener => listener.onFallback());
+  };
+  return opened;
+}
+
+// 구독 변경을 모아서 한 번만 반영 (같은 렌더에서 해제 → 구독이 이어질 때 연결을 두 번 열지 않도록)
+function scheduleSync() {
+  if (syncScheduled) return;
+  syncScheduled = true;
+  Promise.resolve().then(() => {
+    syncScheduled = false;
+    const query = listeners.size ? unionQuery() : null;
+    if (query === sourceQuery) return;
+    if (source) source.close();
+    source = query === null ? null : openSource(query);
+    sourceQuery = query;
+  });
+}
+
+// - onPrices(coins, isSnapshot): 연결 직후에는 구독한 코인 전체, 이후에는 바뀐 코인만 전달
+//   (다른 구독 때문에 다시 연결되면 snapshot이 한 번 더 올 수 있음)
+// - onFallback(): EventSource를 쓸 수 없거나 서버가 연결을 거절하면(503 등) 호출 → 폴링으로 대체
+// 반환값: 구독 해제 함수
+export function subscribePrices(symbols, onPrices, onFallback) {
+  if (typeof EventSource === 'undefined') {
+    onFallback();
+    return () => {};
+  }
+
+  const listener = {
+    symbols: symbols && symbols.length ? new Set(symbols) : null,
+    onPrices,
+    onFallback
+  };
+  listeners.add(listener);
+  scheduleSync();
+
+  return () => {
+    listeners.delete(listener);
+    scheduleSync();
+  };
+}
+
+// 바뀐 코인만 기존 목록에 반영 (목록에 없는 코인은 무시)
+export function mergePrices(coins, updates) {
+  const bySymbol = new Map(updates.map(u => [u.symbol, u]));
+  return coins.map(c => (bySymbol.has(c.symbol) ? { ...c, ...bySymbol.get(c.symbol) } : c));
+}